@@ -1,15 +1,12 @@
 import os
-import sys
-import time
 import logging
-import threading
 from src.utils.data_loader import DataLoader
-from src.utils.visualizer import visualize_room_occupancy, plot_metrics
+from src.utils.schedule_loader import read_schedule_rows, build_warm_start_genes
 from src.algorithms.genetic_algorithm import GeneticAlgorithm
-from src.utils.export_to_excel import export_to_excel, export_summary_statistics
-
-# Global flag to control the animation thread
-stop_animation = False
+from src.algorithms.nsga2 import NSGA2
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.algorithms.solver import Budget
+from src.utils.progress import TerminalProgressReporter
 
 
 def setup_logging():
@@ -26,83 +23,128 @@ def setup_logging():
     )
 
 
-def animated_loading():
-    global stop_animation
-    animation_width = 28
-    animation_chars = ["■", "□", "▢", "▣", "▤", "▥", "▦", "▧", "▨", "▩", "▪", "▫"]
-    while not stop_animation:
-        for i in range(animation_width):
-            bar = "".join(animation_chars[i % len(animation_chars)] * (i + 1))
-            sys.stdout.write("\033[K\r" + f"[{bar}]")
-            sys.stdout.flush()
-            time.sleep(0.2)
-
-
-def clear_loading_line():
-    sys.stdout.write("\r\033[K" + " " * 50 + "\r\033[K")
-    sys.stdout.flush()
-
-
 def main():
-    global stop_animation
     setup_logging()
     logging.info("Application Started")
 
+    dataset = (
+        input(
+            "Data set, Simulated_Data.xlsx or CPP_Real_World_Data.xlsx [simulated]: "
+        ).strip()
+        or "Simulated_Data.xlsx"
+    )
     pop_size = int(input("Enter the population size: "))
     gen_size = int(input("Enter the generation size: "))
+    mode = (
+        input("Optimization mode, weighted or pareto [weighted]: ").strip().lower()
+        or "weighted"
+    )
+    if mode not in ("weighted", "pareto"):
+        raise ValueError(f"Unknown optimization mode: {mode}")
+    engine = input("Solver engine, ga or sa [ga]: ").strip().lower() or "ga"
+    if engine not in ("ga", "sa") or (engine == "sa" and mode == "pareto"):
+        raise ValueError(f"Unsupported solver engine for {mode} mode: {engine}")
+    previous_schedule = input(
+        "Previous schedule or checkpoint to warm-start from (blank for none): "
+    ).strip()
 
     # Static omega values for the Tricriteria model
     omega1 = 0.3  # Weight for day-of-week balance
     omega2 = 0.3  # Weight for teaching load balance
     omega3 = 0.4  # Weight for teacher satisfaction
 
-    t = threading.Thread(target=animated_loading)
-    t.start()
-
-    data_loader = DataLoader("Simulated_Data.xlsx")
-    course_sections_df = data_loader.load_sheet("(I) Simulated Course Sections")
-    classrooms_df = data_loader.load_sheet("(J) Classrooms")
-    time_slots_df = data_loader.load_sheet("(K) Time Slots")
-    teacher_preferences_df = data_loader.load_sheet("Teacher Preference")
-    teacher_satisfaction_df = data_loader.load_sheet("Teacher Satisfaction")
-
-    course_sections = course_sections_df.to_dict("records")
-    classrooms = classrooms_df.to_dict("records")
-    time_slots = time_slots_df.to_dict("records")
-    teacher_preferences = teacher_preferences_df.set_index("Teacher ID").T.to_dict()
-    teacher_satisfaction = teacher_satisfaction_df.set_index("Teacher ID").T.to_dict()
+    data_loader = DataLoader(dataset)
+    instance = data_loader.load_columnar_instance().to_solver_instance()
 
     time_slot_details = {
-        slot["Time Slot ID"]: slot["Description"] for slot in time_slots
+        slot["Time Slot ID"]: slot["Description"] for slot in instance["time_slots"]
     }
 
-    ga = GeneticAlgorithm(
-        course_sections,
-        classrooms,
-        time_slots,
-        teacher_preferences,
-        teacher_satisfaction,
-        population_size=pop_size,
-        omega1=omega1,
-        omega2=omega2,
-        omega3=omega3,
+    # A warm start seeds the population with the published schedule, mutates
+    # the changed sections first and penalizes moving the other sections.
+    warm_start = {}
+    if previous_schedule:
+        seed_genes, changed_indices = build_warm_start_genes(
+            read_schedule_rows(previous_schedule),
+            instance["course_sections"],
+            instance["classrooms"],
+            instance["time_slots"],
+            instance["teacher_preferences"],
+        )
+        warm_start = {
+            "seed_genes": seed_genes,
+            "focus_indices": changed_indices,
+            "churn_penalty": 1.0,
+        }
+
+    if engine == "sa":
+        # Annealing steps touch one gene, so it gets as many steps as the GA
+        # would spend evaluating genes over all its generations.
+        solver = SimulatedAnnealing(
+            **instance, omega1=omega1, omega2=omega2, omega3=omega3, **warm_start
+        )
+        budget = Budget(
+            max_evaluations=pop_size * gen_size * len(instance["course_sections"])
+        )
+    else:
+        # The Pareto mode evolves the trade-off front over all three criteria
+        # in one run; the omegas then only order the exported alternatives.
+        algorithm_class = NSGA2 if mode == "pareto" else GeneticAlgorithm
+        solver = algorithm_class(
+            **instance,
+            population_size=pop_size,
+            omega1=omega1,
+            omega2=omega2,
+            omega3=omega3,
+            **warm_start,
+        )
+        budget = Budget(generations=gen_size)
+
+    # Progress is drawn on one terminal line and cleared before exporting
+    reporter = TerminalProgressReporter()
+    result = solver.solve(budget, observers=[reporter])
+    reporter.close()
+
+    # The exporters pull in pandas and openpyxl, so they are only imported
+    # once there is a schedule to write
+    from src.utils.export_to_excel import (
+        export_to_excel,
+        export_summary_statistics,
+        export_pareto_front,
+        export_checkpoint,
+        export_top_schedules,
     )
 
-    generation_statistics = ga.run(generations=gen_size)
-
-    stop_animation = True
-    t.join()
-    clear_loading_line()
-
-    best_chromosome = ga.population[0]
+    best_chromosome = result.best
     final_schedule_file = "data/final_schedule.xlsx"
     export_to_excel(best_chromosome, time_slot_details, final_schedule_file)
-
-    export_summary_statistics(generation_statistics, "data/summary_statistics.xlsx")
-    logging.info("Summary statistics exported to data/summary_statistics.xlsx")
-
-    plot_metrics("data/summary_statistics.xlsx")
-    logging.info("Generated plots for genetic algorithm metrics.")
+    export_checkpoint(best_chromosome, "data/final_schedule.json")
+
+    if mode == "pareto":
+        export_pareto_front(
+            solver.pareto_front(), time_slot_details, "data/pareto_front.xlsx"
+        )
+        logging.info("Pareto front exported to data/pareto_front.xlsx")
+
+    # matplotlib is only imported once the run is done, so the solver starts
+    # without paying for the plotting stack
+    from src.utils.visualizer import visualize_room_occupancy, plot_metrics
+
+    # The summary statistics and their plots are per GA generation
+    if engine == "ga":
+        # Distinct runner-up schedules give administrators alternatives
+        alternatives = solver.best_distinct(5)
+        export_top_schedules(
+            alternatives,
+            time_slot_details,
+            ["data/top_schedules.xlsx", "data/top_schedules.json"],
+        )
+
+        export_summary_statistics(result.statistics, "data/summary_statistics.xlsx")
+        logging.info("Summary statistics exported to data/summary_statistics.xlsx")
+
+        plot_metrics("data/summary_statistics.xlsx")
+        logging.info("Generated plots for genetic algorithm metrics.")
 
     visualize_room_occupancy("data/final_schedule.xlsx")
     logging.info("A visualized schedule was exported to docs/Room_Schedule.pdf")
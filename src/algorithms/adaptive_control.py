@@ -0,0 +1,101 @@
+import random
+import logging
+
+
+class AdaptiveOperatorController:
+    """
+    Adaptive operator selection by probability matching.
+
+    Each operator keeps a running estimate of the fitness improvement it
+    produces; selection probabilities are proportional to those estimates
+    with a floor so no operator is ever switched off completely. The
+    mutation probability is raised while population diversity is low.
+    """
+
+    MUTATION_OPERATORS = ("room_move", "slot_move", "teacher_move", "teacher_swap")
+    OPERATORS = MUTATION_OPERATORS + ("crossover",)
+
+    def __init__(
+        self,
+        base_mutation_probability=0.2,  # Mutation probability at full diversity
+        max_mutation_probability=0.6,  # Upper bound once diversity collapses
+        diversity_threshold=0.5,  # Unique-genome fraction considered "collapsed"
+        learning_rate=0.3,  # Weight of the latest reward in the quality estimate
+        min_probability=0.05,  # Floor on every operator's selection probability
+    ):
+        if min_probability * len(self.OPERATORS) >= 1:
+            raise ValueError("min_probability leaves no room for adaptation")
+        self.base_mutation_probability = base_mutation_probability
+        self.max_mutation_probability = max_mutation_probability
+        self.diversity_threshold = diversity_threshold
+        self.learning_rate = learning_rate
+        self.min_probability = min_probability
+
+        self.quality = {operator: 1.0 for operator in self.OPERATORS}
+        self.usage = {operator: 0 for operator in self.OPERATORS}
+        self.probabilities = {}
+        self.mutation_probability = base_mutation_probability
+        self.diversity = 1.0
+        self._update_probabilities()
+
+    def _update_probabilities(self):
+        total_quality = sum(self.quality.values())
+        adaptive_share = 1 - self.min_probability * len(self.OPERATORS)
+        for operator, quality in self.quality.items():
+            if total_quality > 0:
+                share = quality / total_quality
+            else:
+                share = 1 / len(self.OPERATORS)
+            self.probabilities[operator] = self.min_probability + adaptive_share * share
+
+    def _choose(self, operators):
+        weights = [self.probabilities[operator] for operator in operators]
+        return random.choices(operators, weights=weights, k=1)[0]
+
+    def select_operator(self):
+        """Choose how the next child is produced: crossover or a mutation move."""
+        return self._choose(self.OPERATORS)
+
+    def select_mutation_operator(self):
+        """Choose a mutation move for an existing chromosome."""
+        return self._choose(self.MUTATION_OPERATORS)
+
+    def record(self, operator, improvement):
+        """
+        Credit an operator with the fitness improvement it produced.
+
+        :param operator: Name of the operator that was applied.
+        :param improvement: Fitness gain over the reference (parent) fitness.
+        """
+        reward = max(0.0, improvement)
+        self.usage[operator] += 1
+        self.quality[operator] += self.learning_rate * (reward - self.quality[operator])
+        self._update_probabilities()
+
+    def update_diversity(self, population):
+        """
+        Recompute diversity as the fraction of unique genomes and adapt the
+        mutation probability accordingly.
+        """
+        unique_genomes = {chromosome.genome_key() for chromosome in population}
+        self.diversity = len(unique_genomes) / len(population)
+
+        if self.diversity < self.diversity_threshold:
+            collapse = 1 - self.diversity / self.diversity_threshold
+            self.mutation_probability = self.base_mutation_probability + collapse * (
+                self.max_mutation_probability - self.base_mutation_probability
+            )
+            logging.info(
+                f"Diversity collapsed to {self.diversity:.2f}; "
+                f"mutation probability raised to {self.mutation_probability:.2f}"
+            )
+        else:
+            self.mutation_probability = self.base_mutation_probability
+        return self.diversity
+
+    def snapshot(self):
+        return {
+            "mutation_probability": self.mutation_probability,
+            "diversity": self.diversity,
+            "operator_probabilities": dict(self.probabilities),
+        }
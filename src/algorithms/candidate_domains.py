@@ -0,0 +1,97 @@
+import logging
+from src.algorithms.genetic_algorithm import Chromosome
+
+# Teacher preferences CandidateDomains can enforce as hard constraints
+HARD_PREFERENCES = ("board", "time", "type")
+
+
+class CandidateDomains:
+    """
+    Reduced assignment domains computed once before a run.
+
+    A section may only go to teachers whose satisfaction rating for it is at
+    most max_rating (ratings run from 0, most preferred, to 5, least
+    preferred) and whose hard course type preference it meets; a
+    teacher's sections may only use rooms and time slots that meet the
+    teacher's hard board and time preferences. An empty domain falls back to
+    every candidate so that each section stays assignable.
+    """
+
+    def __init__(
+        self,
+        max_rating=4,  # Worst satisfaction rating a teacher may be given
+        hard_preferences=("board",),  # Subset of HARD_PREFERENCES to enforce
+    ):
+        unknown = set(hard_preferences) - set(HARD_PREFERENCES)
+        if unknown:
+            raise ValueError(f"Unknown hard preferences: {sorted(unknown)}")
+        self.max_rating = max_rating
+        self.hard_preferences = tuple(hard_preferences)
+        self._teachers = {}
+        self._rooms_and_slots = {}
+        self._allowed_keys = {}  # Teacher -> (room numbers, time slot IDs)
+
+    def bind(self, ga):
+        """
+        Compute the domains of the GA's instance. Called by GeneticAlgorithm
+        before the initial population is built.
+        """
+        teacher_ids = list(ga.teacher_preferences)
+        self._teachers = {}
+        for section in ga.course_sections:
+            section_id = section["Course Section ID"]
+            allowed = [
+                teacher_id
+                for teacher_id in teacher_ids
+                if ga.section_satisfaction[teacher_id][section_id] <= self.max_rating
+                and not (
+                    "type" in self.hard_preferences
+                    and Chromosome.course_violates_preferences(
+                        ga.teacher_preferences[teacher_id], section
+                    )
+                )
+            ]
+            if not allowed:
+                logging.warning(f"No teacher qualifies for section {section_id}.")
+            self._teachers[section_id] = allowed or teacher_ids
+
+        self._rooms_and_slots = {}
+        for teacher_id, preferences in ga.teacher_preferences.items():
+            rooms = [
+                room
+                for room in ga.classrooms
+                if "board" not in self.hard_preferences
+                or not Chromosome.room_violates_preferences(preferences, room)
+            ]
+            time_slots = [
+                time_slot
+                for time_slot in ga.time_slots
+                if "time" not in self.hard_preferences
+                or not Chromosome.time_slot_violates_preferences(preferences, time_slot)
+            ]
+            rooms, time_slots = rooms or ga.classrooms, time_slots or ga.time_slots
+            self._rooms_and_slots[teacher_id] = (rooms, time_slots)
+            self._allowed_keys[teacher_id] = (
+                {room["Room Number"] for room in rooms},
+                {time_slot["Time Slot ID"] for time_slot in time_slots},
+            )
+
+        mean_teachers = sum(map(len, self._teachers.values())) / len(self._teachers)
+        logging.info(
+            f"Candidate domains keep {mean_teachers:.1f} of {len(teacher_ids)} "
+            "teachers per section on average."
+        )
+
+    def teachers(self, section):
+        return self._teachers[section["Course Section ID"]]
+
+    def rooms_and_slots(self, teacher_id):
+        return self._rooms_and_slots[teacher_id]
+
+    def allows(self, teacher_id, room, time_slot):
+        # Whether the teacher's sections may use this room and time slot
+        room_numbers, time_slot_ids = self._allowed_keys[teacher_id]
+        return (
+            room["Room Number"] in room_numbers
+            and time_slot["Time Slot ID"] in time_slot_ids
+        )
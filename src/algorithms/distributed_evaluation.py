@@ -0,0 +1,277 @@
+import os
+import queue
+import socket
+import hashlib
+import secrets
+import ipaddress
+import logging
+import argparse
+import itertools
+import threading
+from multiprocessing.connection import Client, Listener
+from src.algorithms.parallel_evaluation import (
+    GenomeEncoder,
+    compile_instance,
+    evaluate_genomes,
+)
+
+# Shared secret of coordinator and workers; messages are pickles, so anyone
+# holding the key can run code on either side
+AUTHKEY_VARIABLE = "SCHEDULE_GA_AUTHKEY"
+
+
+def is_loopback(host):
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+
+def resolve_authkey(authkey, host):
+    """
+    Return the authkey to use, read from SCHEDULE_GA_AUTHKEY when not given.
+
+    A coordinator reachable only through loopback may fall back to a random
+    key, which local workers read from the evaluator; any other address needs
+    an explicit secret.
+    """
+    if authkey is None and os.environ.get(AUTHKEY_VARIABLE):
+        authkey = os.environ[AUTHKEY_VARIABLE].encode()
+    if authkey is None and is_loopback(host):
+        authkey = secrets.token_bytes(32)
+    if authkey is None:
+        raise ValueError(
+            f"Set {AUTHKEY_VARIABLE} or pass an authkey to listen on {host!r}"
+        )
+    return authkey
+
+
+def instance_fingerprint(instance):
+    # Content hash of a compiled instance; workers cache instances under it
+    digest = hashlib.sha256()
+    for name in sorted(instance):
+        digest.update(name.encode())
+        digest.update(instance[name].tobytes())
+    return digest.hexdigest()
+
+
+class _Task:
+    def __init__(self, batch_id, task_id, start, genomes):
+        self.batch_id = batch_id
+        self.task_id = task_id
+        self.start = start  # Row of the batch where this task's genomes begin
+        self.genomes = genomes
+
+
+class DistributedEvaluator:
+    """
+    Scores batches of chromosomes on worker processes that connect over TCP,
+    possibly from other machines.
+
+    The coordinator splits each batch of encoded genomes into tasks and hands
+    them to connected workers one at a time. Workers receive the compiled
+    instance once and keep it cached by fingerprint, so a task carries only
+    its genomes. A task whose worker disconnects or exceeds task_timeout is
+    re-queued; when no worker is connected the coordinator evaluates the
+    remaining tasks itself.
+    """
+
+    def __init__(
+        self,
+        address=("localhost", 0),  # Listening address; port 0 picks a free port
+        authkey=None,  # Shared secret; see resolve_authkey
+        chunk_size=32,  # Genomes per task
+        task_timeout=60.0,  # Seconds before a silent worker is dropped
+    ):
+        self.chunk_size = chunk_size
+        self.task_timeout = task_timeout
+        self.ga = None
+        self.encoder = None
+        self.instance = None
+        self.fingerprint = None
+        self.authkey = resolve_authkey(authkey, address[0])
+        self._listener = Listener(address, authkey=self.authkey)
+        self.address = self._listener.address
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._batch_ids = itertools.count()
+        self._workers = set()  # Handler threads of connected workers
+        self._closed = False
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    @property
+    def worker_count(self):
+        return len(self._workers)
+
+    def bind(self, ga):
+        """
+        Compile the GA's instance for the workers. Called by GeneticAlgorithm
+        once its weights and reference are set.
+        """
+        self.ga = ga
+        self.encoder = GenomeEncoder(ga)
+        self.instance = compile_instance(ga)
+        self.fingerprint = instance_fingerprint(self.instance)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _accept(self):
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError):
+                # Closed listener, or a client that failed authentication
+                if self._closed:
+                    return
+                continue
+            handler = threading.Thread(
+                target=self._serve, args=(connection,), daemon=True
+            )
+            self._workers.add(handler)
+            handler.start()
+
+    def _serve(self, connection):
+        # Feeds one worker until it is lost or the evaluator is closed
+        cached_fingerprint = None
+        task = None
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    connection.send(("stop",))
+                    return
+                if cached_fingerprint != self.fingerprint:
+                    connection.send(("instance", self.fingerprint, None))
+                    if not self._receive(connection):
+                        connection.send(("instance", self.fingerprint, self.instance))
+                    cached_fingerprint = self.fingerprint
+                connection.send(
+                    ("evaluate", self.fingerprint, task.task_id, task.genomes)
+                )
+                task_id, fitness, objectives = self._receive(connection)
+                self._results.put((task, fitness, objectives))
+                task = None
+        except (OSError, EOFError, TimeoutError) as e:
+            logging.warning(f"Lost a worker: {e!r}")
+            if task is not None:
+                self._tasks.put(task)
+        finally:
+            self._workers.discard(threading.current_thread())
+            connection.close()
+
+    def _receive(self, connection):
+        if not connection.poll(self.task_timeout):
+            raise TimeoutError(f"no reply within {self.task_timeout} seconds")
+        return connection.recv()
+
+    def evaluate(self, chromosomes):
+        """
+        Set fitness and objectives of every chromosome from a batch evaluation.
+
+        :param chromosomes: Chromosomes whose genes are up to date.
+        """
+        if self.ga is None:
+            raise RuntimeError("The evaluator is not bound to a genetic algorithm")
+        if not chromosomes:
+            return
+        genomes = self.encoder.encode_batch(chromosomes)
+        batch_id = next(self._batch_ids)
+        pending = {}
+        for task_id, start in enumerate(range(0, len(chromosomes), self.chunk_size)):
+            task = _Task(
+                batch_id, task_id, start, genomes[start : start + self.chunk_size]
+            )
+            pending[task_id] = task
+            self._tasks.put(task)
+
+        while pending:
+            try:
+                task, fitness, objectives = self._results.get(timeout=0.1)
+            except queue.Empty:
+                if not self._workers:
+                    self._evaluate_locally(batch_id)
+                continue
+            # Re-queued tasks can be answered twice; later copies are dropped
+            if task.batch_id != batch_id or task.task_id not in pending:
+                continue
+            del pending[task.task_id]
+            for offset in range(len(fitness)):
+                chromosomes[task.start + offset].assign_fitness(
+                    float(fitness[offset]), tuple(objectives[offset].tolist())
+                )
+        self.ga.evaluations += len(chromosomes)
+        logging.debug(f"Evaluated {len(chromosomes)} chromosomes on workers.")
+
+    def _evaluate_locally(self, batch_id):
+        while True:
+            try:
+                task = self._tasks.get_nowait()
+            except queue.Empty:
+                return
+            if task is None or task.batch_id != batch_id:
+                continue
+            fitness, objectives = evaluate_genomes(self.instance, task.genomes)
+            self._results.put((task, fitness, objectives))
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        for _ in range(len(self._workers)):
+            self._tasks.put(None)
+        self._listener.close()
+
+
+def run_worker(address, authkey):
+    """
+    Connect to a coordinator and evaluate its tasks until it stops or goes
+    away. Compiled instances are cached by fingerprint for the worker's
+    lifetime.
+    """
+    instances = {}
+    with Client(address, authkey=authkey) as connection:
+        logging.info(f"Worker {os.getpid()} connected to {address}.")
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                return
+            if message[0] == "stop":
+                return
+            if message[0] == "instance":
+                _, fingerprint, instance = message
+                if instance is None:
+                    connection.send(fingerprint in instances)
+                else:
+                    instances[fingerprint] = instance
+            elif message[0] == "evaluate":
+                _, fingerprint, task_id, genomes = message
+                fitness, objectives = evaluate_genomes(instances[fingerprint], genomes)
+                connection.send((task_id, fitness, objectives))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Evaluate genomes for a distributed genetic algorithm run."
+    )
+    parser.add_argument("--connect", required=True, help="Coordinator host:port")
+    parser.add_argument(
+        "--authkey",
+        default=os.environ.get(AUTHKEY_VARIABLE),
+        help=f"Coordinator's shared secret; defaults to ${AUTHKEY_VARIABLE}.",
+    )
+    args = parser.parse_args(argv)
+    if not args.authkey:
+        parser.error(f"--authkey or {AUTHKEY_VARIABLE} is required")
+
+    host, port = args.connect.rsplit(":", 1)
+    logging.basicConfig(level=logging.INFO)
+    run_worker((host, int(port)), args.authkey.encode())
+
+
+if __name__ == "__main__":
+    main()
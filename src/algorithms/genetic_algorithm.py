@@ -1,5 +1,29 @@
+import copy
+import time
+import heapq
+import collections
+import itertools
 import random
 import logging
+from src.algorithms.adaptive_control import AdaptiveOperatorController
+from src.algorithms.local_search import LocalSearch, day_flags
+from src.algorithms.solver import Solver, SolverResult
+from src.algorithms.teacher_sampler import TeacherSampler
+from src.utils.progress import ProgressTracker
+
+ELITE_COUNT = 2  # Best chromosomes copied unchanged into each generation
+
+# Periods a Time Pref code allows; the real-world data also uses the combined
+# codes 4 (morning or afternoon), 5 (afternoon or evening) and 6 (morning or
+# evening). 0 is no preference.
+TIME_PREFERENCE_PERIODS = {
+    1: ("morning",),
+    2: ("afternoon",),
+    3: ("evening",),
+    4: ("morning", "afternoon"),
+    5: ("afternoon", "evening"),
+    6: ("morning", "evening"),
+}
 
 
 class Chromosome:
@@ -11,6 +35,9 @@ class Chromosome:
         time_slots,  # A list of available time slots
         teacher_preferences,  # A dictionary of teacher preferences
         teacher_satisfaction,  # A dictionary of teacher satisfaction scores
+        genes=None,  # Optional pre-built genes; skips random initialization
+        greedy=False,  # Build genes with the randomized greedy heuristic
+        evaluate=True,  # False leaves scoring to a batch evaluator
     ):
         logging.debug("Initializing new Chromosome instance.")
         self.ga = ga
@@ -21,10 +48,21 @@ class Chromosome:
         self.teacher_satisfaction = teacher_satisfaction
         self.genes = []  # List to store genes; each gene represents a course scheduling decision
         self.fitness = 0  # Fitness score of the chromosome
-
-        self.initialize_randomly()
-        self.evaluate_fitness()
-        logging.debug("Chromosome initialized with random genes.")
+        self.objectives = ()  # (day balance, load balance, satisfaction) terms
+        self._genome_key = None  # Cached genome_key, reset on every evaluation
+        self._shares_genes = False  # True while the gene list belongs to a clone too
+        self._teacher_loads = None  # Cached teacher_loads, kept current by mutations
+        self._counters = None  # (MWF, TR, load deviation, churn) behind the fitness
+
+        if genes is None and greedy:
+            self.initialize_greedily()
+        elif genes is None:
+            self.initialize_randomly()
+            logging.debug("Chromosome initialized with random genes.")
+        else:
+            self.genes = genes
+        if evaluate:
+            self.evaluate_fitness()
 
     def __str__(self):
         output = [f"Chromosome (Fitness: {self.fitness}):\n"]
@@ -38,18 +76,76 @@ class Chromosome:
             output.append(f"{course_id:^10}|{room:^6}|{time_slot:^10}|{teacher_id:^11}")
         return "\n".join(output)
 
+    @staticmethod
+    def gene_key(gene):
+        # Hashable identity of a gene, independent of the dict objects
+        return (
+            gene[0]["Course Section ID"],
+            gene[1]["Room Number"],
+            gene[2]["Time Slot ID"],
+            gene[3],
+        )
+
+    def genome_key(self):
+        # Genes only change right before evaluate_fitness, which clears the cache
+        if self._genome_key is None:
+            self._genome_key = tuple(Chromosome.gene_key(gene) for gene in self.genes)
+        return self._genome_key
+
+    def teacher_loads(self):
+        # Sections per teacher; teacher moves update the counts in place so
+        # section limits are checked without recounting the genes
+        if self._teacher_loads is None:
+            self._teacher_loads = collections.Counter(gene[3] for gene in self.genes)
+        return self._teacher_loads
+
+    def assign_fitness(self, fitness, objectives):
+        # Scores of the current genes computed outside evaluate_fitness
+        self._genome_key = None
+        self._teacher_loads = None
+        self._counters = None
+        self.fitness = fitness
+        self.objectives = objectives
+
+    def clone(self):
+        """
+        Return a copy that shares this chromosome's gene list and fitness.
+
+        Neither copy is re-evaluated; the first one to be modified through
+        mutable_genes takes a private copy of the list.
+        """
+        duplicate = copy.copy(self)
+        self._shares_genes = duplicate._shares_genes = True
+        # Load counters are updated in place, so they are never shared
+        duplicate._teacher_loads = None
+        return duplicate
+
+    def mutable_genes(self):
+        # Copy-on-write: detach from clones before the genes change in place
+        if self._shares_genes:
+            self.genes = list(self.genes)
+            self._shares_genes = False
+        return self.genes
+
+    def churn(self):
+        # Number of sections whose assignment differs from the published schedule
+        reference_keys = self.ga.reference_keys
+        if reference_keys is None:
+            return 0
+        return sum(
+            1
+            for gene, reference_key in zip(self.genes, reference_keys)
+            if reference_key is not None and Chromosome.gene_key(gene) != reference_key
+        )
+
     def is_valid(self):
         logging.debug("Checking if chromosome is valid.")
-        teacher_section_count = {
-            teacher_id: 0 for teacher_id in self.teacher_preferences
-        }
-        for _, _, _, teacher_id in self.genes:
-            teacher_section_count[teacher_id] += 1
+        teacher_section_count = self.teacher_loads()
 
         is_valid_chromosome = all(
             teacher_section_count[teacher_id]
             <= self.teacher_preferences[teacher_id]["Max Sections"]
-            for teacher_id in teacher_section_count
+            for teacher_id in self.teacher_preferences
         )
 
         if not is_valid_chromosome:
@@ -63,49 +159,101 @@ class Chromosome:
 
     def initialize_randomly(self):
         logging.info("Initializing Chromosome Randomly")
+        if self.ga.candidate_domains is not None:
+            self.initialize_within_domains()
+            return
         self.genes = []
         assigned_slots = set()
 
-        all_combinations = [
-            (room, time_slot)
-            for room in self.classrooms
-            for time_slot in self.time_slots
-        ]
-        random.shuffle(all_combinations)
+        # Sample distinct (room, time slot) pairs by index instead of building
+        # and shuffling the whole rooms x time slots product
+        slot_count = len(self.time_slots)
+        pair_indices = random.sample(
+            range(len(self.classrooms) * slot_count), len(self.course_sections)
+        )
+
+        teacher_assignments = {teacher_id: 0 for teacher_id in self.teacher_preferences}
+
+        for section, pair_index in zip(self.course_sections, pair_indices):
+            room_index, slot_index = divmod(pair_index, slot_count)
+            room = self.classrooms[room_index]
+            time_slot = self.time_slots[slot_index]
+
+            teacher_id = self.ga.teacher_sampler(section).sample(
+                teacher_assignments, self.ga.max_sections
+            )
+            teacher_assignments[teacher_id] += 1
+
+            self.genes.append((section, room, time_slot, teacher_id))
+            assigned_slots.add((room["Room Number"], time_slot["Time Slot ID"]))
+
+        logging.debug("Random initialization of chromosome completed.")
 
+    def initialize_within_domains(self):
+        # Each section gets a teacher from its domain, then a free room and
+        # slot from that teacher's domain
+        self.genes = []
+        assigned_slots = set()
         teacher_assignments = {teacher_id: 0 for teacher_id in self.teacher_preferences}
 
         for section in self.course_sections:
-            room, time_slot = all_combinations.pop()
+            teacher_id = self.ga.teacher_sampler(section).sample(
+                teacher_assignments, self.ga.max_sections
+            )
+            teacher_assignments[teacher_id] += 1
+            room, time_slot = self.ga.free_pair(
+                *self.ga.rooms_and_slots(teacher_id), assigned_slots
+            )
+            self.genes.append((section, room, time_slot, teacher_id))
+            assigned_slots.add((room["Room Number"], time_slot["Time Slot ID"]))
+
+    def initialize_greedily(self, candidates_per_section=8):
+        logging.info("Initializing Chromosome Greedily")
+        genes = [None] * len(self.course_sections)
+        assigned_slots = set()
+        teacher_assignments = {teacher_id: 0 for teacher_id in self.teacher_preferences}
 
+        # Sections are visited in random order so greedy chromosomes differ
+        order = list(range(len(self.course_sections)))
+        random.shuffle(order)
+
+        for index in order:
+            section = self.course_sections[index]
+            section_teachers = self.ga.section_teachers(section)
             eligible_teachers = [
                 tid
-                for tid, count in teacher_assignments.items()
-                if count < self.teacher_preferences[tid]["Max Sections"]
+                for tid in section_teachers
+                if teacher_assignments[tid]
+                < self.teacher_preferences[tid]["Max Sections"]
             ]
             if not eligible_teachers:
-                eligible_teachers = list(self.teacher_preferences.keys())
-
-            teacher_satisfaction_weights = [
-                1
-                / (
-                    1
-                    + self.teacher_satisfaction[tid][
-                        f"CS{section['Course Section ID']}"
-                    ]
+                eligible_teachers = list(section_teachers)
+
+            # Keep the best of a few sampled teachers, each placed in a free
+            # room and slot that matches their board, time and day preferences.
+            best_candidate = None
+            for _ in range(candidates_per_section):
+                teacher_id = random.choice(eligible_teachers)
+                room, time_slot = self._free_preferred_pair(teacher_id, assigned_slots)
+                score = self.evaluate_teacher_preferences(
+                    teacher_id, section, room, time_slot
                 )
-                for tid in eligible_teachers
-            ]
+                if self.not_meeting_preferences(teacher_id, section, room, time_slot):
+                    score -= self.ga.deviation_penalty
+                if best_candidate is None or score > best_candidate[0]:
+                    best_candidate = (score, room, time_slot, teacher_id)
 
-            teacher_id = random.choices(
-                eligible_teachers, weights=teacher_satisfaction_weights, k=1
-            )[0]
+            _, room, time_slot, teacher_id = best_candidate
             teacher_assignments[teacher_id] += 1
-
-            self.genes.append((section, room, time_slot, teacher_id))
+            genes[index] = (section, room, time_slot, teacher_id)
             assigned_slots.add((room["Room Number"], time_slot["Time Slot ID"]))
 
-        logging.debug("Random initialization of chromosome completed.")
+        self.genes = genes
+        logging.debug("Greedy initialization of chromosome completed.")
+
+    def _free_preferred_pair(self, teacher_id, assigned_slots, attempts=10):
+        rooms, time_slots = self.ga.preferred_rooms_and_slots(teacher_id)
+        return self.ga.free_pair(rooms, time_slots, assigned_slots, attempts)
 
     @staticmethod
     def calculate_load_balance(teachers_actual_load, teacher_preferences):
@@ -118,24 +266,56 @@ class Chromosome:
             total_deviation += deviation
         return total_deviation
 
+    @staticmethod
+    def room_violates_preferences(preferences, room):
+        return (
+            preferences["Board Pref"] != 0
+            and room["Board Type"] != preferences["Board Pref"]
+        )
+
+    @staticmethod
+    def time_slot_period_matches(period, time_slot):
+        description = time_slot["Description"]
+        if period == "morning":
+            return "am" in description.lower()
+        if period == "afternoon":
+            return "pm" in description.lower() and "11" not in description
+        return "evening" in description.lower()
+
+    @staticmethod
+    def time_slot_in_preferred_period(preferences, time_slot):
+        # Whether the time slot falls in any period of the teacher's Time Pref
+        return any(
+            Chromosome.time_slot_period_matches(period, time_slot)
+            for period in TIME_PREFERENCE_PERIODS.get(preferences["Time Pref"], ())
+        )
+
+    @staticmethod
+    def time_slot_violates_preferences(preferences, time_slot):
+        description = time_slot["Description"]
+        conditions = [
+            preferences["Time Pref"] in TIME_PREFERENCE_PERIODS
+            and not Chromosome.time_slot_in_preferred_period(preferences, time_slot),
+            preferences["Days Pref"] == 1 and "MWF" not in description,
+            preferences["Days Pref"] == 2 and "TR" not in description,
+        ]
+        return any(conditions)
+
+    @staticmethod
+    def course_violates_preferences(preferences, course):
+        return (
+            preferences["Type Pref"] != 0
+            and course["Course Type"] != preferences["Type Pref"]
+        )
+
     def not_meeting_preferences(self, teacher_id, course, room, time_slot):
         logging.debug(f"Checking if preferences are met for teacher {teacher_id}.")
         preferences = self.teacher_preferences[teacher_id]
 
         conditions = [
-            preferences["Board Pref"] != 0
-            and room["Board Type"] != preferences["Board Pref"],
-            preferences["Time Pref"] == 1
-            and "am" not in time_slot["Description"].lower(),
-            preferences["Time Pref"] == 2
-            and "pm" not in time_slot["Description"].lower()
-            and "11" not in time_slot["Description"],
-            preferences["Time Pref"] == 3
-            and "evening" not in time_slot["Description"].lower(),
-            preferences["Days Pref"] == 1 and "MWF" not in time_slot["Description"],
-            preferences["Days Pref"] == 2 and "TR" not in time_slot["Description"],
-            preferences["Type Pref"] != 0
-            and course["Course Type"] != preferences["Type Pref"],
+            Chromosome.room_violates_preferences(preferences, room),
+            Chromosome.time_slot_violates_preferences(preferences, time_slot),
+            Chromosome.course_violates_preferences(preferences, course),
         ]
 
         preference_violated = any(conditions)
@@ -158,18 +338,7 @@ class Chromosome:
             and room["Board Type"] == preferences["Board Pref"]
         ):
             preference_score += 1
-        if preferences["Time Pref"] == 1 and "am" in time_slot["Description"].lower():
-            preference_score += 1
-        if (
-            preferences["Time Pref"] == 2
-            and "pm" in time_slot["Description"].lower()
-            and "11" not in time_slot["Description"]
-        ):
-            preference_score += 1
-        if (
-            preferences["Time Pref"] == 3
-            and "evening" in time_slot["Description"].lower()
-        ):
+        if Chromosome.time_slot_in_preferred_period(preferences, time_slot):
             preference_score += 1
         if preferences["Days Pref"] == 1 and "MWF" in time_slot["Description"]:
             preference_score += 1
@@ -181,8 +350,8 @@ class Chromosome:
         ):
             preference_score += 1
 
-        satisfaction_score = self.teacher_satisfaction[teacher_id][
-            f"CS{course['Course Section ID']}"
+        satisfaction_score = self.ga.section_satisfaction[teacher_id][
+            course["Course Section ID"]
         ]
         total_score = preference_score + satisfaction_score
 
@@ -191,6 +360,8 @@ class Chromosome:
 
     def evaluate_fitness(self):
         logging.debug("Starting fitness evaluation.")
+        self.ga.evaluations += 1
+        self._genome_key = None
         self.fitness = 0
         mw_count, tr_count = 0, 0
         course_assignments = set()
@@ -218,8 +389,8 @@ class Chromosome:
             preference_score = self.evaluate_teacher_preferences(
                 teacher_id, course, room, time_slot
             )
-            satisfaction_score = self.teacher_satisfaction[teacher_id][
-                f"CS{course['Course Section ID']}"
+            satisfaction_score = self.ga.section_satisfaction[teacher_id][
+                course["Course Section ID"]
             ]
 
             self.fitness += preference_score * self.ga.preference_weight
@@ -241,13 +412,16 @@ class Chromosome:
         for _, _, _, teacher_id in self.genes:
             teachers_actual_load[teacher_id] += 1
 
+        self._teacher_loads = teachers_actual_load
+
         T = len(self.genes)  # Total number of teaching assignments
-        load_balance_score = (
-            Chromosome.calculate_load_balance(
-                teachers_actual_load, self.teacher_preferences
-            )
-            / T
+        deviation = Chromosome.calculate_load_balance(
+            teachers_actual_load, self.teacher_preferences
         )
+        load_balance_score = deviation / T
+
+        # Keep the individual criteria for multi-objective selection
+        self.objectives = (balance_score, load_balance_score, satisfaction_score)
 
         # Update the overall fitness score by incorporating the balance_score
         self.fitness = (
@@ -256,10 +430,77 @@ class Chromosome:
             + self.ga.omega3 * satisfaction_score
         )
 
+        # Warm-started runs are penalized for moving published assignments
+        churn = self.churn() if self.ga.churn_penalty else 0
+        if churn:
+            self.fitness -= self.ga.churn_penalty * churn / T
+        self._counters = (mw_count, tr_count, deviation, churn)
+
         logging.info("Fitness evaluation completed. Fitness: " + str(self.fitness))
 
+    def rescore(self, changes):
+        """
+        Update the fitness after genes were replaced in place, applying each
+        change as a delta to the counters of the last evaluation, as
+        IncrementalFitness does, instead of re-scanning every gene. Falls back
+        to evaluate_fitness when the counters are unknown.
+
+        :param changes: (index, previous gene) pairs of the replaced genes; the
+            teacher_loads counter must already reflect the new genes.
+        """
+        if self._counters is None:
+            self.evaluate_fitness()
+            return
+        self.ga.evaluations += 1
+        self._genome_key = None
+        mw_count, tr_count, deviation, churn = self._counters
+        loads = self.teacher_loads()
+        load_changes = collections.Counter()
+        for index, old_gene in changes:
+            new_gene = self.genes[index]
+            old_mwf, old_tr = day_flags(old_gene[2])
+            new_mwf, new_tr = day_flags(new_gene[2])
+            mw_count += new_mwf - old_mwf
+            tr_count += new_tr - old_tr
+            load_changes[old_gene[3]] -= 1
+            load_changes[new_gene[3]] += 1
+            # Without a published schedule nothing counts as moved
+            if self.ga.churn_penalty and self.ga.reference_keys is not None:
+                churn += self._moved(index, new_gene) - self._moved(index, old_gene)
+        for teacher_id, change in load_changes.items():
+            if change:
+                preferences = self.teacher_preferences[teacher_id]
+                ideal = (preferences["Min Sections"] + preferences["Max Sections"]) / 2
+                load = loads[teacher_id]
+                deviation += abs(load - ideal) - abs(load - change - ideal)
+
+        T = len(self.genes)
+        course, _, _, teacher_id = self.genes[-1]
+        balance_score = 1 / (1 + abs(mw_count - tr_count))
+        load_balance_score = deviation / T
+        satisfaction_score = self.ga.section_satisfaction[teacher_id][
+            course["Course Section ID"]
+        ]
+        self.objectives = (balance_score, load_balance_score, satisfaction_score)
+        self.fitness = (
+            self.ga.omega1 * balance_score
+            + self.ga.omega2 * load_balance_score
+            + self.ga.omega3 * satisfaction_score
+        )
+        if churn:
+            self.fitness -= self.ga.churn_penalty * churn / T
+        self._counters = (mw_count, tr_count, deviation, churn)
+
+    def _moved(self, index, gene):
+        reference_key = self.ga.reference_keys[index]
+        return int(
+            reference_key is not None and Chromosome.gene_key(gene) != reference_key
+        )
+
+
+class GeneticAlgorithm(Solver):
+    name = "genetic_algorithm"
 
-class GeneticAlgorithm:
     def __init__(
         self,
         course_sections,  # A list of course sections
@@ -271,11 +512,39 @@ class GeneticAlgorithm:
         omega1,  # Weight for day-of-week balance
         omega2,  # Weight for teaching load balance
         omega3,  # Weight for teacher satisfaction
+        replacement="generational",  # "generational" or "steady_state"
+        steady_state_batch_size=2,  # Children bred per steady-state step
+        mutation_probability=0.2,  # Chance of mutating each chromosome
+        tournament_size=7,  # Number of contestants in tournament selection
+        adaptive=False,  # Adapt operator choice and mutation rate during the run
+        local_search_interval=0,  # Refine elites every N generations (0 disables)
+        local_search_top_k=2,  # Number of best chromosomes refined each time
+        seed_genes=None,  # Genes of a previous schedule to warm-start from
+        focus_indices=None,  # Gene indices mutated first when warm-starting
+        focus_generations=10,  # Generations during which mutation stays focused
+        churn_penalty=0.0,  # Fitness penalty per fraction of sections moved
+        greedy_seed_fraction=0.0,  # Share of the initial population seeded greedily
+        duplicate_replacement=None,  # None, "random" or "mutate" for clones
+        diversity_sample_pairs=100,  # Pairs sampled for the mean Hamming distance
+        evaluator=None,  # Batch evaluator for offspring, e.g. a ParallelEvaluator
+        feasibility_preserving=False,  # Reject moves that break section limits
+        candidate_domains=None,  # CandidateDomains limiting sampled assignments
     ):
         logging.info(
             "Initializing Genetic Algorithm with population size: "
             + str(population_size)
         )
+        if replacement not in ("generational", "steady_state"):
+            raise ValueError(f"Unknown replacement strategy: {replacement}")
+        if steady_state_batch_size < 1:
+            raise ValueError("steady_state_batch_size must be at least 1")
+        if evaluator is not None and (adaptive or replacement == "steady_state"):
+            # Both score every child as soon as it is bred
+            raise ValueError("Batch evaluators need generational, non-adaptive runs")
+        if duplicate_replacement not in (None, "random", "mutate"):
+            raise ValueError(
+                f"Unknown duplicate replacement strategy: {duplicate_replacement}"
+            )
         self.course_sections = course_sections
         self.classrooms = classrooms
         self.time_slots = time_slots
@@ -285,6 +554,36 @@ class GeneticAlgorithm:
         self.omega1 = omega1
         self.omega2 = omega2
         self.omega3 = omega3
+        self.replacement = replacement
+        self.steady_state_batch_size = steady_state_batch_size
+        self.mutation_probability = mutation_probability
+        self.tournament_size = tournament_size
+        self.controller = (
+            AdaptiveOperatorController(base_mutation_probability=mutation_probability)
+            if adaptive
+            else None
+        )
+        self.local_search_interval = local_search_interval
+        self.local_search_top_k = local_search_top_k
+        self.local_search = LocalSearch(self) if local_search_interval > 0 else None
+        self.evaluations = 0  # Number of fitness evaluations performed
+        self.generation = 0  # Index of the generation currently being evolved
+        self.focus_indices = list(focus_indices or [])
+        self.focus_generations = focus_generations
+        self.churn_penalty = churn_penalty
+        self.duplicate_replacement = duplicate_replacement
+        self.evaluator = evaluator
+        self.feasibility_preserving = feasibility_preserving
+        self.candidate_domains = candidate_domains
+        self.diversity_sample_pairs = diversity_sample_pairs
+        # Pair sampling for statistics must not perturb the search's random stream
+        self._statistics_random = random.Random(0)
+        self.reference_keys = None
+        if seed_genes is not None:
+            self.reference_keys = [
+                None if gene is None else Chromosome.gene_key(gene)
+                for gene in seed_genes
+            ]
 
         # Additional weights for the fitness function
         self.preference_weight = 5
@@ -292,78 +591,379 @@ class GeneticAlgorithm:
         self.deviation_penalty = 30
         self.balance_penalty_weight = 10
 
-        self.population = [
-            Chromosome(
-                self,
-                course_sections,
-                classrooms,
-                time_slots,
-                teacher_preferences,
-                teacher_satisfaction,
-            )
-            for _ in range(population_size)
-        ]
+        self._preferred_rooms_and_slots = {}
+        self._teacher_samplers = {}
+        # Satisfaction keyed by integer section ID, so scoring a gene does not
+        # build a "CS<id>" column key
+        self.section_satisfaction = {
+            teacher_id: {
+                section["Course Section ID"]: scores[
+                    f"CS{section['Course Section ID']}"
+                ]
+                for section in course_sections
+            }
+            for teacher_id, scores in teacher_satisfaction.items()
+        }
+        self.teacher_ids = list(teacher_preferences)
+        self.min_sections = {
+            teacher_id: preferences["Min Sections"]
+            for teacher_id, preferences in teacher_preferences.items()
+        }
+        self.max_sections = {
+            teacher_id: preferences["Max Sections"]
+            for teacher_id, preferences in teacher_preferences.items()
+        }
+        if candidate_domains is not None:
+            candidate_domains.bind(self)
+
+        if seed_genes is None:
+            # Greedy individuals start close to good schedules; the random
+            # remainder keeps the initial population diverse.
+            greedy_count = round(greedy_seed_fraction * population_size)
+            self.population = [
+                Chromosome(
+                    self,
+                    course_sections,
+                    classrooms,
+                    time_slots,
+                    teacher_preferences,
+                    teacher_satisfaction,
+                    greedy=index < greedy_count,
+                )
+                for index in range(population_size)
+            ]
+        else:
+            self.population = self._warm_start_population(seed_genes)
+        if evaluator is not None:
+            evaluator.bind(self)
         logging.debug("Genetic Algorithm initialized.")
 
+    def preferred_rooms_and_slots(self, teacher_id):
+        # Rooms and time slots that do not violate the teacher's preferences,
+        # or all of them when none qualify
+        if teacher_id not in self._preferred_rooms_and_slots:
+            preferences = self.teacher_preferences[teacher_id]
+            rooms = [
+                room
+                for room in self.classrooms
+                if not Chromosome.room_violates_preferences(preferences, room)
+            ]
+            time_slots = [
+                time_slot
+                for time_slot in self.time_slots
+                if not Chromosome.time_slot_violates_preferences(preferences, time_slot)
+            ]
+            self._preferred_rooms_and_slots[teacher_id] = (
+                rooms or self.classrooms,
+                time_slots or self.time_slots,
+            )
+        return self._preferred_rooms_and_slots[teacher_id]
+
+    def section_teachers(self, section):
+        # Teachers a section may be given
+        if self.candidate_domains is None:
+            return self.teacher_ids
+        return self.candidate_domains.teachers(section)
+
+    def rooms_and_slots(self, teacher_id):
+        # Rooms and time slots a teacher's sections may be placed in
+        if self.candidate_domains is None:
+            return self.classrooms, self.time_slots
+        return self.candidate_domains.rooms_and_slots(teacher_id)
+
+    def in_domain(self, gene):
+        # Whether the gene's room and slot are allowed for its teacher
+        return self.candidate_domains is None or self.candidate_domains.allows(
+            gene[3], gene[1], gene[2]
+        )
+
+    def free_pair(self, rooms, time_slots, assigned_slots, attempts=10):
+        """
+        Draw a room and time slot from the given lists that is not in
+        assigned_slots, falling back to any free pair when they are crowded.
+        """
+        for _ in range(attempts):
+            room, time_slot = random.choice(rooms), random.choice(time_slots)
+            if (room["Room Number"], time_slot["Time Slot ID"]) not in assigned_slots:
+                return room, time_slot
+
+        def free_pairs(rooms, time_slots):
+            return [
+                (room, time_slot)
+                for room in rooms
+                for time_slot in time_slots
+                if (room["Room Number"], time_slot["Time Slot ID"])
+                not in assigned_slots
+            ]
+
+        return random.choice(
+            free_pairs(rooms, time_slots)
+            or free_pairs(self.classrooms, self.time_slots)
+        )
+
+    def teacher_sampler(self, section):
+        # Teachers weighted by 1 / (1 + satisfaction) for this section, so
+        # random chromosomes lean towards less contested assignments
+        section_id = section["Course Section ID"]
+        if section_id not in self._teacher_samplers:
+            teacher_ids = self.section_teachers(section)
+            self._teacher_samplers[section_id] = TeacherSampler(
+                teacher_ids,
+                [
+                    1 / (1 + self.section_satisfaction[tid][section_id])
+                    for tid in teacher_ids
+                ],
+            )
+        return self._teacher_samplers[section_id]
+
+    def teacher_move_feasible(self, loads, old_teacher_id, new_teacher_id):
+        """
+        Check in O(1) that handing one section from old_teacher_id to
+        new_teacher_id keeps both within their Min and Max Sections.
+
+        :param loads: Current sections per teacher, keyed by teacher ID.
+        """
+        return (
+            loads[new_teacher_id] < self.max_sections[new_teacher_id]
+            and loads[old_teacher_id] > self.min_sections[old_teacher_id]
+        )
+
     def selection(self):
         logging.debug("Selecting parents for crossover.")
-        tournament = random.sample(self.population, 7)  # Tournament selection
+        tournament = random.sample(
+            self.population, min(self.tournament_size, len(self.population))
+        )  # Tournament selection
         return sorted(tournament, key=lambda c: c.fitness, reverse=True)[:2]
 
-    def crossover(self, parent1, parent2):
+    def crossover(self, parent1, parent2, evaluate=True):
         logging.debug("Starting crossover for selected parents.")
-        child = Chromosome(
-            self,
-            self.course_sections,
-            self.classrooms,
-            self.time_slots,
-            self.teacher_preferences,
-            self.teacher_satisfaction,
-        )
-
-        child.genes = []
+        genes = []
         assigned_slots = set()
+        loads = collections.Counter() if self.feasibility_preserving else None
 
         for gene1, gene2 in zip(parent1.genes, parent2.genes):
             chosen_gene = gene1 if random.random() < 0.5 else gene2
 
-            while (
+            if loads is not None and (
+                loads[chosen_gene[3]] >= self.max_sections[chosen_gene[3]]
+            ):
+                # The inherited teacher is already full in this child, so
+                # the section goes to a teacher with spare capacity
+                chosen_gene = chosen_gene[:3] + (
+                    self.teacher_sampler(chosen_gene[0]).sample(
+                        loads, self.max_sections
+                    ),
+                )
+
+            if (
                 chosen_gene[1]["Room Number"],
                 chosen_gene[2]["Time Slot ID"],
-            ) in assigned_slots:
-                chosen_gene = (
-                    chosen_gene[0],
-                    random.choice(self.classrooms),
-                    random.choice(self.time_slots),
-                    chosen_gene[3],
+            ) in assigned_slots or not self.in_domain(chosen_gene):
+                room, time_slot = self.free_pair(
+                    *self.rooms_and_slots(chosen_gene[3]), assigned_slots
                 )
+                chosen_gene = (chosen_gene[0], room, time_slot, chosen_gene[3])
 
-            child.genes.append(chosen_gene)
+            genes.append(chosen_gene)
             assigned_slots.add(
                 (chosen_gene[1]["Room Number"], chosen_gene[2]["Time Slot ID"])
             )
+            if loads is not None:
+                loads[chosen_gene[3]] += 1
 
-        child.evaluate_fitness()
+        # Build the child directly from the recombined genes so it is not
+        # randomly initialized and evaluated only to be overwritten.
+        child = self._chromosome_from_genes(genes, evaluate)
         logging.debug(f"Crossover result: Fitness - {child.fitness}")
         return child
 
-    def mutate(self, chromosome):
+    def mutate(self, chromosome, operator=None):
         logging.info("Performing Mutation")
-        gene_index = random.randint(0, len(chromosome.genes) - 1)
-        mutated_gene = self._mutate_gene(chromosome.genes[gene_index])
+        if operator is None and self.controller is not None:
+            operator = self.controller.select_mutation_operator()
+        previous_fitness = chromosome.fitness
+
+        changes = []
+        operator = self._apply_mutation(
+            chromosome.mutable_genes(), operator, chromosome.teacher_loads(), changes
+        )
+        chromosome.rescore(changes)
 
-        chromosome.genes[gene_index] = mutated_gene
-        chromosome.evaluate_fitness()
+        if self.controller is not None:
+            self.controller.record(operator, chromosome.fitness - previous_fitness)
         logging.info("Mutation result: " + str(chromosome))
 
-    def _mutate_gene(self, gene):
-        if random.random() < 0.5:
-            new_room = random.choice(self.classrooms)
+    def _apply_mutation(self, genes, operator=None, loads=None, changes=None):
+        # Mutates the gene list (and loads, when given) in place and returns
+        # the operator applied; changes, when given, receives an (index,
+        # previous gene) pair per replaced gene
+        if operator == "teacher_swap":
+            self._swap_teachers(genes, changes)
+            return operator
+        if operator is None:
+            operator = random.choice(("room_move", "slot_move", "teacher_move"))
+        if self.focus_indices and self.generation < self.focus_generations:
+            gene_index = random.choice(self.focus_indices)
+        else:
+            gene_index = random.randint(0, len(genes) - 1)
+        old_gene = genes[gene_index]
+        if operator == "teacher_move":
+            self._reassign_teacher(genes, gene_index, loads)
+        else:
+            genes[gene_index] = self._mutate_gene(old_gene, operator)
+        if changes is not None and genes[gene_index] is not old_gene:
+            changes.append((gene_index, old_gene))
+        return operator
+
+    def _mutate_gene(self, gene, operator=None):
+        if operator is None:
+            operator = "room_move" if random.random() < 0.5 else "slot_move"
+        rooms, time_slots = self.rooms_and_slots(gene[3])
+        if operator == "room_move":
+            new_room = random.choice(rooms)
             return (gene[0], new_room, gene[2], gene[3])
         else:
-            new_time_slot = random.choice(self.time_slots)
+            new_time_slot = random.choice(time_slots)
             return (gene[0], gene[1], new_time_slot, gene[3])
 
+    def _reassign_teacher(self, genes, index, loads=None):
+        """
+        Hand one section to a random other teacher, keeping the per-teacher
+        load counters current. In feasibility-preserving mode a move that
+        would break Min or Max Sections is rejected before it is applied.
+
+        :param loads: Sections per teacher for genes; counted when omitted.
+        :return: True if the section changed teacher.
+        """
+        gene = genes[index]
+        old_teacher_id = gene[3]
+        new_teacher_id = random.choice(self.section_teachers(gene[0]))
+        if new_teacher_id == old_teacher_id:
+            return False
+        if loads is None:
+            loads = collections.Counter(other[3] for other in genes)
+        if self.feasibility_preserving and not self.teacher_move_feasible(
+            loads, old_teacher_id, new_teacher_id
+        ):
+            return False
+        loads[old_teacher_id] -= 1
+        loads[new_teacher_id] += 1
+        genes[index] = (gene[0], gene[1], gene[2], new_teacher_id)
+        self._place_in_domain(genes, index)
+        return True
+
+    def _place_in_domain(self, genes, index):
+        # After a teacher change, move the section to a free room and slot of
+        # the new teacher's domain if its current ones are not allowed
+        gene = genes[index]
+        if self.in_domain(gene):
+            return
+        assigned_slots = {
+            (other[1]["Room Number"], other[2]["Time Slot ID"])
+            for position, other in enumerate(genes)
+            if position != index
+        }
+        room, time_slot = self.free_pair(*self.rooms_and_slots(gene[3]), assigned_slots)
+        genes[index] = (gene[0], room, time_slot, gene[3])
+
+    def _swap_teachers(self, genes, changes=None):
+        # Exchanging teachers between two sections keeps every teacher's load,
+        # so Max Sections limits are preserved.
+        if len(genes) < 2:
+            return
+        first, second = random.sample(range(len(genes)), 2)
+        gene1, gene2 = genes[first], genes[second]
+        if self.candidate_domains is not None and (
+            gene2[3] not in self.section_teachers(gene1[0])
+            or gene1[3] not in self.section_teachers(gene2[0])
+        ):
+            return
+        genes[first] = (gene1[0], gene1[1], gene1[2], gene2[3])
+        genes[second] = (gene2[0], gene2[1], gene2[2], gene1[3])
+        self._place_in_domain(genes, first)
+        self._place_in_domain(genes, second)
+        if changes is not None:
+            changes.extend(((first, gene1), (second, gene2)))
+
+    def _warm_start_population(self, seed_genes):
+        logging.info("Seeding population from a previous schedule.")
+        genes = list(seed_genes)
+        occupied = {
+            (gene[1]["Room Number"], gene[2]["Time Slot ID"])
+            for gene in genes
+            if gene is not None
+        }
+        teacher_loads = {teacher_id: 0 for teacher_id in self.teacher_preferences}
+        for gene in genes:
+            if gene is not None:
+                teacher_loads[gene[3]] += 1
+
+        # Sections without a usable previous assignment get the least loaded
+        # teacher that still has capacity and a free room and slot.
+        for index, gene in enumerate(genes):
+            if gene is not None:
+                continue
+            section = self.course_sections[index]
+            teacher_id = min(
+                self.section_teachers(section),
+                key=lambda tid: (
+                    teacher_loads[tid] >= self.teacher_preferences[tid]["Max Sections"],
+                    teacher_loads[tid],
+                    random.random(),
+                ),
+            )
+            room, time_slot = self.free_pair(
+                *self.rooms_and_slots(teacher_id), occupied
+            )
+            genes[index] = (section, room, time_slot, teacher_id)
+            occupied.add((room["Room Number"], time_slot["Time Slot ID"]))
+            teacher_loads[teacher_id] += 1
+
+        population = [self._chromosome_from_genes(genes)]
+        while len(population) < self.population_size:
+            variant = list(genes)
+            # Perturb the changed sections, plus one move anywhere for diversity
+            for index in self.focus_indices:
+                if random.random() < 0.5:
+                    variant[index] = self._mutate_gene(variant[index])
+            index = random.randrange(len(variant))
+            variant[index] = self._mutate_gene(variant[index])
+            population.append(self._chromosome_from_genes(variant))
+        return population
+
+    def _chromosome_from_genes(self, genes, evaluate=True):
+        return Chromosome(
+            self,
+            self.course_sections,
+            self.classrooms,
+            self.time_slots,
+            self.teacher_preferences,
+            self.teacher_satisfaction,
+            genes=genes,
+            evaluate=evaluate,
+        )
+
+    def _breed_child(self):
+        parent1, parent2 = self.selection()
+        if self.controller is None:
+            return self.crossover(parent1, parent2)
+
+        operator = self.controller.select_operator()
+        if operator == "crossover":
+            child = self.crossover(parent1, parent2)
+            reference_fitness = max(parent1.fitness, parent2.fitness)
+        else:
+            # Mutate a clone of the fitter parent and rescore only its changes
+            child = parent1.clone()
+            changes = []
+            self._apply_mutation(
+                child.mutable_genes(), operator, child.teacher_loads(), changes
+            )
+            child.rescore(changes)
+            reference_fitness = parent1.fitness
+        self.controller.record(operator, child.fitness - reference_fitness)
+        return child
+
     def compute_statistics(self):
         logging.debug("Computing summary statistics for the population.")
         total_genes = len(self.course_sections) * len(self.population)
@@ -378,10 +978,20 @@ class GeneticAlgorithm:
             "course_assignment_duplicates": 0,
         }
 
+        # Clones share a genome, so each distinct genome is scored once and
+        # its counts are weighted by the number of copies.
+        genome_counts = collections.Counter(
+            chromosome.genome_key() for chromosome in self.population
+        )
+        representatives = {}
+        for chromosome in self.population:
+            representatives.setdefault(chromosome.genome_key(), chromosome)
+
         total_fitness = 0
         max_fitness = -float("inf")
-        for chromosome in self.population:
-            total_fitness += chromosome.fitness
+        for key, chromosome in representatives.items():
+            copies = genome_counts[key]
+            total_fitness += chromosome.fitness * copies
             max_fitness = max(max_fitness, chromosome.fitness)
 
             duplicate_courses = set()
@@ -390,25 +1000,26 @@ class GeneticAlgorithm:
                 day_key = (
                     "MWF" if any(d in time_slot for d in ["M", "W", "F"]) else "TR"
                 )
-                stats["distribution"][day_key] += 1
+                stats["distribution"][day_key] += copies
 
                 teacher_id = gene[3]
                 preference_score = chromosome.evaluate_teacher_preferences(
                     teacher_id, *gene[:3]
                 )
-                stats["teacher_preference_adherence"] += preference_score
-                stats["teacher_satisfaction"] += self.teacher_satisfaction[teacher_id][
-                    f"CS{gene[0]['Course Section ID']}"
-                ]
+                stats["teacher_preference_adherence"] += preference_score * copies
+                stats["teacher_satisfaction"] += (
+                    self.section_satisfaction[teacher_id][gene[0]["Course Section ID"]]
+                    * copies
+                )
 
                 course_id = gene[0]["Course Section ID"]
                 if course_id in duplicate_courses:
-                    stats["course_assignment_duplicates"] += 1
+                    stats["course_assignment_duplicates"] += copies
                 else:
                     duplicate_courses.add(course_id)
 
                 if chromosome.not_meeting_preferences(teacher_id, *gene[:3]):
-                    stats["preference_violations"] += 1
+                    stats["preference_violations"] += copies
 
         # Convert distribution to percentage
         total_courses = stats["distribution"]["MWF"] + stats["distribution"]["TR"]
@@ -436,44 +1047,272 @@ class GeneticAlgorithm:
         stats["average_fitness"] = total_fitness / len(self.population)
         stats["max_fitness"] = max_fitness
 
+        stats["unique_fraction"] = len(representatives) / len(self.population)
+        stats["mean_hamming_distance"] = self.mean_hamming_distance()
+
         logging.info("Summary statistics computed.")
         return stats
 
-    def run(self, generations):
+    def best_distinct(self, k):
+        """
+        :return: Up to k chromosomes with distinct genomes, best first.
+        """
+        best, seen = [], set()
+        for chromosome in sorted(
+            self.population, key=lambda c: c.fitness, reverse=True
+        ):
+            key = chromosome.genome_key()
+            if key not in seen:
+                seen.add(key)
+                best.append(chromosome)
+                if len(best) == k:
+                    break
+        return best
+
+    def mean_hamming_distance(self):
+        """
+        Estimate how far apart the population's schedules are.
+
+        :return: The mean fraction of sections assigned differently between two
+            members, over all pairs or diversity_sample_pairs random pairs.
+        """
+        size = len(self.population)
+        if size < 2 or not self.course_sections:
+            return 0.0
+        if size * (size - 1) // 2 <= self.diversity_sample_pairs:
+            pairs = list(itertools.combinations(range(size), 2))
+        else:
+            pairs = [
+                self._statistics_random.sample(range(size), 2)
+                for _ in range(self.diversity_sample_pairs)
+            ]
+
+        total_distance = 0
+        for first, second in pairs:
+            first_key = self.population[first].genome_key()
+            second_key = self.population[second].genome_key()
+            if first_key is not second_key:
+                total_distance += sum(a != b for a, b in zip(first_key, second_key))
+        return total_distance / (len(pairs) * len(self.course_sections))
+
+    def replace_duplicates(self):
+        """
+        Replace every extra copy of a genome with a random chromosome or a
+        heavily mutated copy, depending on duplicate_replacement.
+
+        :return: The number of chromosomes replaced.
+        """
+        seen = set()
+        replaced = 0
+        for index, chromosome in enumerate(self.population):
+            key = chromosome.genome_key()
+            if key not in seen:
+                seen.add(key)
+                continue
+            if self.duplicate_replacement == "mutate":
+                genes = list(chromosome.genes)
+                loads = collections.Counter(chromosome.teacher_loads())
+                # Change about a tenth of the sections so the copy lands
+                # outside the clone's neighbourhood
+                for _ in range(max(1, len(genes) // 10)):
+                    self._apply_mutation(genes, loads=loads)
+                replacement = self._chromosome_from_genes(genes)
+            else:
+                replacement = Chromosome(
+                    self,
+                    self.course_sections,
+                    self.classrooms,
+                    self.time_slots,
+                    self.teacher_preferences,
+                    self.teacher_satisfaction,
+                )
+            self.population[index] = replacement
+            seen.add(replacement.genome_key())
+            replaced += 1
+
+        if replaced:
+            logging.info(f"Replaced {replaced} duplicate chromosomes.")
+            if self.replacement == "steady_state":
+                self._build_replacement_heap()
+            else:
+                self.population.sort(key=lambda c: c.fitness, reverse=True)
+        return replaced
+
+    def solve(self, budget, observers=()):
+        start_time = time.perf_counter()
+        statistics = self.run(
+            budget.generations,
+            max_evaluations=budget.max_evaluations,
+            time_limit=budget.time_limit,
+            observers=observers,
+        )
+        return SolverResult(
+            self.population[0],
+            statistics,
+            time.perf_counter() - start_time,
+            self.evaluations,
+        )
+
+    def run(
+        self,
+        generations,
+        max_evaluations=None,
+        time_limit=None,
+        observers=(),
+    ):
+        # observers receive a ProgressEvent with throughput and ETA after each
+        # generation.
+        # generations may be None when max_evaluations or time_limit bounds the run.
         logging.info(f"Running Genetic Algorithm for {generations} generations.")
-        mutation_probability = 0.2
         all_generation_statistics = []
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        progress = ProgressTracker(
+            observers,
+            generations=generations,
+            max_evaluations=max_evaluations,
+            time_limit=time_limit,
+            start_evaluations=self.evaluations,
+        )
+
+        if self.replacement == "steady_state":
+            self._build_replacement_heap()
 
-        for generation in range(generations):
+        generation_range = (
+            itertools.count() if generations is None else range(generations)
+        )
+        for generation in generation_range:
+            if max_evaluations is not None and self.evaluations >= max_evaluations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
             logging.info(f"Generation {generation + 1} started.")
-            self._evolve_population(mutation_probability)
+            self.generation = generation
+            mutation_probability = self.mutation_probability
+            if self.controller is not None:
+                self.controller.update_diversity(self.population)
+                mutation_probability = self.controller.mutation_probability
+            if self.replacement == "steady_state":
+                self._steady_state_generation(mutation_probability)
+            else:
+                self._evolve_population(mutation_probability)
+            if (
+                self.local_search is not None
+                and (generation + 1) % self.local_search_interval == 0
+            ):
+                self._refine_elites()
+            duplicates_replaced = 0
+            if self.duplicate_replacement is not None:
+                duplicates_replaced = self.replace_duplicates()
             summary_stats = self.compute_statistics()
             summary_stats["generation"] = generation + 1
+            summary_stats["duplicates_replaced"] = duplicates_replaced
+            summary_stats["evaluations"] = self.evaluations
+            if self.controller is not None:
+                summary_stats.update(self.controller.snapshot())
             all_generation_statistics.append(summary_stats)
+            progress.report(
+                generation + 1,
+                summary_stats["max_fitness"],
+                summary_stats["average_fitness"],
+                self.evaluations,
+            )
             logging.info(f"Generation {generation + 1} completed.")
 
+        if self.replacement == "steady_state":
+            # The heap only orders the worst member; sort once so that
+            # population[0] is the best chromosome, as in generational mode.
+            self.population.sort(key=lambda c: c.fitness, reverse=True)
+
         logging.info("Genetic Algorithm run completed.")
         return all_generation_statistics
 
     def _evolve_population(self, mutation_probability):
-        new_population = self._select_and_breed_population()
-        self._mutate_population(new_population, mutation_probability)
-        self.population = sorted(new_population, key=lambda c: c.fitness, reverse=True)
-
-    def _select_and_breed_population(self):
-        new_population = []
+        # Elites are carried over unchanged so the best fitness never regresses
+        new_population = [
+            elite.clone()
+            for elite in heapq.nlargest(
+                ELITE_COUNT, self.population, key=lambda c: c.fitness
+            )
+        ]
         new_population.extend(
-            sorted(self.population, key=lambda c: c.fitness, reverse=True)[:2]
+            self._breed_offspring(
+                len(self.population) - len(new_population), mutation_probability
+            )
         )
+        self.population = sorted(new_population, key=lambda c: c.fitness, reverse=True)
 
-        while len(new_population) < len(self.population):
-            parent1, parent2 = self.selection()
-            child = self.crossover(parent1, parent2)
-            new_population.append(child)
+    def _breed_offspring(self, count, mutation_probability):
+        if self.evaluator is None:
+            offspring = [self._breed_child() for _ in range(count)]
+            self._mutate_population(offspring, mutation_probability)
+            return offspring
 
-        return new_population
+        # Children are bred and mutated unscored, then evaluated in one batch
+        offspring = []
+        for _ in range(count):
+            parent1, parent2 = self.selection()
+            child = self.crossover(parent1, parent2, evaluate=False)
+            if random.random() < mutation_probability:
+                self._apply_mutation(child.genes, loads=child.teacher_loads())
+            offspring.append(child)
+        self.evaluator.evaluate(offspring)
+        return offspring
 
     def _mutate_population(self, population, mutation_probability):
         for chromosome in population:
             if random.random() < mutation_probability:
                 self.mutate(chromosome)
+
+    def _refine_elites(self):
+        logging.info(f"Refining top {self.local_search_top_k} chromosomes.")
+        elites = heapq.nlargest(
+            self.local_search_top_k, self.population, key=lambda c: c.fitness
+        )
+        for chromosome in elites:
+            self.local_search.refine(chromosome)
+
+        if self.replacement == "steady_state":
+            # Refined fitness values invalidate the heap keys
+            self._build_replacement_heap()
+
+    def _build_replacement_heap(self):
+        # Min-heap of (fitness, tie-breaker, population index) so the worst
+        # member is always at the top and can be replaced in O(log n).
+        self._heap_counter = itertools.count()
+        self._replacement_heap = [
+            (chromosome.fitness, next(self._heap_counter), index)
+            for index, chromosome in enumerate(self.population)
+        ]
+        heapq.heapify(self._replacement_heap)
+
+    def _steady_state_generation(self, mutation_probability):
+        # A steady-state "generation" breeds as many children as a
+        # generational step would, in batches of steady_state_batch_size.
+        children_per_generation = max(1, len(self.population) - ELITE_COUNT)
+        bred = 0
+        while bred < children_per_generation:
+            batch_size = min(
+                self.steady_state_batch_size, children_per_generation - bred
+            )
+            self._steady_state_step(mutation_probability, batch_size)
+            bred += batch_size
+
+    def _steady_state_step(self, mutation_probability, batch_size):
+        children = []
+        for _ in range(batch_size):
+            child = self._breed_child()
+            # Mutate children before insertion; population members are never
+            # mutated in place, so the heap ordering stays valid.
+            if random.random() < mutation_probability:
+                self.mutate(child)
+            children.append(child)
+
+        for child in children:
+            worst_fitness, _, worst_index = self._replacement_heap[0]
+            if child.fitness <= worst_fitness:
+                continue
+            self.population[worst_index] = child
+            heapq.heapreplace(
+                self._replacement_heap,
+                (child.fitness, next(self._heap_counter), worst_index),
+            )
@@ -0,0 +1,243 @@
+import random
+import logging
+from collections import Counter, deque
+
+
+def day_flags(time_slot):
+    # Same day classification as Chromosome.evaluate_fitness
+    description = time_slot["Description"]
+    is_mwf = any(day in description for day in ["M", "W", "F"])
+    is_tr = any(day in description for day in ["T", "R"])
+    return int(is_mwf), int(is_tr)
+
+
+class IncrementalFitness:
+    """
+    Maintains the counters behind Chromosome.evaluate_fitness (day counts,
+    teacher loads and load deviation) so the fitness after a single gene
+    change can be computed in O(1) instead of re-scanning every gene.
+    """
+
+    def __init__(self, ga, genes):
+        # Imported here because genetic_algorithm imports this module
+        from src.algorithms.genetic_algorithm import Chromosome
+
+        self.gene_key = Chromosome.gene_key
+        self.ga = ga
+        self.genes = list(genes)
+        self.reference_keys = ga.reference_keys or [None] * len(self.genes)
+        self.churn = 0  # Sections moved away from a warm-start schedule
+        self.mwf_count = 0
+        self.tr_count = 0
+        self.loads = {teacher_id: 0 for teacher_id in ga.teacher_preferences}
+        self.occupied = Counter()  # (room, time slot) -> number of sections
+
+        for index, gene in enumerate(self.genes):
+            self.churn += self._moved(index, gene)
+            mwf, tr = day_flags(gene[2])
+            self.mwf_count += mwf
+            self.tr_count += tr
+            self.loads[gene[3]] += 1
+            self.occupied[self._slot_key(gene)] += 1
+
+        self.deviation = sum(
+            abs(load - self._ideal_load(teacher_id))
+            for teacher_id, load in self.loads.items()
+        )
+
+    def _moved(self, index, gene):
+        reference_key = self.reference_keys[index]
+        return int(reference_key is not None and self.gene_key(gene) != reference_key)
+
+    @staticmethod
+    def _slot_key(gene):
+        return gene[1]["Room Number"], gene[2]["Time Slot ID"]
+
+    def _ideal_load(self, teacher_id):
+        preferences = self.ga.teacher_preferences[teacher_id]
+        return (preferences["Min Sections"] + preferences["Max Sections"]) / 2
+
+    def _satisfaction(self, gene):
+        course, _, _, teacher_id = gene
+        return self.ga.section_satisfaction[teacher_id][course["Course Section ID"]]
+
+    def _combine(self, mwf_count, tr_count, deviation, churn, last_gene):
+        balance_score = 1 / (1 + abs(mwf_count - tr_count))
+        load_balance_score = deviation / len(self.genes)
+        satisfaction_score = self._satisfaction(last_gene)
+        return (
+            self.ga.omega1 * balance_score
+            + self.ga.omega2 * load_balance_score
+            + self.ga.omega3 * satisfaction_score
+            - self.ga.churn_penalty * churn / len(self.genes)
+        )
+
+    def fitness(self):
+        return self._combine(
+            self.mwf_count, self.tr_count, self.deviation, self.churn, self.genes[-1]
+        )
+
+    def _counters_after(self, index, new_gene):
+        old_gene = self.genes[index]
+        old_mwf, old_tr = day_flags(old_gene[2])
+        new_mwf, new_tr = day_flags(new_gene[2])
+        mwf_count = self.mwf_count - old_mwf + new_mwf
+        tr_count = self.tr_count - old_tr + new_tr
+
+        deviation = self.deviation
+        old_teacher, new_teacher = old_gene[3], new_gene[3]
+        if old_teacher != new_teacher:
+            for teacher_id, change in ((old_teacher, -1), (new_teacher, 1)):
+                load = self.loads[teacher_id]
+                ideal = self._ideal_load(teacher_id)
+                deviation += abs(load + change - ideal) - abs(load - ideal)
+
+        churn = self.churn - self._moved(index, old_gene) + self._moved(index, new_gene)
+        return mwf_count, tr_count, deviation, churn
+
+    def fitness_after(self, index, new_gene):
+        """Fitness the chromosome would have if genes[index] became new_gene."""
+        counters = self._counters_after(index, new_gene)
+        last_gene = new_gene if index == len(self.genes) - 1 else self.genes[-1]
+        return self._combine(*counters, last_gene)
+
+    def is_feasible(self, index, new_gene):
+        """
+        A move may not double-book a room or exceed a teacher's Max Sections;
+        feasibility-preserving runs also keep teachers at their Min Sections.
+        """
+        old_gene = self.genes[index]
+        new_key = self._slot_key(new_gene)
+        if new_key != self._slot_key(old_gene) and self.occupied[new_key] > 0:
+            return False
+        teacher_id = new_gene[3]
+        if teacher_id != old_gene[3]:
+            if self.ga.feasibility_preserving:
+                return self.ga.teacher_move_feasible(
+                    self.loads, old_gene[3], teacher_id
+                )
+            max_sections = self.ga.teacher_preferences[teacher_id]["Max Sections"]
+            if self.loads[teacher_id] + 1 > max_sections:
+                return False
+        return True
+
+    def apply(self, index, new_gene):
+        old_gene = self.genes[index]
+        (
+            self.mwf_count,
+            self.tr_count,
+            self.deviation,
+            self.churn,
+        ) = self._counters_after(index, new_gene)
+        self.loads[old_gene[3]] -= 1
+        self.loads[new_gene[3]] += 1
+        self.occupied[self._slot_key(old_gene)] -= 1
+        self.occupied[self._slot_key(new_gene)] += 1
+        self.genes[index] = new_gene
+
+
+class LocalSearch:
+    """
+    Tabu search over the room, time-slot and teacher reassignment
+    neighborhoods of a chromosome, evaluated incrementally.
+
+    With tabu_tenure=0 it degenerates to steepest-ascent hill climbing and
+    stops at the first local optimum.
+    """
+
+    NEIGHBORHOODS = ("room", "slot", "teacher")
+
+    def __init__(
+        self,
+        ga,  # GeneticAlgorithm instance providing the instance data and weights
+        max_iterations=50,  # Moves applied per refinement
+        neighborhood_sample=100,  # Candidate moves examined per iteration
+        tabu_tenure=7,  # Iterations a changed (gene, attribute) stays tabu
+        patience=15,  # Stop after this many iterations without a new best
+    ):
+        self.ga = ga
+        self.max_iterations = max_iterations
+        self.neighborhood_sample = neighborhood_sample
+        self.tabu_tenure = tabu_tenure
+        self.patience = patience
+
+    def random_move(self, genes):
+        index = random.randrange(len(genes))
+        course, room, time_slot, teacher_id = genes[index]
+        neighborhood = random.choice(self.NEIGHBORHOODS)
+        rooms, time_slots = self.ga.rooms_and_slots(teacher_id)
+        if neighborhood == "room":
+            new_gene = (course, random.choice(rooms), time_slot, teacher_id)
+        elif neighborhood == "slot":
+            new_gene = (course, room, random.choice(time_slots), teacher_id)
+        else:
+            new_teacher = random.choice(self.ga.section_teachers(course))
+            new_gene = (course, room, time_slot, new_teacher)
+            if not self.ga.in_domain(new_gene):
+                # The section moves along with the teacher; is_feasible
+                # rejects the move if the new room and slot are taken
+                rooms, time_slots = self.ga.rooms_and_slots(new_teacher)
+                new_gene = (
+                    course,
+                    random.choice(rooms),
+                    random.choice(time_slots),
+                    new_teacher,
+                )
+        return index, neighborhood, new_gene
+
+    def refine(self, chromosome):
+        """
+        Improve a chromosome in place and return the fitness gain.
+
+        :param chromosome: The chromosome to refine; its genes are replaced by
+            the best schedule found and its fitness is re-evaluated.
+        """
+        state = IncrementalFitness(self.ga, chromosome.genes)
+        current_fitness = state.fitness()
+        start_fitness = current_fitness
+        best_fitness, best_genes = current_fitness, list(state.genes)
+        tabu = deque(maxlen=self.tabu_tenure) if self.tabu_tenure else None
+        stale_iterations = 0
+
+        for _ in range(self.max_iterations):
+            best_move = None
+            for _ in range(self.neighborhood_sample):
+                index, neighborhood, new_gene = self.random_move(state.genes)
+                if new_gene == state.genes[index] or not state.is_feasible(
+                    index, new_gene
+                ):
+                    continue
+                move_fitness = state.fitness_after(index, new_gene)
+                is_tabu = tabu is not None and (index, neighborhood) in tabu
+                # Aspiration: a tabu move is allowed if it beats the best so far
+                if is_tabu and move_fitness <= best_fitness:
+                    continue
+                if best_move is None or move_fitness > best_move[0]:
+                    best_move = (move_fitness, index, neighborhood, new_gene)
+
+            if best_move is None:
+                break
+            move_fitness, index, neighborhood, new_gene = best_move
+            if tabu is None and move_fitness <= current_fitness:
+                break  # Hill climbing reached a local optimum
+
+            state.apply(index, new_gene)
+            current_fitness = move_fitness
+            if tabu is not None:
+                tabu.append((index, neighborhood))
+
+            if current_fitness > best_fitness:
+                best_fitness, best_genes = current_fitness, list(state.genes)
+                stale_iterations = 0
+            else:
+                stale_iterations += 1
+                if stale_iterations >= self.patience:
+                    break
+
+        chromosome.genes = best_genes
+        chromosome.evaluate_fitness()
+        logging.debug(
+            f"Local search improved fitness from {start_fitness} to "
+            f"{chromosome.fitness}"
+        )
+        return chromosome.fitness - start_fitness
@@ -0,0 +1,165 @@
+import random
+import logging
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+
+
+def mean_satisfaction_rating(chromosome):
+    # Mean teacher rating over all sections; 0 is the most preferred
+    satisfaction = chromosome.ga.section_satisfaction
+    return sum(
+        satisfaction[gene[3]][gene[0]["Course Section ID"]] for gene in chromosome.genes
+    ) / len(chromosome.genes)
+
+
+def pareto_objectives(chromosome):
+    """
+    The criteria NSGA2 trades off, oriented so that each is maximized: day
+    balance, the negated teacher load deviation and the negated mean
+    satisfaction rating.
+    """
+    balance_score, load_deviation, _ = chromosome.objectives
+    return (balance_score, -load_deviation, -mean_satisfaction_rating(chromosome))
+
+
+def dominates(objectives1, objectives2):
+    # All criteria are maximized; see pareto_objectives
+    return all(a >= b for a, b in zip(objectives1, objectives2)) and any(
+        a > b for a, b in zip(objectives1, objectives2)
+    )
+
+
+def fast_non_dominated_sort(objectives):
+    """
+    Sort objective vectors into Pareto fronts (Deb et al., 2002).
+
+    :param objectives: A list of objective tuples.
+    :return: A list of fronts, each a list of indices into objectives.
+    """
+    dominated_by = [[] for _ in objectives]  # Solutions each one dominates
+    domination_count = [0] * len(objectives)
+
+    for p in range(len(objectives)):
+        for q in range(p + 1, len(objectives)):
+            if dominates(objectives[p], objectives[q]):
+                dominated_by[p].append(q)
+                domination_count[q] += 1
+            elif dominates(objectives[q], objectives[p]):
+                dominated_by[q].append(p)
+                domination_count[p] += 1
+
+    fronts = [[p for p in range(len(objectives)) if domination_count[p] == 0]]
+    current = 0
+    while fronts[current]:
+        next_front = []
+        for p in fronts[current]:
+            for q in dominated_by[p]:
+                domination_count[q] -= 1
+                if domination_count[q] == 0:
+                    next_front.append(q)
+        current += 1
+        fronts.append(next_front)
+    return fronts[:-1]
+
+
+def crowding_distance(objectives, front):
+    """
+    Compute the crowding distance of every index in a front.
+
+    :param objectives: A list of objective tuples.
+    :param front: Indices into objectives belonging to a single front.
+    :return: A dictionary mapping index to crowding distance.
+    """
+    distance = {index: 0.0 for index in front}
+    if len(front) <= 2:
+        return {index: float("inf") for index in front}
+
+    for m in range(len(objectives[front[0]])):
+        ordered = sorted(front, key=lambda index: objectives[index][m])
+        low, high = objectives[ordered[0]][m], objectives[ordered[-1]][m]
+        distance[ordered[0]] = distance[ordered[-1]] = float("inf")
+        if high == low:
+            continue
+        for position in range(1, len(ordered) - 1):
+            distance[ordered[position]] += (
+                objectives[ordered[position + 1]][m]
+                - objectives[ordered[position - 1]][m]
+            ) / (high - low)
+    return distance
+
+
+class NSGA2(GeneticAlgorithm):
+    """
+    Multi-objective variant of the GA that evolves a Pareto front over the
+    day balance, teacher load deviation and mean satisfaction rating
+    criteria instead of their omega-weighted sum. The omegas are still used for the scalar fitness
+    reported in the statistics and for ordering the population.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if kwargs.get("replacement", "generational") != "generational":
+            raise ValueError("NSGA2 only supports generational replacement")
+        super().__init__(*args, **kwargs)
+        self.population = self._environmental_selection(self.population)
+
+    def _rank_population(self, population):
+        objectives = [pareto_objectives(chromosome) for chromosome in population]
+        fronts = fast_non_dominated_sort(objectives)
+        for rank, front in enumerate(fronts):
+            distances = crowding_distance(objectives, front)
+            for index in front:
+                population[index].rank = rank
+                population[index].crowding_distance = distances[index]
+        return fronts
+
+    def _environmental_selection(self, candidates):
+        # Fill the next population front by front; the last front that does
+        # not fit entirely is truncated by descending crowding distance.
+        fronts = self._rank_population(candidates)
+        survivors = []
+        for front in fronts:
+            members = sorted(
+                (candidates[index] for index in front),
+                key=lambda c: (c.crowding_distance, c.fitness),
+                reverse=True,
+            )
+            survivors.extend(members[: self.population_size - len(survivors)])
+            if len(survivors) >= self.population_size:
+                break
+        # Ordering by weighted fitness keeps population[0] meaningful for the
+        # single-schedule export.
+        return sorted(survivors, key=lambda c: c.fitness, reverse=True)
+
+    def _crowded_tournament(self):
+        contender1, contender2 = random.sample(self.population, 2)
+        if contender1.rank != contender2.rank:
+            return contender1 if contender1.rank < contender2.rank else contender2
+        if contender1.crowding_distance >= contender2.crowding_distance:
+            return contender1
+        return contender2
+
+    def selection(self):
+        logging.debug("Selecting parents by crowded binary tournament.")
+        return self._crowded_tournament(), self._crowded_tournament()
+
+    def _evolve_population(self, mutation_probability):
+        # Only offspring are mutated, so parents survive unchanged into the
+        # combined pool and the front can never regress.
+        offspring = self._breed_offspring(self.population_size, mutation_probability)
+        self.population = self._environmental_selection(self.population + offspring)
+
+    def replace_duplicates(self):
+        replaced = super().replace_duplicates()
+        if replaced:
+            # Fresh members have no rank or crowding distance yet
+            self._rank_population(self.population)
+        return replaced
+
+    def pareto_front(self):
+        """Return the distinct non-dominated chromosomes of the population."""
+        front, seen = [], set()
+        for chromosome in self.population:
+            key = chromosome.genome_key()
+            if chromosome.rank == 0 and key not in seen:
+                seen.add(key)
+                front.append(chromosome)
+        return sorted(front, key=lambda c: c.fitness, reverse=True)
@@ -0,0 +1,310 @@
+import os
+import logging
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from src.algorithms.local_search import day_flags
+
+
+class SharedArrays:
+    """
+    NumPy arrays stored in named shared memory blocks. The handle is a small
+    picklable description that other processes use to attach to the same
+    memory without copying it.
+    """
+
+    def __init__(self, blocks, arrays, owner):
+        self.blocks = blocks  # Array name -> SharedMemory block
+        self.arrays = arrays  # Array name -> ndarray view of its block
+        self.owner = owner  # Only the creating process unlinks the blocks
+
+    @classmethod
+    def create(cls, arrays):
+        blocks, views = {}, {}
+        for name, array in arrays.items():
+            # Zero-size blocks are not allowed, so empty arrays get one byte
+            block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[...] = array
+            blocks[name], views[name] = block, view
+        return cls(blocks, views, owner=True)
+
+    @classmethod
+    def attach(cls, handle):
+        blocks, views = {}, {}
+        for name, (block_name, shape, dtype) in handle.items():
+            block = shared_memory.SharedMemory(name=block_name)
+            blocks[name] = block
+            views[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        return cls(blocks, views, owner=False)
+
+    @property
+    def handle(self):
+        return {
+            name: (self.blocks[name].name, array.shape, array.dtype.str)
+            for name, array in self.arrays.items()
+        }
+
+    def close(self):
+        # Views must be released before the memory can be unmapped
+        self.arrays = {}
+        for block in self.blocks.values():
+            block.close()
+            if self.owner:
+                block.unlink()
+        self.blocks = {}
+
+
+def compile_instance(ga):
+    """
+    Compile the GA's instance and fitness weights into flat NumPy arrays.
+
+    Genes are encoded positionally: row i of a genome holds the room, time
+    slot and teacher indices of course_sections[i].
+
+    :return: A dictionary of arrays accepted by evaluate_genomes.
+    """
+    room_index = {room["Room Number"]: i for i, room in enumerate(ga.classrooms)}
+    slot_index = {slot["Time Slot ID"]: i for i, slot in enumerate(ga.time_slots)}
+    teacher_index = {tid: i for i, tid in enumerate(ga.teacher_preferences)}
+    flags = np.array([day_flags(slot) for slot in ga.time_slots], dtype=np.int64)
+
+    # Sections without a published assignment are never counted as moved;
+    # references to rooms, slots or teachers that no longer exist always are.
+    section_count = len(ga.course_sections)
+    reference = np.full((section_count, 3), -1, dtype=np.int32)
+    has_reference = np.zeros(section_count, dtype=bool)
+    for index, key in enumerate(ga.reference_keys or []):
+        if key is not None:
+            has_reference[index] = True
+            reference[index] = (
+                room_index.get(key[1], -1),
+                slot_index.get(key[2], -1),
+                teacher_index.get(key[3], -1),
+            )
+
+    return {
+        "slot_mwf": flags[:, 0].copy(),
+        "slot_tr": flags[:, 1].copy(),
+        "ideal_load": np.array(
+            [
+                (preferences["Min Sections"] + preferences["Max Sections"]) / 2
+                for preferences in ga.teacher_preferences.values()
+            ],
+            dtype=np.float64,
+        ),
+        "satisfaction": np.array(
+            [
+                [
+                    ga.section_satisfaction[tid][section["Course Section ID"]]
+                    for section in ga.course_sections
+                ]
+                for tid in ga.teacher_preferences
+            ],
+            dtype=np.float64,
+        ),
+        "reference": reference,
+        "has_reference": has_reference,
+        "weights": np.array(
+            [ga.omega1, ga.omega2, ga.omega3, ga.churn_penalty], dtype=np.float64
+        ),
+    }
+
+
+def evaluate_genomes(instance, genomes):
+    """
+    Vectorized Chromosome.evaluate_fitness over a batch of encoded genomes.
+
+    :param instance: Arrays built by compile_instance.
+    :param genomes: An int array of shape (chromosomes, sections, 3).
+    :return: A (fitness, objectives) tuple of arrays with one row per genome.
+    """
+    genome_count, section_count, _ = genomes.shape
+    slots, teachers = genomes[:, :, 1], genomes[:, :, 2]
+    teacher_count = len(instance["ideal_load"])
+
+    mwf_count = instance["slot_mwf"][slots].sum(axis=1)
+    tr_count = instance["slot_tr"][slots].sum(axis=1)
+    balance_score = 1 / (1 + np.abs(mwf_count - tr_count))
+
+    # One bincount over row-offset teacher indices counts every genome's loads
+    offsets = teachers + np.arange(genome_count)[:, None] * teacher_count
+    loads = np.bincount(offsets.ravel(), minlength=genome_count * teacher_count)
+    loads = loads.reshape(genome_count, teacher_count)
+    deviation = np.abs(loads - instance["ideal_load"]).sum(axis=1)
+    load_balance_score = deviation / section_count
+
+    # The satisfaction criterion is that of the last gene, as in the GA
+    satisfaction_score = instance["satisfaction"][teachers[:, -1], section_count - 1]
+
+    omega1, omega2, omega3, churn_penalty = instance["weights"]
+    fitness = (
+        omega1 * balance_score
+        + omega2 * load_balance_score
+        + omega3 * satisfaction_score
+    )
+    if churn_penalty:
+        moved = (genomes != instance["reference"]).any(axis=2)
+        churn = (moved & instance["has_reference"]).sum(axis=1)
+        fitness = fitness - churn_penalty * churn / section_count
+
+    objectives = np.stack([balance_score, load_balance_score, satisfaction_score], 1)
+    return fitness, objectives
+
+
+class GenomeEncoder:
+    """
+    Encodes chromosomes positionally, as expected by evaluate_genomes: row i
+    holds the room, time slot and teacher indices of course_sections[i].
+    """
+
+    def __init__(self, ga):
+        self.section_count = len(ga.course_sections)
+        self.room_index = {
+            room["Room Number"]: i for i, room in enumerate(ga.classrooms)
+        }
+        self.slot_index = {
+            slot["Time Slot ID"]: i for i, slot in enumerate(ga.time_slots)
+        }
+        self.teacher_index = {tid: i for i, tid in enumerate(ga.teacher_preferences)}
+
+    def encode(self, chromosome, out):
+        for index, (_, room, time_slot, teacher_id) in enumerate(chromosome.genes):
+            out[index] = (
+                self.room_index[room["Room Number"]],
+                self.slot_index[time_slot["Time Slot ID"]],
+                self.teacher_index[teacher_id],
+            )
+
+    def encode_batch(self, chromosomes):
+        genomes = np.zeros((len(chromosomes), self.section_count, 3), dtype=np.int32)
+        for row, chromosome in enumerate(chromosomes):
+            self.encode(chromosome, genomes[row])
+        return genomes
+
+
+# Shared blocks attached by each worker process
+_worker_instance = None
+_worker_genomes = None
+
+
+def _attach_instance(instance_handle):
+    global _worker_instance
+    _worker_instance = SharedArrays.attach(instance_handle)
+
+
+def _evaluate_rows(genomes_handle, start, stop):
+    # The genome buffer is reallocated when the population grows, so workers
+    # re-attach whenever the parent hands them a different block
+    global _worker_genomes
+    if _worker_genomes is None or _worker_genomes.handle != genomes_handle:
+        if _worker_genomes is not None:
+            _worker_genomes.close()
+        _worker_genomes = SharedArrays.attach(genomes_handle)
+    genomes = _worker_genomes.arrays["genomes"][start:stop]
+    return start, evaluate_genomes(_worker_instance.arrays, genomes)
+
+
+class ParallelEvaluator:
+    """
+    Scores batches of chromosomes in worker processes.
+
+    The compiled instance is placed in shared memory once and each worker
+    attaches to it at start-up; genomes are written to a shared buffer, so a
+    task only carries a block name and a row range instead of pickled
+    chromosomes and instance data.
+    """
+
+    def __init__(
+        self,
+        max_workers=None,  # Worker processes; 1 evaluates in-process
+        chunk_size=None,  # Genomes per task; defaults to an even split
+    ):
+        self.worker_count = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.ga = None
+        self.encoder = None
+        self.instance = None
+        self.genomes = None
+        self.executor = None
+
+    def bind(self, ga):
+        """
+        Compile the GA's instance into shared memory and start the workers.
+        Called by GeneticAlgorithm once its weights and reference are set.
+        """
+        self.close()
+        self.ga = ga
+        self.encoder = GenomeEncoder(ga)
+        self.instance = SharedArrays.create(compile_instance(ga))
+        if self.worker_count > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.worker_count,
+                initializer=_attach_instance,
+                initargs=(self.instance.handle,),
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _genome_buffer(self, count):
+        section_count = len(self.ga.course_sections)
+        if self.genomes is None or len(self.genomes.arrays["genomes"]) < count:
+            if self.genomes is not None:
+                self.genomes.close()
+            self.genomes = SharedArrays.create(
+                {"genomes": np.zeros((count, section_count, 3), dtype=np.int32)}
+            )
+        return self.genomes.arrays["genomes"]
+
+    def evaluate(self, chromosomes):
+        """
+        Set fitness and objectives of every chromosome from a batch evaluation.
+
+        :param chromosomes: Chromosomes whose genes are up to date.
+        """
+        if self.ga is None:
+            raise RuntimeError("The evaluator is not bound to a genetic algorithm")
+        if not chromosomes:
+            return
+        buffer = self._genome_buffer(len(chromosomes))
+        for row, chromosome in enumerate(chromosomes):
+            self.encoder.encode(chromosome, buffer[row])
+
+        if self.executor is None:
+            genomes = buffer[: len(chromosomes)]
+            results = [(0, evaluate_genomes(self.instance.arrays, genomes))]
+        else:
+            chunk_size = self.chunk_size or -(-len(chromosomes) // self.worker_count)
+            futures = [
+                self.executor.submit(
+                    _evaluate_rows,
+                    self.genomes.handle,
+                    start,
+                    min(start + chunk_size, len(chromosomes)),
+                )
+                for start in range(0, len(chromosomes), chunk_size)
+            ]
+            results = [future.result() for future in futures]
+
+        for start, (fitness, objectives) in results:
+            for offset in range(len(fitness)):
+                chromosomes[start + offset].assign_fitness(
+                    float(fitness[offset]), tuple(objectives[offset].tolist())
+                )
+        self.ga.evaluations += len(chromosomes)
+        logging.debug(f"Evaluated {len(chromosomes)} chromosomes in a batch.")
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.genomes is not None:
+            self.genomes.close()
+            self.genomes = None
+        if self.instance is not None:
+            self.instance.close()
+            self.instance = None
@@ -0,0 +1,136 @@
+import math
+import time
+import random
+import logging
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.local_search import IncrementalFitness, LocalSearch
+from src.algorithms.solver import Solver, SolverResult
+from src.utils.progress import ProgressTracker
+
+
+class SimulatedAnnealing(Solver):
+    """
+    Single-state simulated annealing over the same room, time-slot and
+    teacher moves as the memetic local search. Every step is scored with
+    IncrementalFitness, so a step costs O(1) instead of a full evaluation.
+    """
+
+    name = "simulated_annealing"
+
+    def __init__(
+        self,
+        course_sections,  # A list of course sections
+        classrooms,  # A list of classrooms
+        time_slots,  # A list of available time slots
+        teacher_preferences,  # A dictionary of teacher preferences
+        teacher_satisfaction,  # A dictionary of teacher satisfaction scores
+        omega1,  # Weight for day-of-week balance
+        omega2,  # Weight for teaching load balance
+        omega3,  # Weight for teacher satisfaction
+        initial_temperature=None,  # None calibrates from sampled moves
+        cooling_rate=0.995,  # Geometric cooling factor per temperature level
+        moves_per_temperature=100,  # Steps between temperature updates
+        **model_options,  # Extra GeneticAlgorithm options, e.g. seed_genes
+    ):
+        # A one-chromosome GA supplies the instance data, fitness weights and
+        # the starting schedule (random, greedy or warm-started).
+        self.model = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size=1,
+            omega1=omega1,
+            omega2=omega2,
+            omega3=omega3,
+            **model_options,
+        )
+        self.moves = LocalSearch(self.model)
+        self.initial_temperature = initial_temperature
+        self.cooling_rate = cooling_rate
+        self.moves_per_temperature = moves_per_temperature
+        self.evaluations = 0
+
+    def _calibrate_temperature(self, state, samples=100, acceptance=0.5):
+        # Choose T0 so an average worsening move is accepted with the given
+        # probability at the start of the run.
+        worsening = []
+        current_fitness = state.fitness()
+        for _ in range(samples):
+            index, _, new_gene = self.moves.random_move(state.genes)
+            delta = state.fitness_after(index, new_gene) - current_fitness
+            if delta < 0:
+                worsening.append(-delta)
+        if not worsening:
+            return 1.0
+        return (sum(worsening) / len(worsening)) / -math.log(acceptance)
+
+    def solve(self, budget, observers=()):
+        if budget.max_evaluations is None and budget.time_limit is None:
+            raise ValueError("Simulated annealing needs max_evaluations or time_limit")
+        start_time = time.perf_counter()
+        deadline = None if budget.time_limit is None else start_time + budget.time_limit
+
+        best = self.model.population[0]
+        state = IncrementalFitness(self.model, best.genes)
+        current_fitness = best_fitness = state.fitness()
+        best_genes = list(state.genes)
+        temperature = self.initial_temperature or self._calibrate_temperature(state)
+        progress = ProgressTracker(
+            observers,
+            max_evaluations=budget.max_evaluations,
+            time_limit=budget.time_limit,
+            start_evaluations=self.evaluations,
+        )
+        logging.info(f"Simulated annealing starting at temperature {temperature}")
+
+        statistics = []
+        accepted = 0
+        step = 0
+        while True:
+            if (
+                budget.max_evaluations is not None
+                and self.evaluations >= budget.max_evaluations
+            ):
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            index, _, new_gene = self.moves.random_move(state.genes)
+            step += 1
+            # Every sampled move counts against the budget, feasible or not
+            self.evaluations += 1
+            if new_gene != state.genes[index] and state.is_feasible(index, new_gene):
+                move_fitness = state.fitness_after(index, new_gene)
+                delta = move_fitness - current_fitness
+                if delta >= 0 or random.random() < math.exp(delta / temperature):
+                    state.apply(index, new_gene)
+                    current_fitness = move_fitness
+                    accepted += 1
+                    if current_fitness > best_fitness:
+                        best_fitness, best_genes = current_fitness, list(state.genes)
+
+            if step % self.moves_per_temperature == 0:
+                statistics.append(
+                    {
+                        "step": step,
+                        "temperature": temperature,
+                        "current_fitness": current_fitness,
+                        "max_fitness": best_fitness,
+                        "acceptance_rate": accepted / self.moves_per_temperature,
+                        "evaluations": self.evaluations,
+                    }
+                )
+                progress.report(
+                    len(statistics), best_fitness, current_fitness, self.evaluations
+                )
+                accepted = 0
+                temperature *= self.cooling_rate
+
+        best.genes = best_genes
+        best.evaluate_fitness()
+        logging.info(f"Simulated annealing finished with fitness {best.fitness}")
+        return SolverResult(
+            best, statistics, time.perf_counter() - start_time, self.evaluations
+        )
@@ -0,0 +1,48 @@
+import abc
+
+
+class Budget:
+    """
+    Stopping criteria for a solver run; a run stops at whichever limit is
+    reached first.
+    """
+
+    def __init__(
+        self,
+        generations=None,  # GA generations; ignored by single-state solvers
+        max_evaluations=None,  # Fitness evaluations, full or incremental
+        time_limit=None,  # Wall-clock seconds
+    ):
+        if generations is None and max_evaluations is None and time_limit is None:
+            raise ValueError("A budget needs at least one limit")
+        self.generations = generations
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+
+
+class SolverResult:
+    def __init__(self, best, statistics, runtime_seconds, evaluations):
+        self.best = best  # Best Chromosome found
+        self.statistics = statistics  # A list of per-iteration statistics
+        self.runtime_seconds = runtime_seconds
+        self.evaluations = evaluations
+
+
+class Solver(abc.ABC):
+    """
+    Common interface of the scheduling engines, so callers and exporters
+    only depend on solve() and the returned SolverResult.
+    """
+
+    name = "solver"
+
+    @abc.abstractmethod
+    def solve(self, budget, observers=()):
+        """
+        Search for a schedule within the given budget.
+
+        :param budget: A Budget limiting the run.
+        :param observers: Callables that receive a ProgressEvent after every
+            generation or temperature level.
+        :return: A SolverResult with the best chromosome and statistics.
+        """
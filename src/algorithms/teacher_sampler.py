@@ -0,0 +1,48 @@
+import random
+import itertools
+
+
+class TeacherSampler:
+    """
+    Draws a teacher for one course section with probability proportional to
+    fixed weights, skipping teachers who already teach their Max Sections.
+
+    The cumulative weights are built once, so a draw is a binary search plus
+    a rejection test instead of rebuilding the eligible list and weights.
+    """
+
+    def __init__(
+        self,
+        teacher_ids,  # Candidate teacher IDs
+        weights,  # Positive sampling weight of each teacher
+        max_attempts=20,  # Rejected draws before falling back to an exact draw
+    ):
+        self.teacher_ids = list(teacher_ids)
+        self.weights = list(weights)
+        self.cumulative_weights = list(itertools.accumulate(self.weights))
+        self.max_attempts = max_attempts
+
+    def sample(self, teacher_loads, max_sections):
+        """
+        :param teacher_loads: Sections assigned so far, keyed by teacher ID.
+        :param max_sections: Max Sections of each teacher, keyed by teacher ID.
+        :return: A teacher below their limit, or any teacher when all are full.
+        """
+        for _ in range(self.max_attempts):
+            teacher_id = random.choices(
+                self.teacher_ids, cum_weights=self.cumulative_weights
+            )[0]
+            if teacher_loads[teacher_id] < max_sections[teacher_id]:
+                return teacher_id
+
+        # Most of the weight belongs to saturated teachers, so draw from the
+        # eligible teachers directly
+        eligible = [
+            index
+            for index, teacher_id in enumerate(self.teacher_ids)
+            if teacher_loads[teacher_id] < max_sections[teacher_id]
+        ] or range(len(self.teacher_ids))
+        index = random.choices(
+            eligible, weights=[self.weights[index] for index in eligible]
+        )[0]
+        return self.teacher_ids[index]
@@ -0,0 +1,4 @@
+#                                    _    #
+#    _  _   _   )     o  _   _  o _)_ )   #
+#   (_ (_) (_) (  o   ( ) ) ) ) ( (_ o    #
+#                 /                       #
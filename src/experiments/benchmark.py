@@ -0,0 +1,230 @@
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import datetime
+import platform
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.utils.data_loader import DataLoader
+
+# Fixed benchmark cases: (data set, population size, generations)
+DEFAULT_CASES = [
+    ("Simulated_Data.xlsx", 50, 30),
+    ("CPP_Real_World_Data.xlsx", 50, 30),
+]
+
+# Whether a metric should go down or up, and the relative change tolerated
+# in the wrong direction before it counts as a regression
+METRICS = {
+    "wall_time_seconds": ("lower", 0.2),
+    "evaluations_per_second": ("higher", 0.2),
+    "peak_memory_mb": ("lower", 0.2),
+    "final_fitness": ("higher", 0.0),
+}
+
+
+def _peak_memory_mb():
+    # resource is Unix-only; ru_maxrss is in kilobytes on Linux and in
+    # bytes on macOS
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_case(data, seed, population_size, generations):
+    """
+    Run the GA once and measure it; data loading is not timed.
+
+    :return: A result row with the case and its metrics.
+    """
+    instance = DataLoader(data).load_columnar_instance().to_solver_instance()
+    random.seed(seed)
+
+    start_time = time.perf_counter()
+    ga = GeneticAlgorithm(
+        **instance,
+        population_size=population_size,
+        omega1=0.3,
+        omega2=0.3,
+        omega3=0.4,
+    )
+    ga.run(generations)
+    wall_time = time.perf_counter() - start_time
+
+    return {
+        "data": data,
+        "seed": seed,
+        "population_size": population_size,
+        "generations": generations,
+        "wall_time_seconds": wall_time,
+        "evaluations_per_second": ga.evaluations / wall_time,
+        "peak_memory_mb": _peak_memory_mb(),
+        "final_fitness": max(c.fitness for c in ga.population),
+    }
+
+
+def run_benchmark(cases, seeds, isolated=True):
+    """
+    Run every case with every seed, one at a time so runs do not compete
+    for CPU time.
+
+    :param isolated: Run each case in a freshly spawned process, so its peak
+        memory is not inflated by earlier cases or the caller.
+    :return: A list of result rows.
+    """
+    configurations = [
+        (data, seed, population_size, generations)
+        for data, population_size, generations in cases
+        for seed in seeds
+    ]
+    if not isolated:
+        return [run_case(*configuration) for configuration in configurations]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for configuration in configurations:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(run_case, *configuration).result())
+        logging.info(f"Benchmarked {configuration}.")
+    return results
+
+
+def _current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark_record(results):
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": _current_commit(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "results": results,
+    }
+
+
+def append_history(record, history_path):
+    # One JSON record per line, so earlier runs are never rewritten
+    with open(history_path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def load_history(history_path):
+    if not os.path.exists(history_path):
+        return []
+    with open(history_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _case_key(row):
+    return (row["data"], row["seed"], row["population_size"], row["generations"])
+
+
+def compare(results, baseline_results, tolerances=None):
+    """
+    Compare result rows against a baseline's rows for the same cases.
+
+    :param tolerances: Metric name -> tolerated relative change, overriding
+        the defaults in METRICS.
+    :return: A list of regressions, each a dictionary with the case, metric,
+        baseline and latest value and relative change.
+    """
+    tolerances = {name: tolerance for name, (_, tolerance) in METRICS.items()} | (
+        tolerances or {}
+    )
+    baseline = {_case_key(row): row for row in baseline_results}
+    regressions = []
+    for row in results:
+        reference = baseline.get(_case_key(row))
+        if reference is None:
+            continue
+        for metric, (direction, _) in METRICS.items():
+            old, new = reference[metric], row[metric]
+            change = (new - old) / abs(old) if old else 0.0
+            worse = (
+                change > tolerances[metric]
+                if direction == "lower"
+                else (change < -tolerances[metric])
+            )
+            if worse:
+                regressions.append(
+                    {
+                        "data": row["data"],
+                        "seed": row["seed"],
+                        "metric": metric,
+                        "baseline": old,
+                        "latest": new,
+                        "change": change,
+                    }
+                )
+    return regressions
+
+
+def _parse_tolerance(text):
+    metric, _, value = text.partition("=")
+    if metric not in METRICS or not value:
+        raise argparse.ArgumentTypeError(
+            f"tolerance must be metric=value with metric in {list(METRICS)}"
+        )
+    return metric, float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the genetic algorithm and check for regressions."
+    )
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--history", default="data/benchmark_history.jsonl")
+    parser.add_argument("--baseline", default="data/benchmark_baseline.json")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the baseline instead of comparing against it.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=_parse_tolerance,
+        action="append",
+        default=[],
+        help="A metric=relative_change override; repeat for several.",
+    )
+    args = parser.parse_args(argv)
+
+    record = benchmark_record(run_benchmark(DEFAULT_CASES, args.seeds))
+    append_history(record, args.history)
+    print(f"Benchmark results appended to '{args.history}'.")
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as f:
+            json.dump(record, f, indent=2)
+        print(f"Baseline saved to '{args.baseline}'.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(record["results"], baseline["results"], dict(args.tolerance))
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['data']} seed {regression['seed']}: "
+            f"{regression['metric']} {regression['baseline']:.4g} -> "
+            f"{regression['latest']:.4g} ({regression['change']:+.1%})"
+        )
+    if not regressions:
+        print(f"No regressions against the baseline from {baseline['timestamp']}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+import json
+import math
+import random
+import logging
+import argparse
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.solver import Budget
+from src.utils.data_loader import DataLoader
+
+# Values tried for each tunable GeneticAlgorithm option
+DEFAULT_SPACE = {
+    "population_size": [20, 50, 100, 200],
+    "tournament_size": [2, 3, 5, 7],
+    "mutation_probability": [0.05, 0.1, 0.2, 0.3, 0.5],
+    "replacement": ["generational", "steady_state"],
+}
+
+# Fitness terms that are attributes of the GA rather than constructor options
+PENALTY_WEIGHTS = ("preference_weight", "deviation_penalty", "balance_penalty_weight")
+
+# Instance data of the current worker process, set once by _init_worker
+_worker_instance = None
+
+
+def sample_configurations(space, count, seed=0):
+    """
+    Draw distinct configurations from a search space.
+
+    :param space: Option name -> list of candidate values.
+    :param count: Number of configurations; fewer if the space is smaller.
+    :param seed: Seed of the sampling, independent of the runs' seeds.
+    :return: A list of option dictionaries.
+    """
+    rng = random.Random(seed)
+    names = sorted(space)
+    size = math.prod(len(space[name]) for name in names)
+    configurations, seen = [], set()
+    while len(configurations) < min(count, size):
+        values = tuple(rng.choice(space[name]) for name in names)
+        if values not in seen:
+            seen.add(values)
+            configurations.append(dict(zip(names, values)))
+    return configurations
+
+
+def _rank(values):
+    # Rank 1 is the highest value; ties share their average rank
+    order = sorted(range(len(values)), key=lambda i: values[i], reverse=True)
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def _chi_square_survival(statistic, degrees_of_freedom):
+    # Wilson-Hilferty normal approximation of the chi-square upper tail
+    k = degrees_of_freedom
+    z = ((statistic / k) ** (1 / 3) - (1 - 2 / (9 * k))) / math.sqrt(2 / (9 * k))
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def eliminate(scores, alpha=0.05):
+    """
+    Friedman test over the seeds run so far; when the candidates differ
+    significantly, drop those whose mean rank is worse than the best one's
+    by more than the Bonferroni-Dunn critical difference.
+
+    :param scores: One list of best fitnesses per candidate, aligned by seed.
+    :param alpha: Significance level of both tests.
+    :return: Indices of the surviving candidates.
+    """
+    candidate_count, block_count = len(scores), len(scores[0])
+    if candidate_count < 2:
+        return list(range(candidate_count))
+    blocks = [_rank([row[block] for row in scores]) for block in range(block_count)]
+    mean_ranks = [
+        sum(block[index] for block in blocks) / block_count
+        for index in range(candidate_count)
+    ]
+
+    # Friedman statistic with the usual correction for ties
+    k, n = candidate_count, block_count
+    rank_sum_squares = sum((rank * n) ** 2 for rank in mean_ranks)
+    squared_ranks = sum(rank**2 for block in blocks for rank in block)
+    denominator = squared_ranks - n * k * (k + 1) ** 2 / 4
+    if denominator <= 0:
+        return list(range(candidate_count))
+    statistic = (k - 1) * (rank_sum_squares - n**2 * k * (k + 1) ** 2 / 4) / denominator
+    if _chi_square_survival(statistic, k - 1) >= alpha:
+        return list(range(candidate_count))
+
+    critical_difference = statistics.NormalDist().inv_cdf(
+        1 - alpha / (k - 1)
+    ) * math.sqrt(k * (k + 1) / (6 * n))
+    best_rank = min(mean_ranks)
+    return [
+        index
+        for index, rank in enumerate(mean_ranks)
+        if rank - best_rank <= critical_difference
+    ]
+
+
+def _init_worker(instance):
+    # The instance is pickled once per worker process instead of per task
+    global _worker_instance
+    _worker_instance = instance
+
+
+def _run_candidate(configuration, seed, omegas, generations, time_limit, instance=None):
+    instance = instance if instance is not None else _worker_instance
+    omega1, omega2, omega3 = omegas
+    options = {k: v for k, v in configuration.items() if k not in PENALTY_WEIGHTS}
+    random.seed(seed)
+
+    ga = GeneticAlgorithm(
+        **instance, omega1=omega1, omega2=omega2, omega3=omega3, **options
+    )
+    for name in PENALTY_WEIGHTS:
+        if name in configuration:
+            setattr(ga, name, configuration[name])
+    result = ga.solve(Budget(generations=generations, time_limit=time_limit))
+    return {
+        "best_fitness": result.best.fitness,
+        "evaluations": result.evaluations,
+        "runtime_seconds": result.runtime_seconds,
+    }
+
+
+def race(
+    instance,  # Solver inputs, as returned by DataLoader.load_instance
+    configurations,  # Candidate GA options, e.g. from sample_configurations
+    seeds,  # Seeds run in order, one racing round each
+    omegas=(0.3, 0.3, 0.4),  # Fixed objective every candidate is judged on
+    generations=None,  # Generation limit of each run
+    time_limit=None,  # Wall-clock limit of each run in seconds
+    min_rounds=3,  # Seeds run by every candidate before any elimination
+    alpha=0.05,  # Significance level of the elimination tests
+    max_workers=None,  # Process pool size; 1 runs in the current process
+):
+    """
+    Race candidate configurations with short fixed-seed runs: every round
+    runs the surviving candidates on the next seed, then the statistically
+    worse ones are eliminated, so the budget is spent on the promising ones.
+
+    :return: A (best configuration, result rows) tuple; rows hold one run each.
+    """
+    if generations is None and time_limit is None:
+        raise ValueError("Racing needs a generation or time limit per run")
+    alive = list(range(len(configurations)))
+    scores = {index: [] for index in alive}
+    rows = []
+
+    executor = None
+    if max_workers != 1:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(instance,)
+        )
+    try:
+        for round_number, seed in enumerate(seeds, start=1):
+            arguments = [
+                (configurations[index], seed, omegas, generations, time_limit)
+                for index in alive
+            ]
+            if executor is None:
+                results = [_run_candidate(*args, instance) for args in arguments]
+            else:
+                futures = [executor.submit(_run_candidate, *a) for a in arguments]
+                results = [future.result() for future in futures]
+
+            for index, result in zip(alive, results):
+                scores[index].append(result["best_fitness"])
+                rows.append(
+                    {
+                        "round": round_number,
+                        "seed": seed,
+                        "candidate": index,
+                        **configurations[index],
+                        **result,
+                    }
+                )
+
+            if round_number >= min_rounds and len(alive) > 1:
+                survivors = eliminate([scores[index] for index in alive], alpha)
+                alive = [alive[position] for position in survivors]
+                logging.info(f"Round {round_number}: {len(alive)} candidates left.")
+            if len(alive) == 1:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    best = max(alive, key=lambda index: statistics.mean(scores[index]))
+    return configurations[best], rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Tune the genetic algorithm's options by racing short runs."
+    )
+    parser.add_argument("--data", default="Simulated_Data.xlsx")
+    parser.add_argument("--candidates", type=int, default=16)
+    parser.add_argument("--seeds", type=int, nargs="+", default=list(range(10)))
+    parser.add_argument("--time-limit", type=float, default=5.0)
+    parser.add_argument("--generations", type=int, default=None)
+    parser.add_argument("--min-rounds", type=int, default=3)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="data/tuned_configuration.json")
+    args = parser.parse_args(argv)
+
+    instance = DataLoader(args.data).load_columnar_instance().to_solver_instance()
+    configurations = sample_configurations(DEFAULT_SPACE, args.candidates)
+    best, rows = race(
+        instance,
+        configurations,
+        args.seeds,
+        generations=args.generations,
+        time_limit=args.time_limit,
+        min_rounds=args.min_rounds,
+        alpha=args.alpha,
+        max_workers=args.workers,
+    )
+    with open(args.output, "w") as f:
+        json.dump({"best": best, "runs": rows}, f, indent=2)
+    print(f"Best configuration: {best}")
+    print(f"Race results successfully exported to '{args.output}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import time
+import random
+import logging
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.utils.data_loader import DataLoader
+from src.utils.export_to_excel import export_sweep_results
+
+# Instance data of the current worker process, set once by _init_worker
+_worker_instance = None
+
+
+def weight_grid(step=0.1):
+    """
+    Generate every (omega1, omega2, omega3) triple on a simplex grid.
+
+    :param step: Grid spacing; the weights of each triple sum to one.
+    :return: A list of omega triples.
+    """
+    divisions = round(1 / step)
+    grid = []
+    for i, j in itertools.product(range(divisions + 1), repeat=2):
+        if i + j <= divisions:
+            k = divisions - i - j
+            grid.append(
+                (
+                    round(i / divisions, 10),
+                    round(j / divisions, 10),
+                    round(k / divisions, 10),
+                )
+            )
+    return grid
+
+
+def _init_worker(instance):
+    # The instance is pickled once per worker process instead of per task
+    global _worker_instance
+    _worker_instance = instance
+
+
+def _run_configuration(omegas, seed, population_size, generations, instance=None):
+    instance = instance if instance is not None else _worker_instance
+    omega1, omega2, omega3 = omegas
+    random.seed(seed)
+
+    start_time = time.perf_counter()
+    ga = GeneticAlgorithm(
+        **instance,
+        population_size=population_size,
+        omega1=omega1,
+        omega2=omega2,
+        omega3=omega3,
+    )
+    generation_statistics = ga.run(generations=generations)
+    runtime = time.perf_counter() - start_time
+
+    best_chromosome = max(ga.population, key=lambda c: c.fitness)
+    day_balance, load_balance, satisfaction = best_chromosome.objectives
+    final_statistics = generation_statistics[-1] if generation_statistics else {}
+    return {
+        "omega1": omega1,
+        "omega2": omega2,
+        "omega3": omega3,
+        "seed": seed,
+        "best_fitness": best_chromosome.fitness,
+        "day_balance": day_balance,
+        "load_balance": load_balance,
+        "satisfaction": satisfaction,
+        "teacher_satisfaction": final_statistics.get("teacher_satisfaction"),
+        "preference_violations": final_statistics.get("preference_violations"),
+        "evaluations": ga.evaluations,
+        "runtime_seconds": runtime,
+    }
+
+
+def run_weight_sweep(
+    instance,  # Solver inputs, as returned by DataLoader.load_instance
+    weights,  # A list of (omega1, omega2, omega3) triples
+    seeds,  # A list of random seeds run for every triple
+    population_size,
+    generations,
+    max_workers=None,  # Process pool size; 1 runs in the current process
+):
+    """
+    Run the GA for every weight triple and seed and collect one result row
+    per configuration, ordered like the input grid.
+    """
+    configurations = list(itertools.product(weights, seeds))
+    logging.info(f"Running weight sweep over {len(configurations)} configurations.")
+
+    if max_workers == 1:
+        return [
+            _run_configuration(omegas, seed, population_size, generations, instance)
+            for omegas, seed in configurations
+        ]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(instance,)
+    ) as executor:
+        futures = [
+            executor.submit(
+                _run_configuration, omegas, seed, population_size, generations
+            )
+            for omegas, seed in configurations
+        ]
+        return [future.result() for future in futures]
+
+
+def _parse_weights(text):
+    omegas = tuple(float(value) for value in text.split(","))
+    if len(omegas) != 3:
+        raise argparse.ArgumentTypeError("weights must be omega1,omega2,omega3")
+    return omegas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the genetic algorithm over a grid of omega weights."
+    )
+    parser.add_argument("--data", default="Simulated_Data.xlsx")
+    parser.add_argument("--population-size", type=int, default=50)
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument(
+        "--weights",
+        type=_parse_weights,
+        action="append",
+        help="An omega1,omega2,omega3 triple; repeat for several.",
+    )
+    parser.add_argument(
+        "--step", type=float, default=0.1, help="Simplex grid step without --weights."
+    )
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default="data/weight_sweep.xlsx")
+    args = parser.parse_args(argv)
+
+    instance = DataLoader(args.data).load_columnar_instance().to_solver_instance()
+    weights = args.weights or weight_grid(args.step)
+    results = run_weight_sweep(
+        instance,
+        weights,
+        args.seeds,
+        args.population_size,
+        args.generations,
+        max_workers=args.workers,
+    )
+    export_sweep_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
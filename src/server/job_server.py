@@ -0,0 +1,432 @@
+import os
+import json
+import uuid
+import random
+import asyncio
+import logging
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.nsga2 import NSGA2
+from src.utils.data_loader import DataLoader
+from src.utils.export_to_excel import export_to_excel, export_summary_statistics
+
+# Accepted job parameters with their types and defaults
+JOB_PARAMETERS = {
+    "dataset": (str, "Simulated_Data.xlsx"),
+    "population_size": (int, 50),
+    "generations": (int, 50),
+    "omega1": (float, 0.3),
+    "omega2": (float, 0.3),
+    "omega3": (float, 0.4),
+    "seed": (int, None),
+    "mode": (str, "weighted"),
+}
+
+HTTP_REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+# Instances already loaded by this worker process, keyed by dataset file name
+_instance_cache = {}
+
+
+def parse_job_parameters(payload):
+    """
+    Validate a job submission and fill in defaults.
+
+    :param payload: The decoded JSON body of the request.
+    :return: A dictionary with every entry of JOB_PARAMETERS.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Job parameters must be a JSON object")
+    unknown = set(payload) - set(JOB_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown job parameters: {', '.join(sorted(unknown))}")
+
+    parameters = {}
+    for name, (value_type, default) in JOB_PARAMETERS.items():
+        value = payload.get(name, default)
+        if value is None and default is not None:
+            raise ValueError(f"{name} must not be null")
+        parameters[name] = value if value is None else value_type(value)
+
+    # Datasets are resolved inside the data directory only
+    if os.path.basename(parameters["dataset"]) != parameters["dataset"]:
+        raise ValueError("dataset must be a file name in the data directory")
+    if parameters["mode"] not in ("weighted", "pareto"):
+        raise ValueError(f"Unknown optimization mode: {parameters['mode']}")
+    if parameters["population_size"] < 2 or parameters["generations"] < 1:
+        raise ValueError("population_size must be >= 2 and generations >= 1")
+    return parameters
+
+
+def run_job(job_id, parameters, progress_queue, output_dir):
+    """Run one scheduling job in a worker process and return its results."""
+    dataset = parameters["dataset"]
+    if dataset not in _instance_cache:
+        _instance_cache[dataset] = (
+            DataLoader(dataset).load_columnar_instance().to_solver_instance()
+        )
+    instance = _instance_cache[dataset]
+
+    if parameters["seed"] is not None:
+        random.seed(parameters["seed"])
+
+    algorithm_class = NSGA2 if parameters["mode"] == "pareto" else GeneticAlgorithm
+    ga = algorithm_class(
+        **instance,
+        population_size=parameters["population_size"],
+        omega1=parameters["omega1"],
+        omega2=parameters["omega2"],
+        omega3=parameters["omega3"],
+    )
+
+    def report_progress(event):
+        progress_queue.put(
+            (
+                job_id,
+                {
+                    "generation": event.generation,
+                    "generations": event.generations,
+                    "max_fitness": event.best_fitness,
+                    "average_fitness": event.average_fitness,
+                    "evaluations": event.evaluations,
+                },
+            )
+        )
+
+    statistics = ga.run(parameters["generations"], observers=[report_progress])
+
+    best_chromosome = ga.population[0]
+    time_slot_details = {
+        slot["Time Slot ID"]: slot["Description"] for slot in instance["time_slots"]
+    }
+    schedule = [
+        {
+            "Teacher ID": gene[3],
+            "Course ID": gene[0]["Course Section ID"],
+            "Time Slot": time_slot_details.get(
+                gene[2]["Time Slot ID"], "Unknown Time Slot"
+            ),
+            "Room": gene[1]["Room Number"],
+        }
+        for gene in best_chromosome.genes
+    ]
+
+    os.makedirs(output_dir, exist_ok=True)
+    export_to_excel(
+        best_chromosome,
+        time_slot_details,
+        os.path.join(output_dir, "final_schedule.xlsx"),
+    )
+    export_summary_statistics(
+        statistics, os.path.join(output_dir, "summary_statistics.xlsx")
+    )
+    return {
+        "fitness": best_chromosome.fitness,
+        "schedule": schedule,
+        "statistics": statistics,
+    }
+
+
+def _to_json(value):
+    # NumPy scalars from the workbook are converted to plain Python values
+    return json.dumps(
+        value, default=lambda o: o.item() if hasattr(o, "item") else str(o)
+    ).encode()
+
+
+class Job:
+    def __init__(self, job_id, parameters, output_dir):
+        self.id = job_id
+        self.parameters = parameters
+        self.output_dir = output_dir
+        self.status = "queued"  # queued, running, completed or failed
+        self.progress = []
+        self.result = None
+        self.error = None
+        self.changed = asyncio.Condition()
+        self._outcome = None  # (status, result, error) until progress is flushed
+
+    @property
+    def finished(self):
+        return self.status in ("completed", "failed")
+
+    def summary(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "parameters": self.parameters,
+            "progress": self.progress[-1] if self.progress else None,
+            "error": self.error,
+        }
+
+    async def notify(self):
+        async with self.changed:
+            self.changed.notify_all()
+
+
+class JobServer:
+    """
+    Local HTTP service that queues scheduling jobs onto a bounded process
+    pool and streams their per-generation progress as server-sent events.
+
+    Endpoints:
+        POST /jobs                      submit a job (JSON parameters)
+        GET  /jobs                      list jobs
+        GET  /jobs/<id>                 job status and latest progress
+        GET  /jobs/<id>/events          progress stream (text/event-stream)
+        GET  /jobs/<id>/schedule        best schedule as JSON
+        GET  /jobs/<id>/schedule.xlsx   best schedule as exported workbook
+        GET  /jobs/<id>/statistics      per-generation statistics as JSON
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=8765,
+        max_workers=2,  # Jobs running at the same time
+        max_pending=16,  # Queued plus running jobs accepted before rejecting
+        output_root="data/jobs",  # Each job exports into output_root/<id>
+    ):
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.output_root = output_root
+        self.jobs = {}
+
+    async def start(self):
+        self._manager = multiprocessing.Manager()
+        self._progress_queue = self._manager.Queue()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._worker_slots = asyncio.Semaphore(self.max_workers)
+        self._progress_task = asyncio.create_task(self._pump_progress())
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info(f"Job server listening on http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        self._progress_queue.put(None)
+        await self._progress_task
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._manager.shutdown()
+
+    def submit(self, parameters):
+        pending = sum(1 for job in self.jobs.values() if not job.finished)
+        if pending >= self.max_pending:
+            return None
+        job_id = uuid.uuid4().hex[:12]
+        job = Job(job_id, parameters, os.path.join(self.output_root, job_id))
+        self.jobs[job_id] = job
+        asyncio.create_task(self._execute(job))
+        return job
+
+    async def _execute(self, job):
+        loop = asyncio.get_running_loop()
+        async with self._worker_slots:
+            job.status = "running"
+            await job.notify()
+            try:
+                result = await loop.run_in_executor(
+                    self._executor,
+                    run_job,
+                    job.id,
+                    job.parameters,
+                    self._progress_queue,
+                    job.output_dir,
+                )
+                job._outcome = ("completed", result, None)
+            except Exception as e:
+                logging.exception(f"Job {job.id} failed")
+                job._outcome = ("failed", None, str(e))
+        # The worker's progress messages precede this marker in the queue, so
+        # the job is only finalized once all of them have been delivered.
+        await loop.run_in_executor(None, self._progress_queue.put, (job.id, None))
+
+    async def _pump_progress(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self._progress_queue.get)
+            if item is None:
+                break
+            job_id, progress = item
+            job = self.jobs.get(job_id)
+            if job is None:
+                continue
+            if progress is None:
+                job.status, job.result, job.error = job._outcome
+            else:
+                job.progress.append(progress)
+            await job.notify()
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            await self._route(method, urlsplit(target).path, body, writer)
+        except (ValueError, asyncio.IncompleteReadError) as e:
+            await self._respond(writer, 400, {"error": str(e)})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body, writer):
+        parts = [part for part in path.split("/") if part]
+        if not parts or parts[0] != "jobs" or len(parts) > 3:
+            return await self._respond(writer, 404, {"error": "Not found"})
+
+        if len(parts) == 1:
+            if method == "POST":
+                return await self._submit(body, writer)
+            if method == "GET":
+                jobs = [job.summary() for job in self.jobs.values()]
+                return await self._respond(writer, 200, jobs)
+            return await self._respond(writer, 405, {"error": "Method not allowed"})
+
+        job = self.jobs.get(parts[1])
+        if job is None:
+            return await self._respond(writer, 404, {"error": "Unknown job"})
+        if method != "GET":
+            return await self._respond(writer, 405, {"error": "Method not allowed"})
+
+        resource = parts[2] if len(parts) == 3 else None
+        if resource is None:
+            return await self._respond(writer, 200, job.summary())
+        if resource == "events":
+            return await self._stream_events(job, writer)
+        if resource not in ("schedule", "schedule.xlsx", "statistics"):
+            return await self._respond(writer, 404, {"error": "Not found"})
+        if job.status != "completed":
+            return await self._respond(
+                writer, 409, {"error": f"Job is {job.status}", "status": job.status}
+            )
+        if resource == "schedule":
+            return await self._respond(
+                writer,
+                200,
+                {"fitness": job.result["fitness"], "schedule": job.result["schedule"]},
+            )
+        if resource == "statistics":
+            return await self._respond(writer, 200, job.result["statistics"])
+        # The exporter only logs its failures, so the file may be missing
+        try:
+            with open(os.path.join(job.output_dir, "final_schedule.xlsx"), "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return await self._respond(writer, 404, {"error": "Schedule not exported"})
+        except OSError as e:
+            logging.error(f"Could not read the schedule of job {job.id}: {e}")
+            return await self._respond(writer, 500, {"error": "Schedule unreadable"})
+        return await self._respond(
+            writer,
+            200,
+            content,
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+    async def _submit(self, body, writer):
+        try:
+            parameters = parse_job_parameters(json.loads(body or b"{}"))
+        except (ValueError, TypeError) as e:
+            return await self._respond(writer, 400, {"error": str(e)})
+        job = self.submit(parameters)
+        if job is None:
+            return await self._respond(writer, 503, {"error": "Job queue is full"})
+        return await self._respond(writer, 202, job.summary())
+
+    async def _respond(self, writer, status, payload, content_type=None):
+        if content_type is None:
+            content_type = "application/json"
+            payload = _to_json(payload)
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + payload
+        )
+        await writer.drain()
+
+    async def _stream_events(self, job, writer):
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\n"
+            b"Connection: close\r\n\r\n"
+        )
+        sent = 0
+        while True:
+            async with job.changed:
+                await job.changed.wait_for(
+                    lambda: len(job.progress) > sent or job.finished
+                )
+            for event in job.progress[sent:]:
+                writer.write(b"event: progress\ndata: " + _to_json(event) + b"\n\n")
+                sent += 1
+            if job.finished and sent == len(job.progress):
+                writer.write(
+                    f"event: {job.status}\ndata: ".encode()
+                    + _to_json(job.summary())
+                    + b"\n\n"
+                )
+                await writer.drain()
+                return
+            await writer.drain()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the local scheduling job server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-pending", type=int, default=16)
+    parser.add_argument("--output-root", default="data/jobs")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+    server = JobServer(
+        args.host, args.port, args.workers, args.max_pending, args.output_root
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
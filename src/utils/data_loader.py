@@ -1,7 +1,216 @@
-from .time_slot_parser import TimeSlotParser
-import pandas as pd
 import os
 
+# Satisfaction rating of each real-world course preference mark on the scale
+# of the simulated Teacher Satisfaction sheet, where a lower rating is a
+# stronger preference (0 most preferred, 5 least): 0 = best, 1 = OK,
+# 2 = least preferred, blank = no preference.
+COURSE_PREFERENCE_SATISFACTION = {0: 0, 1: 3, 2: 5, None: 3}
+# Board codes used by the teacher sheets: whiteboard (1), chalkboard (2).
+BOARD_TYPES = {"W": 1, "C": 2}
+# Real-world day patterns grouped into the simulated Days Pref codes.
+MWF_DAY_PATTERNS = ["MW (1)", "WF (2)", "MF (3)", "MWF (4)"]
+TR_DAY_PATTERNS = ["TR (5)"]
+
+
+# Define a class ColumnarInstance holding one typed column per attribute.
+class ColumnarInstance:
+    """
+    A scheduling instance stored column-wise with integer IDs and a dense
+    teacher x section satisfaction matrix.
+
+    :param sections: Columns of the course sections, keyed by field name.
+    :param classrooms: Columns of the classrooms, keyed by field name.
+    :param time_slots: Columns of the time slots, keyed by field name.
+    :param teachers: Columns of the teacher preferences, keyed by field name.
+    :param satisfaction: Satisfaction matrix aligned with the teacher and
+        section ID columns.
+    """
+
+    def __init__(self, sections, classrooms, time_slots, teachers, satisfaction):
+        self.sections = sections
+        self.classrooms = classrooms
+        self.time_slots = time_slots
+        self.teachers = teachers
+        self.satisfaction = satisfaction
+
+    @staticmethod
+    def _records(columns):
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+    # Function to build the record and dictionary inputs of the solvers.
+    def to_solver_instance(self):
+        section_ids = self.sections["Course Section ID"]
+        teacher_records = self._records(self.teachers)
+        return {
+            "course_sections": self._records(self.sections),
+            "classrooms": self._records(self.classrooms),
+            "time_slots": self._records(self.time_slots),
+            "teacher_preferences": {
+                record.pop("Teacher ID"): record for record in teacher_records
+            },
+            "teacher_satisfaction": {
+                teacher_id: {
+                    f"CS{section_id}": score
+                    for section_id, score in zip(section_ids, scores.tolist())
+                }
+                for teacher_id, scores in zip(
+                    self.teachers["Teacher ID"], self.satisfaction
+                )
+            },
+        }
+
+
+def _columns(rows, fields):
+    # Transpose streamed rows into one list per field
+    return {field: [row[field] for row in rows] for field in fields}
+
+
+def _build_simulated_instance(read_rows):
+    import numpy as np
+
+    sections = _columns(
+        read_rows("(I) Simulated Course Sections"),
+        ["Course Section ID", "Course Number", "Section", "Units", "Course Type"],
+    )
+    teachers = _columns(
+        read_rows("Teacher Preference"),
+        [
+            "Teacher ID",
+            "Min Sections",
+            "Max Sections",
+            "Board Pref",
+            "Time Pref",
+            "Days Pref",
+            "Type Pref",
+        ],
+    )
+    satisfaction_rows = {
+        row["Teacher ID"]: row for row in read_rows("Teacher Satisfaction")
+    }
+    satisfaction = np.array(
+        [
+            [
+                satisfaction_rows[teacher_id][f"CS{section_id}"]
+                for section_id in sections["Course Section ID"]
+            ]
+            for teacher_id in teachers["Teacher ID"]
+        ],
+        dtype=np.int64,
+    )
+    return ColumnarInstance(
+        sections,
+        _columns(read_rows("(J) Classrooms"), ["Room Number", "Board Type"]),
+        _columns(read_rows("(K) Time Slots"), ["Time Slot ID", "Description"]),
+        teachers,
+        satisfaction,
+    )
+
+
+def _build_cpp_real_world_instance(read_rows):
+    import numpy as np
+
+    # Section units come from the catalog; the section sheet only holds
+    # LOOKUP formulas into it.
+    catalog_units = {
+        row["Course Number"]: row["Units"]
+        for row in read_rows("Cataloged Courses-Names & Units")
+    }
+    section_rows = read_rows("All Spring Course Sections (I)")
+    sections = {
+        "Course Section ID": [row["Course Section ID (CRN)"] for row in section_rows],
+        "Course Number": [row["Course Name"] for row in section_rows],
+        "Section": [row["Section"] for row in section_rows],
+        "Units": [catalog_units[row["Course Name"]] for row in section_rows],
+        # The real-world data does not classify courses as pure or applied
+        "Course Type": [0] * len(section_rows),
+    }
+
+    room_rows = read_rows("All Classrooms (J)")
+    classrooms = {
+        "Room Number": [row["Room Number"] for row in room_rows],
+        "Board Type": [
+            BOARD_TYPES[row["Chalkboard or Whiteboard"]] for row in room_rows
+        ],
+    }
+
+    # Teachers are limited by units rather than sections: the most sections
+    # fit when every section is short, the fewest when every section is long.
+    shortest, longest = min(sections["Units"]), max(sections["Units"])
+    teacher_rows = read_rows("All Teachers (T)")
+    time_rows = {
+        row["Teacher ID"]: row
+        for row in read_rows("Teacher Time Preferences", header_row=1)
+    }
+    day_rows = {
+        row["Teacher ID"]: row
+        for row in read_rows("Teacher Preferred Days", header_row=1)
+    }
+    course_rows = {
+        row["Teacher ID"]: row
+        for row in read_rows("Teacher Course Preferences", header_row=2)
+    }
+
+    teachers = {
+        "Teacher ID": [],
+        "Min Sections": [],
+        "Max Sections": [],
+        "Board Pref": [],
+        "Time Pref": [],
+        "Days Pref": [],
+        "Type Pref": [],
+    }
+    for row in teacher_rows:
+        teacher_id = row["Teacher ID"]
+        max_units = row["Max Spring Units"]
+        # Only a set of days ranked great (0) that is purely MWF or purely TR
+        # becomes a day preference
+        best_days = {
+            pattern
+            for pattern in MWF_DAY_PATTERNS + TR_DAY_PATTERNS
+            if day_rows[teacher_id][pattern] == 0
+        }
+        days_pref = 0
+        if best_days and best_days <= set(MWF_DAY_PATTERNS):
+            days_pref = 1
+        elif best_days and best_days <= set(TR_DAY_PATTERNS):
+            days_pref = 2
+
+        teachers["Teacher ID"].append(teacher_id)
+        teachers["Min Sections"].append(max_units // longest)
+        teachers["Max Sections"].append(max_units // shortest)
+        teachers["Board Pref"].append(row["Board Preferece (W, C, N)"])
+        # Codes 4-6 combine two periods; see TIME_PREFERENCE_PERIODS
+        teachers["Time Pref"].append(time_rows[teacher_id]["Most Preferred Time"])
+        teachers["Days Pref"].append(days_pref)
+        teachers["Type Pref"].append(0)
+
+    satisfaction = np.array(
+        [
+            [
+                COURSE_PREFERENCE_SATISFACTION[course_rows[teacher_id].get(course)]
+                for course in sections["Course Number"]
+            ]
+            for teacher_id in teachers["Teacher ID"]
+        ],
+        dtype=np.int64,
+    )
+    return ColumnarInstance(
+        sections,
+        classrooms,
+        _columns(read_rows("All Times (K)"), ["Time Slot ID", "Description"]),
+        teachers,
+        satisfaction,
+    )
+
+
+# Registry of the known workbooks and the builders that map their sheets and
+# columns onto a ColumnarInstance.
+DATASET_SCHEMAS = {
+    "Simulated_Data.xlsx": _build_simulated_instance,
+    "CPP_Real_World_Data.xlsx": _build_cpp_real_world_instance,
+}
+
 
 # Define a class DataLoader for handling data loading and preprocessing.
 class DataLoader:
@@ -14,11 +223,77 @@ class DataLoader:
 
     # Function to load a specific sheet from an Excel file.
     def load_sheet(self, sheet_name):
-        # Use pandas to read a specific sheet from an Excel file.
+        # Use pandas to read a specific sheet from an Excel file; it is only
+        # imported here since the columnar path does not need it.
+        import pandas as pd
+
         return pd.read_excel(self.file_path, sheet_name=sheet_name)
 
+    # Function to load the solver inputs expected by GeneticAlgorithm.
+    def load_instance(
+        self,
+        course_sections_sheet="(I) Simulated Course Sections",
+        classrooms_sheet="(J) Classrooms",
+        time_slots_sheet="(K) Time Slots",
+        teacher_preferences_sheet="Teacher Preference",
+        teacher_satisfaction_sheet="Teacher Satisfaction",
+    ):
+        # Records for the list inputs, Teacher ID keyed dictionaries for the rest.
+        teacher_preferences_df = self.load_sheet(teacher_preferences_sheet)
+        teacher_satisfaction_df = self.load_sheet(teacher_satisfaction_sheet)
+        return {
+            "course_sections": self.load_sheet(course_sections_sheet).to_dict(
+                "records"
+            ),
+            "classrooms": self.load_sheet(classrooms_sheet).to_dict("records"),
+            "time_slots": self.load_sheet(time_slots_sheet).to_dict("records"),
+            "teacher_preferences": teacher_preferences_df.set_index(
+                "Teacher ID"
+            ).T.to_dict(),
+            "teacher_satisfaction": teacher_satisfaction_df.set_index(
+                "Teacher ID"
+            ).T.to_dict(),
+        }
+
+    # Function to stream a known workbook into a ColumnarInstance.
+    def load_columnar_instance(self, schema=None):
+        """
+        Load the workbook through its DATASET_SCHEMAS entry.
+
+        Sheets are streamed with openpyxl in read-only mode, keeping cached
+        formula values, so large sheets are never materialized as DataFrames.
+
+        :param schema: A DATASET_SCHEMAS key; defaults to the file name.
+        :return: A ColumnarInstance.
+        """
+        schema = schema or os.path.basename(self.file_path)
+        if schema not in DATASET_SCHEMAS:
+            raise ValueError(f"No dataset schema registered for {schema}")
+
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+
+        def read_rows(sheet_name, header_row=0):
+            # Rows below the header as dictionaries; rows without an ID in the
+            # first column (notes, blank trailing rows) are skipped
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            for _ in range(header_row):
+                next(rows)
+            header = next(rows)
+            return [
+                dict(zip(header, row)) for row in rows if row and row[0] is not None
+            ]
+
+        try:
+            return DATASET_SCHEMAS[schema](read_rows)
+        finally:
+            workbook.close()
+
     # Function to preprocess data from a DataFrame.
     def preprocess_data(self, df, sheet_name):
+        from .time_slot_parser import TimeSlotParser
+
         # Fill missing values in the DataFrame using forward fill method.
         df.fillna(method="ffill", inplace=True)
 
@@ -34,6 +309,9 @@ class DataLoader:
                         1: "Morning",
                         2: "Afternoon",
                         3: "Evening",
+                        4: "Morning or Afternoon",
+                        5: "Afternoon or Evening",
+                        6: "Morning or Evening",
                     },
                     "Days Pref": {0: "No Pref", 1: "MWF", 2: "TR"},
                     "Type Pref": {0: "None", 1: "Pure", 2: "Applied"},
@@ -1,6 +1,9 @@
+import csv
+import json
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
+from src.algorithms.nsga2 import mean_satisfaction_rating
 
 
 def auto_fit_columns(file_path):
@@ -55,6 +58,10 @@ def export_summary_statistics(statistics, output_file_path="summary_statistics.x
                 "max_fitness",
                 "preference_violations",
                 "course_assignment_duplicates",
+                "evaluations",
+                "unique_fraction",
+                "mean_hamming_distance",
+                "duplicates_replaced",
             ]
         ]
 
@@ -105,3 +112,242 @@ def export_to_excel(
 
     except Exception as e:
         print(f"An error occurred during export: {e}")
+
+
+def export_pareto_front(
+    front, time_slots_details, output_file_path="data/pareto_front.xlsx"
+):
+    """
+    Exports a Pareto front of schedules to a single Excel file.
+
+    The first sheet lists each schedule's criteria and weighted fitness; every
+    schedule is written to its own sheet so the scheduler can pick one.
+
+    :param front: A list of non-dominated chromosomes.
+    :param time_slots_details: Dictionary or similar structure containing the details of the time slots.
+    :param output_file_path: The path where the Excel file will be saved.
+    """
+    try:
+        summary = pd.DataFrame(
+            [
+                {
+                    "Schedule": index + 1,
+                    "Day Balance": chromosome.objectives[0],
+                    "Load Deviation": chromosome.objectives[1],
+                    "Mean Satisfaction Rating": mean_satisfaction_rating(chromosome),
+                    "Weighted Fitness": chromosome.fitness,
+                }
+                for index, chromosome in enumerate(front)
+            ]
+        )
+
+        with pd.ExcelWriter(output_file_path) as writer:
+            summary.to_excel(writer, sheet_name="Pareto Front", index=False)
+            for index, chromosome in enumerate(front):
+                data = [
+                    [
+                        gene[3],
+                        gene[0]["Course Section ID"],
+                        time_slots_details.get(
+                            gene[2]["Time Slot ID"], "Unknown Time Slot"
+                        ),
+                        gene[1]["Room Number"],
+                    ]
+                    for gene in chromosome.genes
+                ]
+                pd.DataFrame(
+                    data, columns=["Teacher ID", "Course ID", "Time Slot", "Room"]
+                ).to_excel(writer, sheet_name=f"Schedule {index + 1}", index=False)
+
+        # Auto fit columns of the summary sheet
+        auto_fit_columns(output_file_path)
+
+        print(f"Pareto front successfully exported to '{output_file_path}'.")
+
+    except Exception as e:
+        print(f"An error occurred during export: {e}")
+
+
+def export_sweep_results(results, output_file_path="data/weight_sweep.xlsx"):
+    """
+    Exports a weight sweep results table to an Excel or CSV file.
+
+    :param results: A list of dictionaries, one per (weights, seed) configuration.
+    :param output_file_path: The path where the file will be saved; a .csv
+        extension writes CSV instead of Excel.
+    """
+    try:
+        df = pd.DataFrame(results)
+
+        if output_file_path.endswith(".csv"):
+            df.to_csv(output_file_path, index=False)
+        else:
+            df.to_excel(output_file_path, index=False)
+            auto_fit_columns(output_file_path)
+
+        print(f"Sweep results successfully exported to '{output_file_path}'.")
+
+    except Exception as e:
+        print(f"An error occurred during export: {e}")
+
+
+def export_checkpoint(best_chromosome, output_file_path="data/final_schedule.json"):
+    """
+    Exports the best chromosome as a JSON checkpoint for warm-started runs.
+
+    Unlike the Excel export, time slots are stored by ID so the schedule can
+    be mapped back onto the instance exactly.
+
+    :param best_chromosome: The best chromosome to be exported.
+    :param output_file_path: The path where the JSON file will be saved.
+    """
+    try:
+        schedule = [
+            {
+                "Teacher ID": gene[3],
+                "Course ID": gene[0]["Course Section ID"],
+                "Time Slot ID": gene[2]["Time Slot ID"],
+                "Room": gene[1]["Room Number"],
+            }
+            for gene in best_chromosome.genes
+        ]
+        with open(output_file_path, "w") as f:
+            json.dump(
+                {"fitness": best_chromosome.fitness, "schedule": schedule},
+                f,
+                indent=2,
+                default=lambda o: o.item() if hasattr(o, "item") else str(o),
+            )
+
+        print(f"Checkpoint successfully exported to '{output_file_path}'.")
+
+    except Exception as e:
+        print(f"An error occurred during export: {e}")
+
+
+def schedule_metrics(chromosome):
+    """
+    Summarizes a schedule for administrators comparing alternatives.
+
+    :param chromosome: An evaluated chromosome.
+    :return: A dictionary of fitness, criteria, satisfaction and violations.
+    """
+    satisfaction = chromosome.ga.section_satisfaction
+    genes = chromosome.genes
+    return {
+        "Fitness": chromosome.fitness,
+        "Day Balance": chromosome.objectives[0],
+        "Load Balance": chromosome.objectives[1],
+        # Mean satisfaction over all sections, as a percentage of the maximum 5
+        "Satisfaction (%)": sum(
+            satisfaction[gene[3]][gene[0]["Course Section ID"]] for gene in genes
+        )
+        / len(genes)
+        / 5
+        * 100,
+        "Preference Violations": sum(
+            chromosome.not_meeting_preferences(gene[3], *gene[:3]) for gene in genes
+        ),
+        "Valid": chromosome.is_valid(),
+    }
+
+
+def _write_sheet(worksheet, header, rows):
+    # Write-only sheets need their column widths before the first row, so
+    # widths are measured on the rows already in memory instead of reopening
+    # the saved file
+    for index, column in enumerate(zip(header, *rows), start=1):
+        width = max(len(str(value)) for value in column if value is not None)
+        worksheet.column_dimensions[get_column_letter(index)].width = width + 2
+    worksheet.append(header)
+    for row in rows:
+        worksheet.append(row)
+
+
+def export_top_schedules(
+    chromosomes, time_slots_details, output_file_path="data/top_schedules.xlsx"
+):
+    """
+    Exports several alternative schedules with their metrics in one pass.
+
+    An Excel file gets a summary sheet and one sheet per schedule; a .csv file
+    gets one row per assignment with the schedule's rank and metrics; a .json
+    file gets a list of schedules with their metrics.
+
+    :param chromosomes: Distinct chromosomes, best first.
+    :param time_slots_details: Dictionary or similar structure containing the details of the time slots.
+    :param output_file_path: The path where the file will be saved, or a list
+        of paths to write the same schedules in several formats; the extension
+        selects the format.
+    """
+    try:
+        schedules = []
+        for rank, chromosome in enumerate(chromosomes, start=1):
+            assignments = [
+                [
+                    gene[3],
+                    gene[0]["Course Section ID"],
+                    time_slots_details.get(
+                        gene[2]["Time Slot ID"], "Unknown Time Slot"
+                    ),
+                    gene[1]["Room Number"],
+                ]
+                for gene in chromosome.genes
+            ]
+            schedules.append((rank, schedule_metrics(chromosome), assignments))
+    except Exception as e:
+        print(f"An error occurred during export: {e}")
+        return
+
+    output_file_paths = (
+        [output_file_path] if isinstance(output_file_path, str) else output_file_path
+    )
+    for path in output_file_paths:
+        _write_top_schedules(schedules, path)
+
+
+def _write_top_schedules(schedules, output_file_path):
+    # Writes (rank, metrics, assignments) tuples in the file's format
+    try:
+        columns = ["Teacher ID", "Course ID", "Time Slot", "Room"]
+        metric_names = list(schedules[0][1]) if schedules else []
+
+        if output_file_path.endswith(".json"):
+            with open(output_file_path, "w") as f:
+                json.dump(
+                    [
+                        {
+                            "rank": rank,
+                            "metrics": metrics,
+                            "schedule": [dict(zip(columns, row)) for row in rows],
+                        }
+                        for rank, metrics, rows in schedules
+                    ],
+                    f,
+                    indent=2,
+                    default=lambda o: o.item() if hasattr(o, "item") else str(o),
+                )
+        elif output_file_path.endswith(".csv"):
+            with open(output_file_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["Schedule"] + metric_names + columns)
+                for rank, metrics, rows in schedules:
+                    for row in rows:
+                        writer.writerow([rank] + list(metrics.values()) + row)
+        else:
+            workbook = Workbook(write_only=True)
+            _write_sheet(
+                workbook.create_sheet("Top Schedules"),
+                ["Schedule"] + metric_names,
+                [[rank] + list(metrics.values()) for rank, metrics, _ in schedules],
+            )
+            for rank, _, rows in schedules:
+                _write_sheet(workbook.create_sheet(f"Schedule {rank}"), columns, rows)
+            workbook.save(output_file_path)
+
+        print(
+            f"{len(schedules)} schedules successfully exported to '{output_file_path}'."
+        )
+
+    except Exception as e:
+        print(f"An error occurred during export: {e}")
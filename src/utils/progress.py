@@ -0,0 +1,117 @@
+import sys
+import time
+import datetime
+
+
+class ProgressEvent:
+    def __init__(
+        self,
+        generation,  # Generations (or annealing temperature levels) completed
+        generations,  # Generation limit of the run, None when unbounded
+        best_fitness,  # Best fitness found so far
+        average_fitness,  # Population mean; the current state for annealing
+        evaluations,  # Fitness evaluations performed so far
+        elapsed_seconds,  # Wall-clock time since the run started
+        evaluations_per_second,  # Evaluation throughput of this run
+        eta_seconds,  # Estimated time until the first limit is reached, or None
+    ):
+        self.generation = generation
+        self.generations = generations
+        self.best_fitness = best_fitness
+        self.average_fitness = average_fitness
+        self.evaluations = evaluations
+        self.elapsed_seconds = elapsed_seconds
+        self.evaluations_per_second = evaluations_per_second
+        self.eta_seconds = eta_seconds
+
+
+class ProgressTracker:
+    """
+    Turns a solver's per-generation numbers into ProgressEvents for a list of
+    observers, estimating the remaining time from whichever budget limit is
+    expected to be reached first.
+    """
+
+    def __init__(
+        self,
+        observers,  # Callables that receive each ProgressEvent
+        generations=None,  # Generation limit of the run
+        max_evaluations=None,  # Evaluation limit of the run
+        time_limit=None,  # Wall-clock limit of the run in seconds
+        start_evaluations=0,  # Evaluations already spent before the run
+    ):
+        self.observers = list(observers)
+        self.generations = generations
+        self.max_evaluations = max_evaluations
+        self.time_limit = time_limit
+        self.start_evaluations = start_evaluations
+        self.start_time = time.perf_counter()
+
+    def report(self, generation, best_fitness, average_fitness, evaluations):
+        if not self.observers:
+            return
+        elapsed = time.perf_counter() - self.start_time
+        run_evaluations = evaluations - self.start_evaluations
+        evaluations_per_second = run_evaluations / elapsed if elapsed > 0 else 0.0
+
+        estimates = []
+        if self.generations and generation:
+            estimates.append(elapsed / generation * (self.generations - generation))
+        if self.max_evaluations is not None and evaluations_per_second:
+            remaining = self.max_evaluations - evaluations
+            estimates.append(remaining / evaluations_per_second)
+        if self.time_limit is not None:
+            estimates.append(self.time_limit - elapsed)
+        eta = max(0.0, min(estimates)) if estimates else None
+
+        event = ProgressEvent(
+            generation,
+            self.generations,
+            best_fitness,
+            average_fitness,
+            evaluations,
+            elapsed,
+            evaluations_per_second,
+            eta,
+        )
+        for observer in self.observers:
+            observer(event)
+
+
+class TerminalProgressReporter:
+    """
+    Observer that rewrites a single terminal status line, at most once every
+    min_interval seconds so fast runs are not slowed down by output.
+    """
+
+    def __init__(self, stream=None, min_interval=0.5):
+        self.stream = stream or sys.stdout
+        self.min_interval = min_interval
+        self._last_write = None
+
+    def __call__(self, event):
+        now = time.perf_counter()
+        if self._last_write is not None and now - self._last_write < self.min_interval:
+            return
+        self._last_write = now
+        self.stream.write("\r\033[K" + self.format(event))
+        self.stream.flush()
+
+    @staticmethod
+    def format(event):
+        generation = f"Generation {event.generation}"
+        if event.generations:
+            generation += f"/{event.generations}"
+        eta = "unknown"
+        if event.eta_seconds is not None:
+            eta = str(datetime.timedelta(seconds=round(event.eta_seconds)))
+        return (
+            f"{generation} | best {event.best_fitness:.4f}"
+            f" | avg {event.average_fitness:.4f}"
+            f" | {event.evaluations_per_second:,.0f} evals/s | ETA {eta}"
+        )
+
+    def close(self):
+        # Clear the status line so later output starts on a clean line
+        self.stream.write("\r\033[K")
+        self.stream.flush()
@@ -0,0 +1,70 @@
+import json
+import logging
+
+
+def read_schedule_rows(file_path):
+    """
+    Read a previously published schedule.
+
+    :param file_path: An Excel file written by export_to_excel or a JSON
+        checkpoint written by export_checkpoint.
+    :return: A list of dictionaries with Teacher ID, Course ID, Room and either
+        Time Slot ID (checkpoints) or the Time Slot description (Excel).
+    """
+    if file_path.endswith(".json"):
+        with open(file_path) as f:
+            return json.load(f)["schedule"]
+    import pandas as pd
+
+    return pd.read_excel(file_path).to_dict("records")
+
+
+def build_warm_start_genes(
+    rows, course_sections, classrooms, time_slots, teacher_preferences
+):
+    """
+    Map a published schedule back onto the current instance.
+
+    Sections whose previous assignment can no longer be used (new sections,
+    removed rooms, time slots or teachers) get None and are reported as
+    changed. Sections of a teacher whose Max Sections dropped below the
+    previous load keep their gene but are also reported as changed.
+
+    :return: A (genes, changed_indices) tuple aligned with course_sections.
+    """
+    rooms_by_number = {room["Room Number"]: room for room in classrooms}
+    slots_by_id = {slot["Time Slot ID"]: slot for slot in time_slots}
+    slots_by_description = {slot["Description"]: slot for slot in time_slots}
+    rows_by_course = {row["Course ID"]: row for row in rows}
+    # Canonical teacher keys, so NumPy IDs read from Excel are not stored
+    teacher_ids = {teacher_id: teacher_id for teacher_id in teacher_preferences}
+
+    genes, changed_indices = [], []
+    teacher_loads = {teacher_id: 0 for teacher_id in teacher_preferences}
+    for index, section in enumerate(course_sections):
+        row = rows_by_course.get(section["Course Section ID"])
+        gene = None
+        if row is not None:
+            room = rooms_by_number.get(row["Room"])
+            if "Time Slot ID" in row:
+                time_slot = slots_by_id.get(row["Time Slot ID"])
+            else:
+                time_slot = slots_by_description.get(row["Time Slot"])
+            teacher_id = teacher_ids.get(row["Teacher ID"])
+            if None not in (room, time_slot, teacher_id):
+                gene = (section, room, time_slot, teacher_id)
+
+        if gene is None:
+            changed_indices.append(index)
+        else:
+            teacher_loads[gene[3]] += 1
+            max_sections = teacher_preferences[gene[3]]["Max Sections"]
+            if teacher_loads[gene[3]] > max_sections:
+                changed_indices.append(index)
+        genes.append(gene)
+
+    logging.info(
+        f"Warm start reuses {len(genes) - len(changed_indices)} of "
+        f"{len(genes)} section assignments."
+    )
+    return genes, changed_indices
@@ -0,0 +1,44 @@
+import unittest
+from src.algorithms.adaptive_control import AdaptiveOperatorController
+
+
+class _FakeChromosome:
+    def __init__(self, key):
+        self.key = key
+
+    def genome_key(self):
+        return self.key
+
+
+class TestAdaptiveOperatorController(unittest.TestCase):
+    def setUp(self):
+        self.controller = AdaptiveOperatorController(
+            base_mutation_probability=0.2, max_mutation_probability=0.6
+        )
+
+    def test_probabilities_sum_to_one(self):
+        self.assertAlmostEqual(sum(self.controller.probabilities.values()), 1.0)
+
+    def test_productive_operator_gains_probability(self):
+        for _ in range(20):
+            self.controller.record("slot_move", 1.0)
+            self.controller.record("room_move", 0.0)
+        probabilities = self.controller.probabilities
+        self.assertGreater(probabilities["slot_move"], probabilities["room_move"])
+        self.assertGreaterEqual(
+            probabilities["room_move"], self.controller.min_probability
+        )
+
+    def test_mutation_probability_rises_when_diversity_collapses(self):
+        diverse = [_FakeChromosome(i) for i in range(10)]
+        self.controller.update_diversity(diverse)
+        self.assertEqual(self.controller.mutation_probability, 0.2)
+
+        clones = [_FakeChromosome(0) for _ in range(10)]
+        self.controller.update_diversity(clones)
+        self.assertGreater(self.controller.mutation_probability, 0.2)
+        self.assertLessEqual(self.controller.mutation_probability, 0.6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from src.experiments.benchmark import (
+    append_history,
+    benchmark_record,
+    compare,
+    load_history,
+    run_benchmark,
+)
+
+
+def result_row(**metrics):
+    row = {
+        "data": "Simulated_Data.xlsx",
+        "seed": 0,
+        "population_size": 6,
+        "generations": 2,
+        "wall_time_seconds": 1.0,
+        "evaluations_per_second": 100.0,
+        "peak_memory_mb": 50.0,
+        "final_fitness": 2.0,
+    }
+    row.update(metrics)
+    return row
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_in_process_run_records_metrics(self):
+        results = run_benchmark(
+            [("Simulated_Data.xlsx", 6, 2)], seeds=[0, 1], isolated=False
+        )
+        self.assertEqual([row["seed"] for row in results], [0, 1])
+        for row in results:
+            self.assertGreater(row["wall_time_seconds"], 0)
+            self.assertGreater(row["evaluations_per_second"], 0)
+            self.assertGreater(row["peak_memory_mb"], 0)
+
+    def test_history_is_append_only(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.jsonl")
+            append_history(benchmark_record([result_row()]), path)
+            append_history(benchmark_record([result_row(seed=1)]), path)
+            history = load_history(path)
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[1]["results"][0]["seed"], 1)
+
+    def test_changes_within_tolerance_pass(self):
+        latest = [result_row(wall_time_seconds=1.1, evaluations_per_second=90.0)]
+        self.assertEqual(compare(latest, [result_row()]), [])
+
+    def test_regressions_are_reported(self):
+        latest = [result_row(wall_time_seconds=1.5, final_fitness=1.9)]
+        regressions = compare(latest, [result_row()])
+        self.assertEqual(
+            {r["metric"] for r in regressions}, {"wall_time_seconds", "final_fitness"}
+        )
+
+    def test_tolerances_can_be_overridden(self):
+        latest = [result_row(wall_time_seconds=1.5)]
+        self.assertEqual(
+            compare(latest, [result_row()], {"wall_time_seconds": 0.6}), []
+        )
+
+    def test_cases_missing_from_baseline_are_skipped(self):
+        self.assertEqual(compare([result_row(seed=5)], [result_row()]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
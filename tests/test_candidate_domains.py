@@ -0,0 +1,120 @@
+import unittest
+from src.algorithms.candidate_domains import CandidateDomains
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.algorithms.solver import Budget
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+    population_size,
+)
+
+
+def create_ga(candidate_domains, **options):
+    return GeneticAlgorithm(
+        course_sections,
+        classrooms,
+        time_slots,
+        teacher_preferences,
+        teacher_satisfaction,
+        population_size,
+        omega1=0.3,
+        omega2=0.3,
+        omega3=0.4,
+        candidate_domains=candidate_domains,
+        **options,
+    )
+
+
+class TestCandidateDomains(unittest.TestCase):
+    def setUp(self):
+        self.domains = CandidateDomains(max_rating=4)
+        self.ga = create_ga(self.domains)
+
+    def test_least_preferred_teachers_are_pruned(self):
+        pruned = 0
+        for section in course_sections:
+            teachers = self.domains.teachers(section)
+            pruned += len(teacher_preferences) - len(teachers)
+            for teacher_id in teachers:
+                self.assertLessEqual(
+                    self.ga.section_satisfaction[teacher_id][
+                        section["Course Section ID"]
+                    ],
+                    4,
+                )
+        self.assertGreater(pruned, 0)
+
+    def test_rooms_match_hard_board_preference(self):
+        for teacher_id, preferences in teacher_preferences.items():
+            rooms, _ = self.domains.rooms_and_slots(teacher_id)
+            if preferences["Board Pref"] != 0:
+                for room in rooms:
+                    self.assertEqual(room["Board Type"], preferences["Board Pref"])
+
+    def test_initial_population_stays_within_domains(self):
+        for chromosome in self.ga.population:
+            for section, room, _, teacher_id in chromosome.genes:
+                self.assertIn(teacher_id, self.domains.teachers(section))
+                self.assertIn(room, self.domains.rooms_and_slots(teacher_id)[0])
+
+    def test_evolved_teachers_stay_within_domains(self):
+        self.ga.mutation_probability = 1.0
+        self.ga.run(5)
+        for chromosome in self.ga.population:
+            for section, _, _, teacher_id in chromosome.genes:
+                self.assertIn(teacher_id, self.domains.teachers(section))
+
+    def _assert_genes_within_domains(self, domains, genes):
+        for section, room, time_slot, teacher_id in genes:
+            self.assertIn(teacher_id, domains.teachers(section))
+            rooms, time_slots = domains.rooms_and_slots(teacher_id)
+            self.assertIn(room, rooms)
+            self.assertIn(time_slot, time_slots)
+
+    def test_evolved_genes_stay_within_domains(self):
+        for options in (
+            {},
+            {"adaptive": True},
+            {"feasibility_preserving": True},
+            {"local_search_interval": 1},
+        ):
+            domains = CandidateDomains(hard_preferences=("board", "time"))
+            ga = create_ga(domains, mutation_probability=0.5, **options)
+            ga.run(10)
+            for chromosome in ga.population:
+                self._assert_genes_within_domains(domains, chromosome.genes)
+
+    def test_annealing_moves_stay_within_domains(self):
+        domains = CandidateDomains(hard_preferences=("board", "time"))
+        annealing = SimulatedAnnealing(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            candidate_domains=domains,
+        )
+        result = annealing.solve(Budget(max_evaluations=2000))
+        self._assert_genes_within_domains(domains, result.best.genes)
+
+    def test_empty_domain_falls_back_to_all_teachers(self):
+        domains = CandidateDomains(max_rating=-1)
+        create_ga(domains)
+        self.assertEqual(
+            domains.teachers(course_sections[0]), list(teacher_preferences)
+        )
+
+    def test_unknown_hard_preference_rejected(self):
+        with self.assertRaises(ValueError):
+            CandidateDomains(hard_preferences=("parking",))
+
+
+if __name__ == "__main__":
+    unittest.main()
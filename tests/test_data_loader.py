@@ -1,6 +1,7 @@
 import unittest
 import pandas as pd
-from src.utils.data_loader import DataLoader
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.utils.data_loader import COURSE_PREFERENCE_SATISFACTION, DataLoader
 
 
 class TestDataLoader(unittest.TestCase):
@@ -81,5 +82,70 @@ class TestDataLoader(unittest.TestCase):
         self.assertTrue(all(column in df.columns for column in expected_columns))
 
 
+class TestColumnarInstance(unittest.TestCase):
+    def test_simulated_matches_sheet_loader(self):
+        # The streamed instance must feed the solver the same data as pandas
+        expected = DataLoader("Simulated_Data.xlsx").load_instance()
+        instance = (
+            DataLoader("Simulated_Data.xlsx")
+            .load_columnar_instance()
+            .to_solver_instance()
+        )
+        self.assertEqual(instance["course_sections"], expected["course_sections"])
+        self.assertEqual(instance["time_slots"], expected["time_slots"])
+        self.assertEqual(
+            instance["teacher_preferences"], expected["teacher_preferences"]
+        )
+        for teacher_id, scores in instance["teacher_satisfaction"].items():
+            for key, score in scores.items():
+                self.assertEqual(
+                    score, expected["teacher_satisfaction"][teacher_id][key]
+                )
+
+    def test_real_world_data(self):
+        instance = DataLoader("CPP_Real_World_Data.xlsx").load_columnar_instance()
+        section_count = len(instance.sections["Course Section ID"])
+        teacher_count = len(instance.teachers["Teacher ID"])
+        self.assertEqual(section_count, 48)
+        self.assertEqual(len(instance.classrooms["Room Number"]), 11)
+        self.assertEqual(len(instance.time_slots["Time Slot ID"]), 86)
+        self.assertEqual(instance.satisfaction.shape, (teacher_count, section_count))
+        # Teacher 13 does not teach in spring
+        teacher_index = instance.teachers["Teacher ID"].index(13)
+        self.assertEqual(instance.teachers["Max Sections"][teacher_index], 0)
+        self.assertTrue(set(instance.classrooms["Board Type"]) <= {1, 2})
+
+    def test_real_world_ratings_follow_simulated_direction(self):
+        # Both datasets rate course sections lower-is-better on a 0-5 scale
+        simulated = DataLoader("Simulated_Data.xlsx").load_columnar_instance()
+        real_world = DataLoader("CPP_Real_World_Data.xlsx").load_columnar_instance()
+        for instance in (simulated, real_world):
+            self.assertGreaterEqual(instance.satisfaction.min(), 0)
+            self.assertLessEqual(instance.satisfaction.max(), 5)
+        best, least = (
+            COURSE_PREFERENCE_SATISFACTION[0],
+            COURSE_PREFERENCE_SATISFACTION[2],
+        )
+        self.assertLessEqual(best, simulated.satisfaction.min())
+        self.assertGreaterEqual(least, simulated.satisfaction.max())
+
+    def test_solver_runs_on_real_world_data(self):
+        instance = (
+            DataLoader("CPP_Real_World_Data.xlsx")
+            .load_columnar_instance()
+            .to_solver_instance()
+        )
+        ga = GeneticAlgorithm(
+            **instance, population_size=6, omega1=0.3, omega2=0.3, omega3=0.4
+        )
+        statistics = ga.run(2)
+        self.assertEqual(len(statistics), 2)
+        self.assertEqual(len(ga.population[0].genes), 48)
+
+    def test_unknown_workbook_rejected(self):
+        with self.assertRaises(ValueError):
+            DataLoader("Unknown.xlsx").load_columnar_instance()
+
+
 if __name__ == "__main__":
     unittest.main()
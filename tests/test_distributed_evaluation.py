@@ -0,0 +1,99 @@
+import os
+import time
+import unittest
+from unittest import mock
+import multiprocessing
+from multiprocessing.connection import Client
+from src.algorithms.distributed_evaluation import (
+    AUTHKEY_VARIABLE,
+    DistributedEvaluator,
+    run_worker,
+)
+from tests.test_parallel_evaluation import create_ga
+
+
+def _dying_worker(address, authkey):
+    # Accepts the instance, then exits without answering its first task
+    with Client(address, authkey=authkey) as connection:
+        while True:
+            message = connection.recv()
+            if message[0] == "instance" and message[2] is None:
+                connection.send(False)
+            elif message[0] == "evaluate":
+                os._exit(1)
+
+
+class TestDistributedEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.evaluator = DistributedEvaluator(chunk_size=3, task_timeout=10)
+        self.workers = []
+
+    def tearDown(self):
+        self.evaluator.close()
+        for worker in self.workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    def _start_workers(self, count, target=run_worker):
+        for _ in range(count):
+            worker = multiprocessing.Process(
+                target=target, args=(self.evaluator.address, self.evaluator.authkey)
+            )
+            worker.start()
+            self.workers.append(worker)
+        deadline = time.monotonic() + 10
+        while self.evaluator.worker_count < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.evaluator.worker_count, count)
+
+    def _assert_matches_full_evaluation(self, ga):
+        batch = [c.clone() for c in ga.population]
+        self.evaluator.evaluate(batch)
+        for batch_chromosome, chromosome in zip(batch, ga.population):
+            chromosome.evaluate_fitness()
+            self.assertAlmostEqual(batch_chromosome.fitness, chromosome.fitness)
+            for batch_score, score in zip(
+                batch_chromosome.objectives, chromosome.objectives
+            ):
+                self.assertAlmostEqual(batch_score, score)
+
+    def test_workers_match_full_evaluation(self):
+        self._start_workers(3)
+        ga = create_ga(evaluator=self.evaluator)
+        self._assert_matches_full_evaluation(ga)
+
+    def test_workers_run_generations(self):
+        self._start_workers(2)
+        ga = create_ga(evaluator=self.evaluator)
+        statistics = ga.run(3)
+        self.assertEqual(len(statistics), 3)
+        self._assert_matches_full_evaluation(ga)
+
+    def test_task_of_lost_worker_is_requeued(self):
+        # The only worker dies on its first task, so the coordinator finishes
+        # the batch, including the re-queued task, by itself
+        self._start_workers(1, target=_dying_worker)
+        ga = create_ga(evaluator=self.evaluator)
+        self._assert_matches_full_evaluation(ga)
+        self.assertEqual(self.evaluator.worker_count, 0)
+
+    def test_coordinator_evaluates_without_workers(self):
+        ga = create_ga(evaluator=self.evaluator)
+        self._assert_matches_full_evaluation(ga)
+
+
+class TestAuthkey(unittest.TestCase):
+    def test_public_address_needs_a_secret(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop(AUTHKEY_VARIABLE, None)
+            with self.assertRaises(ValueError):
+                DistributedEvaluator(address=("0.0.0.0", 0))
+
+    def test_loopback_key_is_random(self):
+        with DistributedEvaluator() as first, DistributedEvaluator() as second:
+            self.assertNotEqual(first.authkey, second.authkey)
+
+
+if __name__ == "__main__":
+    unittest.main()
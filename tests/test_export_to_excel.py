@@ -0,0 +1,95 @@
+import os
+import csv
+import json
+import tempfile
+import unittest
+from unittest import mock
+from openpyxl import load_workbook
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.utils import export_to_excel
+from src.utils.export_to_excel import export_top_schedules
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+)
+
+
+class TestExportTopSchedules(unittest.TestCase):
+    def setUp(self):
+        self.ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size=6,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+        )
+        # A clone of the best member must not be exported twice
+        self.ga.population.append(self.ga.population[0].clone())
+        self.schedules = self.ga.best_distinct(3)
+        self.time_slot_details = {
+            slot["Time Slot ID"]: slot["Description"] for slot in time_slots
+        }
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _export(self, file_name):
+        path = os.path.join(self.directory.name, file_name)
+        export_top_schedules(self.schedules, self.time_slot_details, path)
+        return path
+
+    def test_best_distinct(self):
+        keys = [c.genome_key() for c in self.schedules]
+        self.assertEqual(len(set(keys)), 3)
+        fitness = [c.fitness for c in self.schedules]
+        self.assertEqual(fitness, sorted(fitness, reverse=True))
+
+    def test_workbook_has_summary_and_schedule_sheets(self):
+        workbook = load_workbook(self._export("top.xlsx"), read_only=True)
+        self.assertEqual(
+            workbook.sheetnames,
+            ["Top Schedules", "Schedule 1", "Schedule 2", "Schedule 3"],
+        )
+        summary = list(workbook["Top Schedules"].iter_rows(values_only=True))
+        self.assertEqual(summary[0][:2], ("Schedule", "Fitness"))
+        self.assertEqual(len(summary), 4)
+        schedule = list(workbook["Schedule 1"].iter_rows(values_only=True))
+        self.assertEqual(len(schedule), len(course_sections) + 1)
+
+    def test_csv_and_json_outputs(self):
+        with open(self._export("top.csv"), newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 3 * len(course_sections))
+        self.assertIn("Satisfaction (%)", rows[0])
+
+        with open(self._export("top.json")) as f:
+            schedules = json.load(f)
+        self.assertEqual([s["rank"] for s in schedules], [1, 2, 3])
+        self.assertAlmostEqual(
+            schedules[0]["metrics"]["Fitness"], self.schedules[0].fitness
+        )
+
+    def test_several_formats_from_one_pass(self):
+        paths = [
+            os.path.join(self.directory.name, name) for name in ("a.xlsx", "a.json")
+        ]
+        with mock.patch(
+            "src.utils.export_to_excel.schedule_metrics",
+            wraps=export_to_excel.schedule_metrics,
+        ) as metrics:
+            export_top_schedules(self.schedules, self.time_slot_details, paths)
+        self.assertEqual(metrics.call_count, len(self.schedules))
+        for path in paths:
+            self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
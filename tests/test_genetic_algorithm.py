@@ -1,5 +1,7 @@
 import unittest
+from collections import Counter
 from src.algorithms.genetic_algorithm import Chromosome, GeneticAlgorithm
+from src.algorithms.adaptive_control import AdaptiveOperatorController
 from src.utils.data_loader import DataLoader
 
 # Create an instance of DataLoader to load the actual data from Simulated_Data.xlsx
@@ -81,5 +83,379 @@ class TestGeneticAlgorithm(unittest.TestCase):
         self.assertTrue(len(self.ga.population) == population_size)
 
 
+class TestSteadyStateReplacement(unittest.TestCase):
+    def setUp(self):
+        self.ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            replacement="steady_state",
+            steady_state_batch_size=3,
+        )
+
+    def test_population_size_and_order(self):
+        self.ga.run(3)
+        self.assertEqual(len(self.ga.population), population_size)
+        fitnesses = [c.fitness for c in self.ga.population]
+        self.assertEqual(fitnesses, sorted(fitnesses, reverse=True))
+
+    def test_best_fitness_never_decreases(self):
+        best_before = max(c.fitness for c in self.ga.population)
+        self.ga.run(3)
+        self.assertGreaterEqual(self.ga.population[0].fitness, best_before)
+
+    def test_unknown_replacement_rejected(self):
+        with self.assertRaises(ValueError):
+            GeneticAlgorithm(
+                course_sections,
+                classrooms,
+                time_slots,
+                teacher_preferences,
+                teacher_satisfaction,
+                population_size,
+                omega1=0.3,
+                omega2=0.3,
+                omega3=0.4,
+                replacement="island",
+            )
+
+
+class TestAdaptiveGeneticAlgorithm(unittest.TestCase):
+    def setUp(self):
+        self.ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            tournament_size=3,
+            adaptive=True,
+        )
+
+    def test_run_reports_controller_state(self):
+        statistics = self.ga.run(3)
+        self.assertEqual(len(self.ga.population), population_size)
+        self.assertIn("operator_probabilities", statistics[-1])
+        self.assertGreater(statistics[-1]["evaluations"], population_size)
+
+    def test_teacher_swap_preserves_loads(self):
+        chromosome = self.ga.population[0]
+        loads_before = sorted(gene[3] for gene in chromosome.genes)
+        self.ga.mutate(chromosome, "teacher_swap")
+        self.assertEqual(sorted(gene[3] for gene in chromosome.genes), loads_before)
+
+
+class TestGreedySeeding(unittest.TestCase):
+    def setUp(self):
+        self.ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            greedy_seed_fraction=0.5,
+        )
+
+    def _violations(self, chromosome):
+        return sum(
+            chromosome.not_meeting_preferences(gene[3], *gene[:3])
+            for gene in chromosome.genes
+        )
+
+    def test_greedy_chromosomes_are_feasible(self):
+        for chromosome in self.ga.population[: population_size // 2]:
+            self.assertTrue(chromosome.is_valid())
+            slots = {
+                (gene[1]["Room Number"], gene[2]["Time Slot ID"])
+                for gene in chromosome.genes
+            }
+            self.assertEqual(len(slots), len(course_sections))
+            self.assertEqual(
+                [gene[0] for gene in chromosome.genes], list(course_sections)
+            )
+
+    def test_greedy_chromosomes_violate_fewer_preferences(self):
+        half = population_size // 2
+        greedy = sum(self._violations(c) for c in self.ga.population[:half])
+        rest = sum(self._violations(c) for c in self.ga.population[half:])
+        self.assertLess(greedy, rest)
+
+
+class TestRandomInitialization(unittest.TestCase):
+    def _create_ga(self, rooms):
+        return GeneticAlgorithm(
+            course_sections,
+            rooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+        )
+
+    def test_room_and_slot_pairs_are_distinct(self):
+        for chromosome in self._create_ga(classrooms).population:
+            pairs = {
+                (gene[1]["Room Number"], gene[2]["Time Slot ID"])
+                for gene in chromosome.genes
+            }
+            self.assertEqual(len(pairs), len(course_sections))
+
+    def test_too_few_room_and_slot_pairs_rejected(self):
+        rooms_needed = -(-len(course_sections) // len(time_slots))
+        with self.assertRaises(ValueError):
+            self._create_ga(classrooms[: rooms_needed - 1])
+
+
+class TestChromosomeCloning(unittest.TestCase):
+    def setUp(self):
+        self.ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+        )
+
+    def test_clone_shares_genes_without_evaluation(self):
+        original = self.ga.population[0]
+        evaluations = self.ga.evaluations
+        duplicate = original.clone()
+        self.assertIs(duplicate.genes, original.genes)
+        self.assertEqual(duplicate.fitness, original.fitness)
+        self.assertEqual(self.ga.evaluations, evaluations)
+
+    def test_mutating_clone_leaves_original_untouched(self):
+        original = self.ga.population[0]
+        genes_before = list(original.genes)
+        fitness_before = original.fitness
+        duplicate = original.clone()
+        for _ in range(5):
+            self.ga.mutate(duplicate)
+        self.assertIsNot(duplicate.genes, original.genes)
+        self.assertEqual(original.genes, genes_before)
+        self.assertEqual(original.fitness, fitness_before)
+
+    def test_elites_never_regress(self):
+        self.ga.mutation_probability = 1.0
+        statistics = self.ga.run(10)
+        best = [stats["max_fitness"] for stats in statistics]
+        self.assertEqual(best, sorted(best))
+
+
+class TestDiversityTracking(unittest.TestCase):
+    def _create_ga(self, **options):
+        return GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            **options,
+        )
+
+    def test_clones_weighted_in_statistics(self):
+        ga = self._create_ga()
+        expected = ga.compute_statistics()
+        # Cloning every member keeps the averages and halves the unique fraction
+        ga.population = ga.population + [
+            ga._chromosome_from_genes(list(c.genes)) for c in ga.population
+        ]
+        stats = ga.compute_statistics()
+        self.assertAlmostEqual(stats["average_fitness"], expected["average_fitness"])
+        self.assertAlmostEqual(
+            stats["teacher_satisfaction"], expected["teacher_satisfaction"]
+        )
+        self.assertAlmostEqual(
+            stats["unique_fraction"], expected["unique_fraction"] / 2
+        )
+
+    def test_identical_population_has_no_diversity(self):
+        ga = self._create_ga()
+        ga.population = [
+            ga._chromosome_from_genes(list(ga.population[0].genes))
+            for _ in range(population_size)
+        ]
+        stats = ga.compute_statistics()
+        self.assertEqual(stats["unique_fraction"], 1 / population_size)
+        self.assertEqual(stats["mean_hamming_distance"], 0)
+
+    def test_replace_duplicates(self):
+        for strategy in ("random", "mutate"):
+            ga = self._create_ga(duplicate_replacement=strategy)
+            ga.population = [
+                ga._chromosome_from_genes(list(ga.population[0].genes))
+                for _ in range(population_size)
+            ]
+            self.assertEqual(ga.replace_duplicates(), population_size - 1)
+            keys = {c.genome_key() for c in ga.population}
+            self.assertEqual(len(keys), population_size)
+
+    def test_run_reports_diversity(self):
+        ga = self._create_ga(duplicate_replacement="mutate")
+        statistics = ga.run(3)
+        for stats in statistics:
+            self.assertEqual(stats["unique_fraction"], 1)
+            self.assertGreater(stats["mean_hamming_distance"], 0)
+
+    def test_unknown_duplicate_replacement_rejected(self):
+        with self.assertRaises(ValueError):
+            self._create_ga(duplicate_replacement="restart")
+
+
+class TestTeacherReassignment(unittest.TestCase):
+    def _create_ga(self, **options):
+        return GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            **options,
+        )
+
+    def _recount(self, genes):
+        return Counter(gene[3] for gene in genes)
+
+    def test_teacher_move_keeps_load_counters_current(self):
+        ga = self._create_ga()
+        genes = list(ga.population[0].genes)
+        loads = self._recount(genes)
+        for _ in range(50):
+            ga._apply_mutation(genes, "teacher_move", loads)
+        self.assertEqual(+loads, self._recount(genes))
+
+    def test_mutating_clone_recounts_its_own_loads(self):
+        ga = self._create_ga()
+        original = ga.population[0]
+        loads_before = dict(original.teacher_loads())
+        duplicate = original.clone()
+        for _ in range(10):
+            ga.mutate(duplicate, "teacher_move")
+        self.assertEqual(dict(original.teacher_loads()), loads_before)
+        self.assertEqual(
+            +Counter(duplicate.teacher_loads()), self._recount(duplicate.genes)
+        )
+
+    def test_move_feasibility_checks_both_limits(self):
+        ga = self._create_ga()
+        full, spare = ga.teacher_ids[:2]
+        loads = Counter({full: ga.max_sections[full], spare: ga.min_sections[spare]})
+        self.assertFalse(ga.teacher_move_feasible(loads, spare, full))
+        loads[spare] += 1
+        loads[full] -= 1
+        self.assertTrue(ga.teacher_move_feasible(loads, spare, full))
+
+    def test_feasibility_preserving_run_stays_valid(self):
+        ga = self._create_ga(feasibility_preserving=True, mutation_probability=1.0)
+        ga.run(10)
+        for chromosome in ga.population:
+            self.assertTrue(chromosome.is_valid())
+
+
+class TestTimePreferences(unittest.TestCase):
+    morning = {"Description": "TR 10 - 11:15am"}
+    afternoon = {"Description": "MWF 2 - 2:50pm"}
+    evening = {"Description": "MW Evening 7 - 8:15"}
+
+    @staticmethod
+    def preferences(time_pref):
+        return {"Time Pref": time_pref, "Days Pref": 0}
+
+    def test_combined_codes_allow_either_period(self):
+        allowed = {
+            4: (self.morning, self.afternoon),
+            5: (self.afternoon, self.evening),
+            6: (self.morning, self.evening),
+        }
+        for time_pref, time_slots in allowed.items():
+            preferences = self.preferences(time_pref)
+            for time_slot in (self.morning, self.afternoon, self.evening):
+                self.assertEqual(
+                    Chromosome.time_slot_violates_preferences(preferences, time_slot),
+                    time_slot not in time_slots,
+                )
+
+    def test_single_codes_are_unchanged(self):
+        preferences = self.preferences(1)
+        self.assertFalse(
+            Chromosome.time_slot_violates_preferences(preferences, self.morning)
+        )
+        self.assertTrue(
+            Chromosome.time_slot_violates_preferences(preferences, self.afternoon)
+        )
+        self.assertFalse(
+            Chromosome.time_slot_violates_preferences(
+                self.preferences(0), self.afternoon
+            )
+        )
+
+
+class TestIncrementalMutation(unittest.TestCase):
+    def create_ga(self, **options):
+        return GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            **options,
+        )
+
+    def assert_rescore_matches_full_evaluation(self, ga):
+        chromosome = ga.population[0]
+        for operator in AdaptiveOperatorController.MUTATION_OPERATORS * 25:
+            ga.mutate(chromosome, operator)
+            fitness, objectives = chromosome.fitness, chromosome.objectives
+            chromosome.evaluate_fitness()
+            self.assertAlmostEqual(fitness, chromosome.fitness)
+            for term, expected in zip(objectives, chromosome.objectives):
+                self.assertAlmostEqual(term, expected)
+
+    def test_mutation_rescore_matches_full_evaluation(self):
+        self.assert_rescore_matches_full_evaluation(self.create_ga())
+
+    def test_rescore_with_churn_penalty(self):
+        # Without seed genes there is no published schedule to move away from
+        self.assert_rescore_matches_full_evaluation(self.create_ga(churn_penalty=1.0))
+
+        seed_genes = list(self.create_ga().population[0].genes)
+        self.assert_rescore_matches_full_evaluation(
+            self.create_ga(seed_genes=seed_genes, churn_penalty=1.0)
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import subprocess
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importing main must stay cheaper than importing numpy alone, the lightest
+# of the heavy dependencies it defers; both are measured on this machine
+BASELINE_IMPORT = "import numpy"
+TIMING_RUNS = 3
+
+
+def run_python(code):
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout
+
+
+def import_seconds(statement):
+    # Best of several fresh interpreters, to keep scheduling noise out
+    return min(
+        float(
+            run_python(
+                "import time\n"
+                "start = time.perf_counter()\n"
+                f"{statement}\n"
+                "print(time.perf_counter() - start)"
+            )
+        )
+        for _ in range(TIMING_RUNS)
+    )
+
+
+def imported_modules(statement):
+    output = run_python(f"import sys\n{statement}\nprint('\\n'.join(sys.modules))")
+    return {name.split(".")[0] for name in output.split()}
+
+
+class TestImportTime(unittest.TestCase):
+    def test_main_does_not_import_plotting(self):
+        self.assertNotIn("matplotlib", imported_modules("import main"))
+
+    def test_solvers_do_not_import_dataframes(self):
+        modules = imported_modules(
+            "import src.algorithms.nsga2, src.algorithms.simulated_annealing"
+        )
+        for heavy_module in ("pandas", "numpy", "openpyxl", "matplotlib"):
+            self.assertNotIn(heavy_module, modules)
+
+    def test_main_does_not_import_data_stack(self):
+        # Data is loaded and exported only once main() runs
+        modules = imported_modules("import main")
+        for heavy_module in ("pandas", "numpy", "openpyxl"):
+            self.assertNotIn(heavy_module, modules)
+
+    def test_main_import_within_budget(self):
+        self.assertLess(import_seconds("import main"), import_seconds(BASELINE_IMPORT))
+
+
+if __name__ == "__main__":
+    unittest.main()
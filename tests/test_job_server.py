@@ -0,0 +1,97 @@
+import os
+import json
+import asyncio
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from src.server.job_server import JobServer, parse_job_parameters
+
+
+class TestParseJobParameters(unittest.TestCase):
+    def test_defaults_and_types(self):
+        parameters = parse_job_parameters({"generations": "3", "omega1": 1})
+        self.assertEqual(parameters["generations"], 3)
+        self.assertEqual(parameters["omega1"], 1.0)
+        self.assertEqual(parameters["dataset"], "Simulated_Data.xlsx")
+
+    def test_rejects_paths_and_unknown_parameters(self):
+        with self.assertRaises(ValueError):
+            parse_job_parameters({"dataset": "../secret.xlsx"})
+        with self.assertRaises(ValueError):
+            parse_job_parameters({"mutation": 1})
+
+    def test_rejects_null_for_required_parameters(self):
+        with self.assertRaises(ValueError):
+            parse_job_parameters({"omega1": None})
+        self.assertIsNone(parse_job_parameters({"seed": None})["seed"])
+
+
+class TestJobServer(unittest.TestCase):
+    def setUp(self):
+        self.output_root = tempfile.TemporaryDirectory()
+        self.server = JobServer(
+            port=0, max_workers=1, max_pending=2, output_root=self.output_root.name
+        )
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(), self.loop).result(30)
+        self.base_url = f"http://127.0.0.1:{self.server.port}"
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result(30)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+        self.output_root.cleanup()
+
+    def _request(self, path, payload=None):
+        data = None if payload is None else json.dumps(payload).encode()
+        with urllib.request.urlopen(self.base_url + path, data, timeout=60) as r:
+            return r.status, r.headers.get("Content-Type"), r.read()
+
+    def test_submit_stream_and_fetch_results(self):
+        status, _, body = self._request(
+            "/jobs", {"population_size": 8, "generations": 3, "seed": 1}
+        )
+        self.assertEqual(status, 202)
+        job_id = json.loads(body)["id"]
+
+        _, content_type, stream = self._request(f"/jobs/{job_id}/events")
+        self.assertEqual(content_type, "text/event-stream")
+        events = [
+            block.split("\n")
+            for block in stream.decode().strip().split("\n\n")
+            if block
+        ]
+        progress = [json.loads(e[1][len("data: ") :]) for e in events[:-1]]
+        self.assertEqual([p["generation"] for p in progress], [1, 2, 3])
+        self.assertEqual(events[-1][0], "event: completed")
+
+        _, _, body = self._request(f"/jobs/{job_id}/schedule")
+        self.assertEqual(len(json.loads(body)["schedule"]), 29)
+        _, _, body = self._request(f"/jobs/{job_id}/statistics")
+        self.assertEqual(len(json.loads(body)), 3)
+        _, content_type, body = self._request(f"/jobs/{job_id}/schedule.xlsx")
+        self.assertTrue(body.startswith(b"PK"))
+
+        os.remove(
+            os.path.join(self.server.jobs[job_id].output_dir, "final_schedule.xlsx")
+        )
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._request(f"/jobs/{job_id}/schedule.xlsx")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_unknown_job_and_bad_request(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._request("/jobs/missing")
+        self.assertEqual(context.exception.code, 404)
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._request("/jobs", {"mode": "random"})
+        self.assertEqual(context.exception.code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import random
+import unittest
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.local_search import IncrementalFitness, LocalSearch
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+)
+
+
+class TestLocalSearch(unittest.TestCase):
+    def setUp(self):
+        self.ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size=4,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+        )
+        self.local_search = LocalSearch(self.ga, max_iterations=20)
+
+    def test_incremental_fitness_matches_full_evaluation(self):
+        chromosome = self.ga.population[0]
+        state = IncrementalFitness(self.ga, chromosome.genes)
+        self.assertAlmostEqual(state.fitness(), chromosome.fitness)
+
+        for _ in range(50):
+            index, _, new_gene = self.local_search.random_move(state.genes)
+            predicted = state.fitness_after(index, new_gene)
+            state.apply(index, new_gene)
+            chromosome.genes = list(state.genes)
+            chromosome.evaluate_fitness()
+            self.assertAlmostEqual(predicted, chromosome.fitness)
+
+    def test_incremental_fitness_tracks_churn(self):
+        self.ga.reference_keys = self.ga.population[1].genome_key()
+        self.ga.churn_penalty = 2.0
+        chromosome = self.ga.population[0]
+        chromosome.evaluate_fitness()
+        state = IncrementalFitness(self.ga, chromosome.genes)
+        self.assertAlmostEqual(state.fitness(), chromosome.fitness)
+
+        for _ in range(30):
+            index, _, new_gene = self.local_search.random_move(state.genes)
+            predicted = state.fitness_after(index, new_gene)
+            state.apply(index, new_gene)
+            chromosome.genes = list(state.genes)
+            chromosome.evaluate_fitness()
+            self.assertAlmostEqual(predicted, chromosome.fitness)
+
+    def test_refine_never_worsens_fitness(self):
+        chromosome = self.ga.population[0]
+        before = chromosome.fitness
+        gain = self.local_search.refine(chromosome)
+        self.assertGreaterEqual(gain, 0)
+        self.assertGreaterEqual(chromosome.fitness, before)
+
+    def test_hill_climbing_mode(self):
+        hill_climber = LocalSearch(self.ga, tabu_tenure=0)
+        chromosome = self.ga.population[1]
+        before = chromosome.fitness
+        hill_climber.refine(chromosome)
+        self.assertGreaterEqual(chromosome.fitness, before)
+
+    def test_ga_with_memetic_refinement(self):
+        random.seed(0)
+        ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size=10,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            local_search_interval=1,
+            local_search_top_k=2,
+        )
+        ga.run(2)
+        self.assertEqual(len(ga.population), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
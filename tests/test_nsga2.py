@@ -0,0 +1,117 @@
+import unittest
+from src.algorithms.nsga2 import (
+    NSGA2,
+    crowding_distance,
+    dominates,
+    fast_non_dominated_sort,
+    pareto_objectives,
+)
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+)
+
+
+class TestNonDominatedSorting(unittest.TestCase):
+    def test_dominates(self):
+        self.assertTrue(dominates((1, 2, 3), (1, 2, 2)))
+        self.assertFalse(dominates((1, 2, 3), (1, 2, 3)))
+        self.assertFalse(dominates((2, 1, 3), (1, 2, 3)))
+
+    def test_fronts(self):
+        objectives = [(3, 1, 1), (1, 3, 1), (1, 1, 1), (0, 0, 0), (2, 2, 1)]
+        fronts = fast_non_dominated_sort(objectives)
+        self.assertEqual(sorted(fronts[0]), [0, 1, 4])
+        self.assertEqual(fronts[1], [2])
+        self.assertEqual(fronts[2], [3])
+
+    def test_crowding_distance_boundaries_are_infinite(self):
+        objectives = [(0, 4), (1, 3), (2, 2), (4, 0)]
+        distances = crowding_distance(objectives, [0, 1, 2, 3])
+        self.assertEqual(distances[0], float("inf"))
+        self.assertEqual(distances[3], float("inf"))
+        self.assertGreater(distances[1], 0)
+
+
+class TestNSGA2(unittest.TestCase):
+    def setUp(self):
+        self.ga = NSGA2(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size=12,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+        )
+
+    def test_pareto_front_is_non_dominated(self):
+        self.ga.run(3)
+        self.assertEqual(len(self.ga.population), 12)
+        front = self.ga.pareto_front()
+        self.assertTrue(front)
+        for chromosome in front:
+            self.assertFalse(
+                any(
+                    dominates(pareto_objectives(other), pareto_objectives(chromosome))
+                    for other in self.ga.population
+                )
+            )
+
+    def test_better_rated_schedule_dominates(self):
+        # Swapping two sections' teachers keeps day balance and loads, so a
+        # swap that lowers the summed rating gives a strictly better schedule
+        schedule = self.ga.population[0]
+        genes = list(schedule.genes)
+        satisfaction = self.ga.section_satisfaction
+
+        def rating(teacher_id, gene):
+            return satisfaction[teacher_id][gene[0]["Course Section ID"]]
+
+        first, second = next(
+            (i, j)
+            for i in range(len(genes))
+            for j in range(i + 1, len(genes))
+            if rating(genes[j][3], genes[i]) + rating(genes[i][3], genes[j])
+            < rating(genes[i][3], genes[i]) + rating(genes[j][3], genes[j])
+        )
+        gene1, gene2 = genes[first], genes[second]
+        genes[first] = (*gene1[:3], gene2[3])
+        genes[second] = (*gene2[:3], gene1[3])
+        better = self.ga._chromosome_from_genes(genes)
+
+        self.assertTrue(
+            dominates(pareto_objectives(better), pareto_objectives(schedule))
+        )
+        self.assertFalse(
+            dominates(pareto_objectives(schedule), pareto_objectives(better))
+        )
+
+    def test_best_weighted_schedule_first(self):
+        self.ga.run(2)
+        best = max(c.fitness for c in self.ga.population)
+        self.assertEqual(self.ga.population[0].fitness, best)
+
+    def test_steady_state_rejected(self):
+        with self.assertRaises(ValueError):
+            NSGA2(
+                course_sections,
+                classrooms,
+                time_slots,
+                teacher_preferences,
+                teacher_satisfaction,
+                population_size=4,
+                omega1=0.3,
+                omega2=0.3,
+                omega3=0.4,
+                replacement="steady_state",
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.parallel_evaluation import (
+    ParallelEvaluator,
+    SharedArrays,
+    compile_instance,
+    evaluate_genomes,
+)
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+)
+
+
+def create_ga(**options):
+    return GeneticAlgorithm(
+        course_sections,
+        classrooms,
+        time_slots,
+        teacher_preferences,
+        teacher_satisfaction,
+        population_size=8,
+        omega1=0.3,
+        omega2=0.3,
+        omega3=0.4,
+        **options,
+    )
+
+
+class TestSharedArrays(unittest.TestCase):
+    def test_attach_sees_owner_data(self):
+        owner = SharedArrays.create({"values": np.arange(6).reshape(2, 3)})
+        try:
+            attached = SharedArrays.attach(owner.handle)
+            np.testing.assert_array_equal(
+                attached.arrays["values"], np.arange(6).reshape(2, 3)
+            )
+            owner.arrays["values"][0, 0] = 42
+            self.assertEqual(attached.arrays["values"][0, 0], 42)
+            attached.close()
+        finally:
+            owner.close()
+
+
+class TestBatchEvaluation(unittest.TestCase):
+    def _assert_matches_full_evaluation(self, ga, evaluator):
+        batch = [c.clone() for c in ga.population]
+        evaluator.evaluate(batch)
+        for batch_chromosome, chromosome in zip(batch, ga.population):
+            chromosome.evaluate_fitness()
+            self.assertAlmostEqual(batch_chromosome.fitness, chromosome.fitness)
+            for batch_score, score in zip(
+                batch_chromosome.objectives, chromosome.objectives
+            ):
+                self.assertAlmostEqual(batch_score, score)
+
+    def test_kernel_matches_full_evaluation(self):
+        with ParallelEvaluator(max_workers=1) as evaluator:
+            ga = create_ga(evaluator=evaluator)
+            self._assert_matches_full_evaluation(ga, evaluator)
+
+    def test_kernel_tracks_churn(self):
+        seed_genes = create_ga().population[0].genes
+        with ParallelEvaluator(max_workers=1) as evaluator:
+            ga = create_ga(
+                evaluator=evaluator, seed_genes=seed_genes, churn_penalty=2.0
+            )
+            for chromosome in ga.population:
+                ga.mutate(chromosome)
+            self._assert_matches_full_evaluation(ga, evaluator)
+
+    def test_compiled_weights(self):
+        instance = compile_instance(create_ga())
+        fitness, objectives = evaluate_genomes(
+            instance, np.zeros((3, len(course_sections), 3), dtype=np.int32)
+        )
+        self.assertEqual(fitness.shape, (3,))
+        self.assertEqual(objectives.shape, (3, 3))
+
+    def test_worker_processes_run_generations(self):
+        with ParallelEvaluator(max_workers=2) as evaluator:
+            ga = create_ga(evaluator=evaluator)
+            statistics = ga.run(3)
+            self.assertEqual(len(statistics), 3)
+            self._assert_matches_full_evaluation(ga, evaluator)
+
+    def test_incompatible_options_rejected(self):
+        with self.assertRaises(ValueError):
+            create_ga(evaluator=ParallelEvaluator(max_workers=1), adaptive=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
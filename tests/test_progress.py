@@ -0,0 +1,74 @@
+import io
+import unittest
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.algorithms.solver import Budget
+from src.utils.progress import ProgressEvent, ProgressTracker, TerminalProgressReporter
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+)
+
+instance = {
+    "course_sections": course_sections,
+    "classrooms": classrooms,
+    "time_slots": time_slots,
+    "teacher_preferences": teacher_preferences,
+    "teacher_satisfaction": teacher_satisfaction,
+}
+
+
+class TestProgressTracker(unittest.TestCase):
+    def test_eta_uses_first_limit_reached(self):
+        events = []
+        tracker = ProgressTracker([events.append], generations=10, time_limit=0)
+        tracker.report(5, 2.0, 1.5, 100)
+        self.assertEqual(events[0].eta_seconds, 0)
+
+    def test_unbounded_run_has_no_eta(self):
+        events = []
+        tracker = ProgressTracker([events.append], max_evaluations=None)
+        tracker.report(1, 2.0, 1.5, 100)
+        self.assertIsNone(events[0].eta_seconds)
+
+
+class TestSolverObservers(unittest.TestCase):
+    def test_genetic_algorithm_reports_every_generation(self):
+        events = []
+        ga = GeneticAlgorithm(
+            **instance, population_size=6, omega1=0.3, omega2=0.3, omega3=0.4
+        )
+        statistics = ga.solve(
+            Budget(generations=4), observers=[events.append]
+        ).statistics
+        self.assertEqual([event.generation for event in events], [1, 2, 3, 4])
+        self.assertEqual(events[-1].best_fitness, statistics[-1]["max_fitness"])
+        self.assertEqual(events[-1].generations, 4)
+        self.assertGreater(events[-1].evaluations_per_second, 0)
+
+    def test_simulated_annealing_reports_temperature_levels(self):
+        events = []
+        solver = SimulatedAnnealing(
+            **instance, omega1=0.3, omega2=0.3, omega3=0.4, moves_per_temperature=50
+        )
+        solver.solve(Budget(max_evaluations=500), observers=[events.append])
+        self.assertEqual(len(events), 10)
+        self.assertEqual(events[-1].eta_seconds, 0)
+
+
+class TestTerminalProgressReporter(unittest.TestCase):
+    def test_writes_are_throttled(self):
+        stream = io.StringIO()
+        reporter = TerminalProgressReporter(stream, min_interval=60)
+        event = ProgressEvent(3, 10, 2.5, 2.0, 300, 1.0, 300.0, 2.3)
+        reporter(event)
+        reporter(event)
+        self.assertEqual(stream.getvalue().count("Generation 3/10"), 1)
+        self.assertIn("ETA 0:00:02", stream.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.utils.export_to_excel import export_checkpoint, export_to_excel
+from src.utils.schedule_loader import build_warm_start_genes, read_schedule_rows
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+)
+
+time_slot_details = {slot["Time Slot ID"]: slot["Description"] for slot in time_slots}
+
+
+class TestWarmStart(unittest.TestCase):
+    def setUp(self):
+        self.ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size=2,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+        )
+        self.published = self.ga.population[0]
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _build(self, rows):
+        return build_warm_start_genes(
+            rows, course_sections, classrooms, time_slots, teacher_preferences
+        )
+
+    def test_excel_and_checkpoint_round_trip(self):
+        excel_path = os.path.join(self.directory.name, "final_schedule.xlsx")
+        checkpoint_path = os.path.join(self.directory.name, "final_schedule.json")
+        export_to_excel(self.published, time_slot_details, excel_path)
+        export_checkpoint(self.published, checkpoint_path)
+
+        for path in (excel_path, checkpoint_path):
+            genes, changed = self._build(read_schedule_rows(path))
+            self.assertEqual(changed, [])
+            self.assertEqual(
+                [gene[1:] for gene in genes],
+                [gene[1:] for gene in self.published.genes],
+            )
+
+    def test_new_section_is_focused_and_others_kept(self):
+        rows = [
+            {
+                "Teacher ID": gene[3],
+                "Course ID": gene[0]["Course Section ID"],
+                "Time Slot ID": gene[2]["Time Slot ID"],
+                "Room": gene[1]["Room Number"],
+            }
+            for gene in self.published.genes[1:]
+        ]
+        genes, changed = self._build(rows)
+        self.assertEqual(changed, [0])
+        self.assertIsNone(genes[0])
+
+        ga = GeneticAlgorithm(
+            course_sections,
+            classrooms,
+            time_slots,
+            teacher_preferences,
+            teacher_satisfaction,
+            population_size=6,
+            omega1=0.3,
+            omega2=0.3,
+            omega3=0.4,
+            seed_genes=genes,
+            focus_indices=changed,
+            churn_penalty=1.0,
+        )
+        seeded = ga.population[0]
+        self.assertIsNotNone(seeded.genes[0])
+        self.assertEqual(seeded.churn(), 0)
+        self.assertEqual(seeded.genes[1:], self.published.genes[1:])
+
+        ga.run(2)
+        self.assertEqual(len(ga.population), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
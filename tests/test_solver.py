@@ -0,0 +1,77 @@
+import unittest
+from src.algorithms.genetic_algorithm import GeneticAlgorithm
+from src.algorithms.simulated_annealing import SimulatedAnnealing
+from src.algorithms.solver import Budget, Solver, SolverResult
+from src.experiments.solver_comparison import compare_solvers
+from tests.test_genetic_algorithm import (
+    course_sections,
+    classrooms,
+    time_slots,
+    teacher_preferences,
+    teacher_satisfaction,
+)
+
+instance = {
+    "course_sections": course_sections,
+    "classrooms": classrooms,
+    "time_slots": time_slots,
+    "teacher_preferences": teacher_preferences,
+    "teacher_satisfaction": teacher_satisfaction,
+}
+
+
+class TestBudget(unittest.TestCase):
+    def test_requires_a_limit(self):
+        with self.assertRaises(ValueError):
+            Budget()
+
+
+class TestSolverInterface(unittest.TestCase):
+    def test_incomplete_solver_cannot_be_constructed(self):
+        class Incomplete(Solver):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class TestGeneticAlgorithmSolver(unittest.TestCase):
+    def test_solve_stops_at_evaluation_budget(self):
+        ga = GeneticAlgorithm(
+            **instance, population_size=8, omega1=0.3, omega2=0.3, omega3=0.4
+        )
+        result = ga.solve(Budget(max_evaluations=30))
+        self.assertIsInstance(result, SolverResult)
+        self.assertIs(result.best, ga.population[0])
+        # The budget is checked between generations
+        self.assertLess(result.evaluations, 30 + 8)
+        self.assertTrue(result.statistics)
+
+
+class TestSimulatedAnnealing(unittest.TestCase):
+    def test_solve_improves_and_stays_valid(self):
+        sa = SimulatedAnnealing(**instance, omega1=0.3, omega2=0.3, omega3=0.4)
+        start_fitness = sa.model.population[0].fitness
+        result = sa.solve(Budget(max_evaluations=3000))
+        self.assertEqual(result.evaluations, 3000)
+        self.assertGreaterEqual(result.best.fitness, start_fitness)
+        self.assertTrue(result.best.is_valid())
+        self.assertEqual(len(result.statistics), 30)
+
+    def test_requires_evaluation_or_time_budget(self):
+        sa = SimulatedAnnealing(**instance, omega1=0.3, omega2=0.3, omega3=0.4)
+        with self.assertRaises(ValueError):
+            sa.solve(Budget(generations=10))
+
+
+class TestSolverComparison(unittest.TestCase):
+    def test_rows_for_each_solver(self):
+        results = compare_solvers(instance, (0.3, 0.3, 0.4), [0], 0.05, 6)
+        self.assertEqual(
+            [row["solver"] for row in results],
+            [GeneticAlgorithm.name, SimulatedAnnealing.name],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
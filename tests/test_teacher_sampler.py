@@ -0,0 +1,34 @@
+import random
+import unittest
+from collections import Counter
+from src.algorithms.teacher_sampler import TeacherSampler
+
+
+class TestTeacherSampler(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.sampler = TeacherSampler(["A", "B", "C"], [1, 2, 7])
+        self.max_sections = {"A": 2, "B": 2, "C": 2}
+
+    def test_draws_follow_weights(self):
+        loads = {"A": 0, "B": 0, "C": 0}
+        counts = Counter(
+            self.sampler.sample(loads, self.max_sections) for _ in range(5000)
+        )
+        self.assertGreater(counts["C"], counts["B"])
+        self.assertGreater(counts["B"], counts["A"])
+        self.assertAlmostEqual(counts["C"] / 5000, 0.7, delta=0.05)
+
+    def test_saturated_teachers_skipped(self):
+        loads = {"A": 0, "B": 2, "C": 2}
+        for _ in range(100):
+            self.assertEqual(self.sampler.sample(loads, self.max_sections), "A")
+
+    def test_all_saturated_falls_back_to_any_teacher(self):
+        loads = {"A": 2, "B": 2, "C": 2}
+        teacher_id = self.sampler.sample(loads, self.max_sections)
+        self.assertIn(teacher_id, ("A", "B", "C"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from src.experiments.tuning import eliminate, race, sample_configurations
+from src.utils.data_loader import DataLoader
+
+instance = DataLoader("Simulated_Data.xlsx").load_instance()
+
+
+class TestTuning(unittest.TestCase):
+    def test_sampled_configurations_are_distinct(self):
+        space = {"population_size": [10, 20], "tournament_size": [2, 3, 5]}
+        configurations = sample_configurations(space, 10)
+        self.assertEqual(len(configurations), 6)
+        self.assertEqual(len({tuple(sorted(c.items())) for c in configurations}), 6)
+
+    def test_consistently_worse_candidates_are_eliminated(self):
+        # The two good candidates alternate; the bad ones always come last
+        scores = [
+            [0.9 if seed % 2 else 0.8 for seed in range(10)],
+            [0.8 if seed % 2 else 0.9 for seed in range(10)],
+            [0.2] * 10,
+            [0.1] * 10,
+        ]
+        self.assertEqual(eliminate(scores), [0, 1])
+
+    def test_indistinguishable_candidates_survive(self):
+        scores = [[0.5, 0.6, 0.5], [0.6, 0.5, 0.6]]
+        self.assertEqual(eliminate(scores), [0, 1])
+
+    def test_race_returns_a_candidate(self):
+        configurations = [
+            {"population_size": 6, "tournament_size": 2},
+            {"population_size": 6, "tournament_size": 3, "deviation_penalty": 10},
+        ]
+        best, rows = race(
+            instance, configurations, [0, 1, 2], generations=2, max_workers=1
+        )
+        self.assertIn(best, configurations)
+        self.assertEqual({row["seed"] for row in rows}, {0, 1, 2})
+        self.assertEqual(len(rows), 6)
+
+    def test_race_needs_a_run_limit(self):
+        with self.assertRaises(ValueError):
+            race(instance, [{"population_size": 6}], [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
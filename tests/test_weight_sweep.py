@@ -0,0 +1,34 @@
+import unittest
+from src.experiments.weight_sweep import run_weight_sweep, weight_grid
+from src.utils.data_loader import DataLoader
+
+instance = DataLoader("Simulated_Data.xlsx").load_instance()
+
+
+class TestWeightSweep(unittest.TestCase):
+    def test_weight_grid_sums_to_one(self):
+        grid = weight_grid(0.25)
+        self.assertEqual(len(grid), 15)
+        for omegas in grid:
+            self.assertAlmostEqual(sum(omegas), 1.0)
+
+    def test_sweep_in_process_is_reproducible(self):
+        weights = [(0.3, 0.3, 0.4)]
+        first = run_weight_sweep(instance, weights, [7], 6, 2, max_workers=1)
+        second = run_weight_sweep(instance, weights, [7], 6, 2, max_workers=1)
+        self.assertEqual(first[0]["best_fitness"], second[0]["best_fitness"])
+
+    def test_sweep_with_process_pool(self):
+        weights = [(0.3, 0.3, 0.4), (1.0, 0.0, 0.0)]
+        results = run_weight_sweep(instance, weights, [0, 1], 6, 2, max_workers=2)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(
+            [(r["omega1"], r["seed"]) for r in results],
+            [(0.3, 0), (0.3, 1), (1.0, 0), (1.0, 1)],
+        )
+        for row in results:
+            self.assertGreater(row["runtime_seconds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()